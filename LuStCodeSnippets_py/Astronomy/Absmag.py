@@ -1,19 +1,63 @@
 
 #%%imports
 # import astropy as ap
-from astropy.cosmology import Cosmology
-import csv
+import multiprocessing as mp
+from multiprocessing import shared_memory
 import numpy as np
-from typing import Union
+import os
+from typing import TYPE_CHECKING, Tuple, Union
+
+from .ConfStats import ConfStatsLUT, get_confstats
+from .Distmod import DistmodGrid, cosmo_key, get_distmod_grid
+
+if TYPE_CHECKING:
+    from astropy.cosmology import Cosmology     #annotations only (deferred since astropy is slow to import)
 
 #%%definitions
-@np.vectorize
+def _get_distmod_grid(
+    cosmo:"Cosmology",
+    distmod_grid:Union[bool,DistmodGrid]=True,
+    ) -> DistmodGrid:
+    """
+        - resolves `distmod_grid` to a `DistmodGrid` tabulated for `cosmo`
+    """
+    if distmod_grid is True:
+        distmod_grid = get_distmod_grid(cosmo)
+    elif distmod_grid.key != cosmo_key(cosmo):
+        raise ValueError(f"`distmod_grid` was tabulated for {distmod_grid.cosmo} but `cosmo` is {cosmo}")
+    return distmod_grid
+
+def _distmod(
+    z:np.ndarray,
+    cosmo:"Cosmology",
+    distmod_grid:Union[bool,DistmodGrid]=False,
+    ) -> np.ndarray:
+    """
+        - evaluates the distance modulus either exactly or via `distmod_grid`
+    """
+    if distmod_grid is False or distmod_grid is None:
+        return cosmo.distmod(z).value
+    return _get_distmod_grid(cosmo, distmod_grid).distmod(z)
+
+def _confstats(
+    pb:np.ndarray, z:np.ndarray,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    ) -> Tuple[np.ndarray,np.ndarray]:
+    """
+        - looks up `std` and `offset` in `fn_confstats` if passed
+        - returns arrays of `np.nan` otherwise
+    """
+    if isinstance(fn_confstats, (str, ConfStatsLUT)):
+        return get_confstats(fn_confstats).lookup(pb, z)
+    return np.full(z.shape, np.nan), np.full(z.shape, np.nan)
+
 def absmag(
-    m:float, z:float,
-    cosmo:Cosmology,
-    pb:str=None,
-    fn_confstats:Union[str,bool]=False,
-    ):
+    m:Union[float,np.ndarray], z:Union[float,np.ndarray],
+    cosmo:"Cosmology",
+    pb:Union[str,np.ndarray]=None,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    distmod_grid:Union[bool,DistmodGrid]=False,
+    ) -> Tuple[Union[float,np.ndarray],Union[float,np.ndarray],Union[float,np.ndarray]]:
     """
         - function to convert apparent magnitudes to absolute magnitudes given some redshift
         - considers cosmology to do so
@@ -21,23 +65,26 @@ def absmag(
         Parameters
         ----------
             - `m`
-                - `float`
-                - apparent magnitude
+                - `float`, `np.ndarray`
+                - apparent magnitude(s)
+                - has to be broadcastable against `z` and `pb`
             - `z`
-                - `float`
-                - redshift
+                - `float`, `np.ndarray`
+                - redshift(s)
+                - has to be broadcastable against `m` and `pb`
             - `cosmo`
                 - `astropy.cosmology.Cosmology`
                 - cosmological model to consider for the conversion of `z` to a luminosity distance
             - `pb`
-                - str, optional
-                - passband to use for the confidence estimate
+                - `str`, `np.ndarray`, optional
+                - passband(s) to use for the confidence estimate
+                - has to be broadcastable against `m` and `z`
                 - has to be present in the `"passband"` column of `fn_confstats`
                     - will return `np.nan` for `offset` and `std`
                 - the default is `None`
                     - no confidence estimate made
             - `fn_confstats`
-                - `str`, `bool`, optional
+                - `str`, `bool`, `ConfStatsLUT`, optional
                 - path to a lookup table containing confidence estimates for
                     - specific mission
                     - specific astrophysical object
@@ -50,56 +97,562 @@ def absmag(
                         - specifies standard deviation (dispersion) in some (`"passband", "z_bin"`) combination
                     - `"offset"`
                         - specifies offset from literature value in some (`"passband", "z_bin"`) combination                   
+                - can also be
+                    - a `.npz` table compiled via `ConfStats.compile_confstats()`
+                    - an already parsed `ConfStatsLUT`
+                - the default is `False`
+                    - no confidence estimate made
+            - `distmod_grid`
+                - `bool`, `DistmodGrid`, optional
+                - whether to interpolate the distance modulus from a precomputed grid instead of evaluating `cosmo.distmod()`
+                - if `True`
+                    - will use the cached default grid for `cosmo` (see `Distmod.get_distmod_grid()`)
+                - if a `DistmodGrid`
+                    - will use the passed grid
+                    - has to be tabulated for `cosmo`
+                - introduces an error of at most `DistmodGrid.max_error`
+                - the default is `False`
+                    - exact evaluation
 
         Raises
         ------
+            - `ValueError`
+                - if `distmod_grid` was tabulated for a cosmology different from `cosmo`
 
         Returns
         -------
             - `M`
-                - `float`
-                - computed absolute magnitude
+                - `float`, `np.ndarray`
+                - computed absolute magnitude(s)
+                - `float` if all inputs are scalars
+                - `np.ndarray` of the broadcast shape of `m`, `z`, `pb` otherwise
             - `std`
-                - `float`
+                - `float`, `np.ndarray`
                 - `"std"`/dispersion of `M` at given `z`
                 - if available
+                - same shape as `M`
             - `offset`
-                - `float`
+                - `float`, `np.ndarray`
                 - offset  of `M` at given `z` from literature value
                 - if available
+                - same shape as `M`
 
         Dependencies
         ------------
             - `astropy`
-            - `csv`
             - `numpy`
             - `typing`
 
         Comments
         --------
+            - operates on whole arrays
+                - `cosmo.distmod()` gets called once for all of `z`
+                - `fn_confstats` gets parsed once and cached by path and modification time (see `ConfStats.get_confstats()`)
+            - the redshift bin is the one with `"z_bin"` closest to `z`
+                - ties are resolved towards the lower `"z_bin"`
 
     """
 
     #init
-    offset = np.nan
-    std = np.nan
+    m, z, pb = np.broadcast_arrays(
+        np.asarray(m, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+        np.asarray(pb),
+    )
     
     #get confidence estimates
-    if isinstance(fn_confstats, str):
-        with open(fn_confstats) as f:   #load lookup table
-            pb_errs = [
-                {k: v for k, v in row.items()}
-                for row in csv.DictReader(f, skipinitialspace=True)
-            ]
-        pb_err = [d for d in pb_errs if (d["passband"]==pb)]    #filter for relevant entry in LUT
-        if len(pb_err) > 0: #if passband present in LUT
-            pb_err = min(pb_err, key=lambda d: abs(float(d["z_bin"]) - z)) #get correct redshift bin
-            offset  = float(pb_err["offset"])
-            std      = float(pb_err["std"])
+    std, offset = _confstats(pb, z, fn_confstats)
 
     #compute absolute magnitude by using distance module
-    mu = cosmo.distmod(z).value
+    mu = _distmod(z, cosmo, distmod_grid)
     M = m - mu
 
-    return M, std, offset
+    return M[()], std[()], offset[()]
+
+def appmag(
+    M:Union[float,np.ndarray], z:Union[float,np.ndarray],
+    cosmo:"Cosmology",
+    pb:Union[str,np.ndarray]=None,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    distmod_grid:Union[bool,DistmodGrid]=False,
+    ) -> Tuple[Union[float,np.ndarray],Union[float,np.ndarray],Union[float,np.ndarray]]:
+    """
+        - function to convert absolute magnitudes to apparent magnitudes given some redshift
+        - inverse of `absmag()`
+
+        Parameters
+        ----------
+            - `M`
+                - `float`, `np.ndarray`
+                - absolute magnitude(s)
+                - has to be broadcastable against `z` and `pb`
+            - `z`
+                - `float`, `np.ndarray`
+                - redshift(s)
+                - has to be broadcastable against `M` and `pb`
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to consider for the conversion of `z` to a luminosity distance
+            - `pb`
+                - `str`, `np.ndarray`, optional
+                - passband(s) to use for the confidence estimate
+                - see `absmag()`
+                - the default is `None`
+            - `fn_confstats`
+                - `str`, `bool`, `ConfStatsLUT`, optional
+                - lookup table containing confidence estimates
+                - see `absmag()`
+                - the default is `False`
+            - `distmod_grid`
+                - `bool`, `DistmodGrid`, optional
+                - see `absmag()`
+                - the default is `False`
+
+        Raises
+        ------
+            - `ValueError`
+                - if `distmod_grid` was tabulated for a cosmology different from `cosmo`
+
+        Returns
+        -------
+            - `m`
+                - `float`, `np.ndarray`
+                - computed apparent magnitude(s)
+            - `std`
+                - `float`, `np.ndarray`
+                - `"std"`/dispersion of `M` at given `z`
+            - `offset`
+                - `float`, `np.ndarray`
+                - offset  of `M` at given `z` from literature value
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+            - `typing`
+
+        Comments
+        --------
+    """
+
+    #init
+    M, z, pb = np.broadcast_arrays(
+        np.asarray(M, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+        np.asarray(pb),
+    )
+
+    #get confidence estimates
+    std, offset = _confstats(pb, z, fn_confstats)
+
+    #compute apparent magnitude by using distance module
+    mu = _distmod(z, cosmo, distmod_grid)
+    m = M + mu
+
+    return m[()], std[()], offset[()]
+
+def z_from_distmod(
+    mu:Union[float,np.ndarray],
+    cosmo:"Cosmology",
+    pb:Union[str,np.ndarray]=None,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    distmod_grid:Union[bool,DistmodGrid]=True,
+    ) -> Tuple[Union[float,np.ndarray],Union[float,np.ndarray],Union[float,np.ndarray]]:
+    """
+        - function to convert distance moduli to redshifts
+
+        Parameters
+        ----------
+            - `mu`
+                - `float`, `np.ndarray`
+                - distance modulus/moduli (i.e., `m - M`)
+                - has to be broadcastable against `pb`
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to consider for the conversion
+            - `pb`
+                - `str`, `np.ndarray`, optional
+                - passband(s) to use for the confidence estimate
+                - see `absmag()`
+                - the default is `None`
+            - `fn_confstats`
+                - `str`, `bool`, `ConfStatsLUT`, optional
+                - lookup table containing confidence estimates
+                - see `absmag()`
+                - the default is `False`
+            - `distmod_grid`
+                - `bool`, `DistmodGrid`, optional
+                - table of the distance modulus to invert
+                - if `True`
+                    - will use the cached default grid for `cosmo` (see `Distmod.get_distmod_grid()`)
+                - the default is `True`
+
+        Raises
+        ------
+            - `ValueError`
+                - if `distmod_grid` is `False`
+                - if `distmod_grid` was tabulated for a cosmology different from `cosmo`
+
+        Returns
+        -------
+            - `z`
+                - `float`, `np.ndarray`
+                - redshift(s) corresponding to `mu`
+                - `np.nan` outside of the tabulated range of `distmod_grid`
+            - `std`
+                - `float`, `np.ndarray`
+                - `"std"`/dispersion of `M` at the computed `z`
+            - `offset`
+                - `float`, `np.ndarray`
+                - offset  of `M` at the computed `z` from literature value
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+            - `typing`
+
+        Comments
+        --------
+            - inverts the monotone table of `distmod_grid` via `DistmodGrid.inverse()`
+                - no per-element root finding
+    """
+
+    if distmod_grid is False or distmod_grid is None:
+        raise ValueError("`distmod_grid` has to be `True` or a `DistmodGrid` but is `False`")
+
+    #init
+    mu, pb = np.broadcast_arrays(
+        np.asarray(mu, dtype=np.float64),
+        np.asarray(pb),
+    )
+
+    #invert distance modulus
+    z = _get_distmod_grid(cosmo, distmod_grid).inverse(mu)
+
+    #get confidence estimates
+    std, offset = _confstats(pb, z, fn_confstats)
+
+    return z[()], std[()], offset[()]
+
+
+_WORKER_STATE = {}
+
+def _absmag_parallel_init(
+    shm_name:str, shm_codes_name:str, n:int,
+    cosmo:"Cosmology",
+    pbs_u:np.ndarray,
+    fn_confstats:Union[str,bool,ConfStatsLUT],
+    distmod_grid:Union[bool,DistmodGrid],
+    ):
+    """
+        - initializes a worker of `absmag_parallel()`
+        - attaches the shared buffers and builds cosmology and LUT once per worker
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shm_codes = shared_memory.SharedMemory(name=shm_codes_name)
+    _WORKER_STATE.update(
+        shm=shm, shm_codes=shm_codes,
+        buf=np.ndarray((5, n), dtype=np.float64, buffer=shm.buf),
+        codes=np.ndarray((n,), dtype=np.intp, buffer=shm_codes.buf),
+        cosmo=cosmo,
+        pbs_u=pbs_u,
+        lut=get_confstats(fn_confstats) if isinstance(fn_confstats, (str, ConfStatsLUT)) else None,
+        distmod_grid=distmod_grid,
+    )
+    return
+
+def _absmag_parallel_worker(
+    bounds:Tuple[int,int],
+    ):
+    """
+        - processes the elements `bounds[0]:bounds[1]` of the shared buffers in a worker of `absmag_parallel()`
+    """
+    start, stop = bounds
+    s = _WORKER_STATE
+    m, z, M, std, offset = s["buf"][:,start:stop]
+    codes = s["codes"][start:stop]
+
+    M[:] = m - _distmod(z, s["cosmo"], s["distmod_grid"])
+    if s["lut"] is not None:
+        for k in np.unique(codes):
+            mask = (codes == k)
+            std[mask], offset[mask] = s["lut"].lookup(s["pbs_u"][k], z[mask])
+    return
+
+def absmag_parallel(
+    m:Union[float,np.ndarray], z:Union[float,np.ndarray],
+    cosmo:"Cosmology",
+    pb:Union[str,np.ndarray]=None,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    distmod_grid:Union[bool,DistmodGrid]=False,
+    workers:int=None,
+    chunksize:int=None,
+    ) -> Tuple[Union[float,np.ndarray],Union[float,np.ndarray],Union[float,np.ndarray]]:
+    """
+        - function to compute absolute magnitudes on multiple cores
+        - parallel version of `absmag()`
+
+        Parameters
+        ----------
+            - `m`
+                - `float`, `np.ndarray`
+                - apparent magnitude(s)
+                - see `absmag()`
+            - `z`
+                - `float`, `np.ndarray`
+                - redshift(s)
+                - see `absmag()`
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to consider for the conversion of `z` to a luminosity distance
+            - `pb`
+                - `str`, `np.ndarray`, optional
+                - passband(s) to use for the confidence estimate
+                - see `absmag()`
+                - the default is `None`
+            - `fn_confstats`
+                - `str`, `bool`, `ConfStatsLUT`, optional
+                - lookup table containing confidence estimates
+                - see `absmag()`
+                - if a `str`
+                    - every worker loads (and caches) the table once
+                    - compiled `.npz` tables (see `ConfStats.compile_confstats()`) get memory-mapped, i.e., all workers share the same pages
+                - the default is `False`
+            - `distmod_grid`
+                - `bool`, `DistmodGrid`, optional
+                - see `absmag()`
+                - if `True`
+                    - the grid gets tabulated once and shared with all workers
+                - the default is `False`
+            - `workers`
+                - `int`, optional
+                - number of worker processes
+                - the default is `None`
+                    - will use `os.cpu_count()`
+            - `chunksize`
+                - `int`, optional
+                - number of elements each task processes
+                - the default is `None`
+                    - will split the input into `4*workers` tasks
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `M`
+                - `float`, `np.ndarray`
+                - computed absolute magnitude(s)
+            - `std`
+                - `float`, `np.ndarray`
+                - `"std"`/dispersion of `M` at given `z`
+            - `offset`
+                - `float`, `np.ndarray`
+                - offset  of `M` at given `z` from literature value
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `multiprocessing`
+            - `numpy`
+            - `os`
+            - `typing`
+
+        Comments
+        --------
+            - inputs and outputs live in `multiprocessing.shared_memory` buffers
+                - workers read their slice of the inputs and write `M`, `std`, `offset` directly into the output buffers
+                - no arrays get pickled
+            - passbands get transferred as integer codes into the unique passbands
+            - uses the `"spawn"` start method
+                - call from within an `if __name__ == "__main__":` block in scripts
+            - falls back to `absmag()` for `workers==1`
+    """
+
+    #default parameters
+    workers = os.cpu_count() if workers is None else workers
+    if workers == 1:
+        return absmag(m, z, cosmo, pb, fn_confstats, distmod_grid)
+    if distmod_grid is True:
+        distmod_grid = get_distmod_grid(cosmo)
+
+    m, z, pb = np.broadcast_arrays(
+        np.asarray(m, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+        np.asarray(pb),
+    )
+    shape = m.shape
+    n = m.size
+    chunksize = max(1, -(-n//(4*workers))) if chunksize is None else chunksize
+
+    #encode passbands
+    if pb.strides == (0,)*pb.ndim:
+        pbs_u, codes = np.array([str(pb.flat[0])]), np.zeros(n, dtype=np.intp)
+    else:
+        pbs_u, codes = np.unique(pb.astype(str), return_inverse=True)
+
+    #allocate shared buffers
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 5*n*np.dtype(np.float64).itemsize))
+    shm_codes = shared_memory.SharedMemory(create=True, size=max(1, n*np.dtype(np.intp).itemsize))
+    try:
+        buf = np.ndarray((5, n), dtype=np.float64, buffer=shm.buf)
+        buf[0] = m.ravel()
+        buf[1] = z.ravel()
+        buf[2:] = np.nan
+        np.ndarray((n,), dtype=np.intp, buffer=shm_codes.buf)[:] = codes.ravel()
+
+        #process
+        with mp.get_context("spawn").Pool(
+            workers,
+            initializer=_absmag_parallel_init,
+            initargs=(shm.name, shm_codes.name, n, cosmo, pbs_u, fn_confstats, distmod_grid),
+        ) as pool:
+            pool.map(_absmag_parallel_worker, [(i, min(i+chunksize, n)) for i in range(0, n, chunksize)])
+
+        M, std, offset = (buf[i].reshape(shape).copy() for i in range(2,5))
+    finally:
+        del buf
+        shm.close(); shm.unlink()
+        shm_codes.close(); shm_codes.unlink()
+
+    return M[()], std[()], offset[()]
+
+def absmag_mc(
+    m:Union[float,np.ndarray], z:Union[float,np.ndarray],
+    cosmo:"Cosmology",
+    m_err:Union[float,np.ndarray]=0.0, z_err:Union[float,np.ndarray]=0.0,
+    pb:Union[str,np.ndarray]=None,
+    fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+    distmod_grid:Union[bool,DistmodGrid]=True,
+    nsamples:int=1000,
+    percentiles:Tuple[float]=(16,50,84),
+    correct_offset:bool=False,
+    max_elements:int=2**22,
+    seed:int=None,
+    ) -> np.ndarray:
+    """
+        - function to propagate uncertainties in `m` and `z` to absolute magnitudes via Monte-Carlo sampling
+
+        Parameters
+        ----------
+            - `m`
+                - `float`, `np.ndarray`
+                - apparent magnitude(s)
+                - has to be broadcastable against `z`, `m_err`, `z_err`, `pb`
+            - `z`
+                - `float`, `np.ndarray`
+                - redshift(s)
+                - has to be broadcastable against `m`, `m_err`, `z_err`, `pb`
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to consider for the conversion of `z` to a luminosity distance
+            - `m_err`
+                - `float`, `np.ndarray`, optional
+                - gaussian uncertainty of `m`
+                - the default is `0.0`
+            - `z_err`
+                - `float`, `np.ndarray`, optional
+                - gaussian uncertainty of `z`
+                - the default is `0.0`
+            - `pb`
+                - `str`, `np.ndarray`, optional
+                - passband(s) to use for the confidence estimate
+                - see `absmag()`
+                - the default is `None`
+            - `fn_confstats`
+                - `str`, `bool`, `ConfStatsLUT`, optional
+                - lookup table containing confidence estimates
+                - see `absmag()`
+                - if passed
+                    - `"std"` gets added as additional gaussian scatter to each sample
+                - the default is `False`
+            - `distmod_grid`
+                - `bool`, `DistmodGrid`, optional
+                - see `absmag()`
+                - the default is `True`
+                    - exact evaluation of `nsamples` distance moduli per source is prohibitively slow for large inputs
+            - `nsamples`
+                - `int`, optional
+                - number of samples to draw per source
+                - the default is `1000`
+            - `percentiles`
+                - `Tuple[float]`, optional
+                - percentiles of the sampled distribution of `M` to return
+                - the default is `(16,50,84)`
+            - `correct_offset`
+                - `bool`, optional
+                - whether to subtract `"offset"` of `fn_confstats` from the samples
+                - the default is `False`
+            - `max_elements`
+                - `int`, optional
+                - maximum number of samples held in memory at once
+                - sources get processed in chunks of `max_elements//nsamples`
+                - the default is `2**22`
+            - `seed`
+                - `int`, optional
+                - seed of the random number generator
+                - the default is `None`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `M_pct`
+                - `np.ndarray`
+                - requested `percentiles` of the sampled absolute magnitudes
+                - has shape `(len(percentiles), *shape)`
+                    - `shape` is the broadcast shape of the inputs
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+            - `typing`
+
+        Comments
+        --------
+            - the distance modulus gets evaluated once per chunk (for all samples of the chunk at once)
+            - `"std"` and `"offset"` get looked up at the nominal `z` of each source
+            - non-positive redshift samples get clipped to `1e-8`
+    """
+
+    #init
+    m, z, m_err, z_err, pb = np.broadcast_arrays(
+        np.asarray(m, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+        np.asarray(m_err, dtype=np.float64),
+        np.asarray(z_err, dtype=np.float64),
+        np.asarray(pb),
+    )
+    shape = m.shape
+    m, z, m_err, z_err, pb = (a.reshape(-1) for a in (m, z, m_err, z_err, pb))
+    n = m.size
+    chunksize = max(1, max_elements//nsamples)
+    rng = np.random.default_rng(seed)
+    if distmod_grid is not False and distmod_grid is not None:
+        distmod_grid = _get_distmod_grid(cosmo, distmod_grid)
+    lut = get_confstats(fn_confstats) if isinstance(fn_confstats, (str, ConfStatsLUT)) else None
+
+    M_pct = np.empty((len(percentiles), n))
+    for start in range(0, n, chunksize):
+        c = slice(start, min(start+chunksize, n))
+        nc = c.stop - c.start
+
+        #draw samples
+        m_s = m[c,None] + m_err[c,None]*rng.standard_normal((nc, nsamples))
+        z_s = z[c,None] + z_err[c,None]*rng.standard_normal((nc, nsamples))
+        np.maximum(z_s, 1e-8, out=z_s)
+
+        #compute absolute magnitudes
+        M_s = m_s
+        M_s -= _distmod(z_s.reshape(-1), cosmo, distmod_grid).reshape(nc, nsamples)
+        if lut is not None:
+            std, offset = lut.lookup(pb[c], z[c])
+            M_s += np.nan_to_num(std)[:,None]*rng.standard_normal((nc, nsamples))
+            if correct_offset: M_s -= np.nan_to_num(offset)[:,None]
+
+        M_pct[:,c] = np.percentile(M_s, percentiles, axis=1)
 
+    return M_pct.reshape((len(percentiles), *shape))
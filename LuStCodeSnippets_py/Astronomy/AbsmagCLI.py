@@ -0,0 +1,176 @@
+
+#%%imports
+import argparse
+import os
+import polars as pl
+from typing import TYPE_CHECKING, List
+
+from ..PlExtension import plNamespace  #registers `pl.Expr.lust`
+
+if TYPE_CHECKING:
+    from astropy.cosmology import Cosmology     #annotations only (deferred since astropy is slow to import)
+
+#%%definitions
+def get_cosmo(
+    name:str=None,
+    H0:float=None, Om0:float=None, Tcmb0:float=0.0,
+    ) -> "Cosmology":
+    """
+        - function to obtain a cosmology from commandline arguments
+
+        Parameters
+        ----------
+            - `name`
+                - `str`, optional
+                - name of a realization in `astropy.cosmology.realizations`
+                - ignored if `H0` and `Om0` are passed
+                - the default is `None`
+            - `H0`
+                - `float`, optional
+                - Hubble constant in km/s/Mpc for a `FlatLambdaCDM`
+                - the default is `None`
+            - `Om0`
+                - `float`, optional
+                - matter density parameter for a `FlatLambdaCDM`
+                - the default is `None`
+            - `Tcmb0`
+                - `float`, optional
+                - CMB temperature in K for a `FlatLambdaCDM`
+                - the default is `0.0`
+
+        Raises
+        ------
+            - `ValueError`
+                - if neither a known `name` nor `H0` and `Om0` are passed
+
+        Returns
+        -------
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - requested cosmology
+
+        Dependencies
+        ------------
+            - `astropy`
+
+        Comments
+        --------
+    """
+    import astropy.cosmology as apc  #deferred (i.e., `--help` does not pay for importing astropy)
+
+    if H0 is not None and Om0 is not None:
+        return apc.FlatLambdaCDM(H0=H0, Om0=Om0, Tcmb0=Tcmb0)
+    elif name in apc.realizations.available:
+        return getattr(apc, name)
+    else:
+        raise ValueError(f"`name` has to be one of {apc.realizations.available} if `H0` and `Om0` are not specified but is {name}")
+
+def scan_catalog(fn:str) -> pl.LazyFrame:
+    """
+        - function to lazily scan a catalog based on its file extension
+    """
+    ext = os.path.splitext(fn)[1].lower()
+    if ext in [".parquet", ".pq"]:
+        return pl.scan_parquet(fn)
+    elif ext == ".csv":
+        return pl.scan_csv(fn)
+    else:
+        raise ValueError(f"extension of `fn` has to be one of `.parquet`, `.pq`, `.csv` but is {ext}")
+
+def sink_catalog(lf:pl.LazyFrame, fn:str):
+    """
+        - function to stream a `pl.LazyFrame` to disk based on the file extension of `fn`
+    """
+    ext = os.path.splitext(fn)[1].lower()
+    if ext in [".parquet", ".pq"]:
+        lf.sink_parquet(fn)
+    elif ext == ".csv":
+        lf.sink_csv(fn)
+    else:
+        raise ValueError(f"extension of `fn` has to be one of `.parquet`, `.pq`, `.csv` but is {ext}")
+    return
+
+def main(argv:List[str]=None):
+    """
+        - commandline entry point (`lust-absmag`) to compute absolute magnitudes for catalogs on disk
+        - run `lust-absmag --help` for the available options
+
+        Parameters
+        ----------
+            - `argv`
+                - `List[str]`, optional
+                - commandline arguments
+                - the default is `None`
+                    - will use `sys.argv`
+
+        Raises
+        ------
+
+        Returns
+        -------
+
+        Dependencies
+        ------------
+            - `argparse`
+            - `astropy`
+            - `os`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - the catalog gets streamed through `Absmag.absmag()` (via `pl.Expr.lust.absmag()`) on the polars streaming engine
+                - it gets processed in batches of `--batch-size` rows
+                - results get written incrementally
+                - memory consumption does not depend on the size of the catalog
+            - appends the columns `"M"`, `"std"`, `"offset"` to the input columns
+                - exits with an error if the input already contains any of them
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="lust-absmag",
+        description="convert apparent to absolute magnitudes for Parquet/CSV catalogs that do not fit into memory",
+    )
+    parser.add_argument("fn_in",                                            help="input catalog (`.parquet`, `.pq`, `.csv`)")
+    parser.add_argument("fn_out",                                           help="output catalog (`.parquet`, `.pq`, `.csv`)")
+    parser.add_argument("--cosmo",          default="Planck18",             help="name of a realization in `astropy.cosmology` (default: %(default)s)")
+    parser.add_argument("--H0",             type=float, default=None,       help="Hubble constant in km/s/Mpc of a `FlatLambdaCDM` (overrides `--cosmo`)")
+    parser.add_argument("--Om0",            type=float, default=None,       help="matter density parameter of a `FlatLambdaCDM` (overrides `--cosmo`)")
+    parser.add_argument("--Tcmb0",          type=float, default=0.0,        help="CMB temperature in K of a `FlatLambdaCDM` (default: %(default)s)")
+    parser.add_argument("--lut",            default=None,                   help="lookup table of confidence estimates (see `Absmag.absmag()`)")
+    parser.add_argument("--m-col",          default="m",                    help="column of apparent magnitudes (default: %(default)s)")
+    parser.add_argument("--z-col",          default="z",                    help="column of redshifts (default: %(default)s)")
+    parser.add_argument("--pb-col",         default=None,                   help="column of passbands (required for `--lut`)")
+    parser.add_argument("--distmod-grid",   action="store_true",            help="interpolate the distance modulus from a precomputed grid (see `Distmod.DistmodGrid`)")
+    parser.add_argument("--batch-size",     type=int, default=100_000,      help="number of rows per batch (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.lut is not None and args.pb_col is None:
+        parser.error("`--lut` requires `--pb-col`")
+
+    lf_in = scan_catalog(args.fn_in)
+    conflicts = [c for c in lf_in.collect_schema().names() if c in ["absmag", "M", "std", "offset"]]
+    if len(conflicts) > 0:
+        parser.error(f"`fn_in` must not contain the output columns `absmag`, `M`, `std`, `offset` but contains {conflicts}")
+
+    cosmo = get_cosmo(args.cosmo, args.H0, args.Om0, args.Tcmb0)
+
+    lf = (lf_in
+        .with_columns(
+            pl.col(args.m_col).lust.absmag(
+                z=args.z_col, cosmo=cosmo, pb=args.pb_col,
+                lut=False if args.lut is None else args.lut,
+                distmod_grid=args.distmod_grid,
+            )
+        )
+        .unnest("absmag")
+    )
+
+    with pl.Config() as cfg:
+        cfg.set_streaming_chunk_size(args.batch_size)
+        sink_catalog(lf, args.fn_out)
+
+    return
+
+#%%main
+if __name__ == "__main__":
+    main()
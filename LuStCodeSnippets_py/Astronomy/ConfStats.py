@@ -0,0 +1,379 @@
+
+#%%imports
+import argparse
+import csv
+import numpy as np
+import os
+import struct
+from typing import Dict, List, Tuple, Union
+import zipfile
+
+#%%definitions
+class ConfStatsLUT:
+    """
+        - class holding a parsed lookup table of confidence estimates
+        - stores per-passband arrays sorted by `"z_bin"`
+        - lookups are vectorized via `np.searchsorted()`
+
+        Attributes
+        ----------
+            - `tables`
+                - `Dict[str,Tuple[np.ndarray,np.ndarray,np.ndarray]]`
+                - maps passband to `(z_bin, std, offset)`
+                - each entry is sorted ascending in `z_bin`
+
+        Methods
+        -------
+            - `from_csv()`
+            - `from_npz()`
+            - `lookup()`
+
+        Dependencies
+        ------------
+            - `csv`
+            - `numpy`
+            - `os`
+            - `struct`
+            - `typing`
+            - `zipfile`
+
+        Comments
+        --------
+            - use `get_confstats()` to obtain cached instances
+            - use `compile_confstats()` to convert a csv table into a binary (memory-mappable) one
+    """
+
+    def __init__(self,
+        tables:Dict[str,Tuple[np.ndarray,np.ndarray,np.ndarray]],
+        sort:bool=True,
+        ):
+
+        self.tables = {}
+        for pb, (z_bin, std, offset) in tables.items():
+            if sort:
+                z_bin = np.asarray(z_bin, dtype=np.float64)
+                sortidx = np.argsort(z_bin, kind="stable")
+                z_bin, std, offset = (
+                    z_bin[sortidx],
+                    np.asarray(std, dtype=np.float64)[sortidx],
+                    np.asarray(offset, dtype=np.float64)[sortidx],
+                )
+            self.tables[pb] = (z_bin, std, offset)
+
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(passbands={list(self.tables.keys())})"
+
+    @property
+    def passbands(self):
+        return list(self.tables.keys())
+
+    @classmethod
+    def from_csv(cls,
+        fn:str,
+        ) -> "ConfStatsLUT":
+        """
+            - method to parse a lookup table of confidence estimates from a csv file
+
+            Parameters
+            ----------
+                - `fn`
+                    - `str`
+                    - path to the lookup table
+                    - has to contain the columns `"passband"`, `"z_bin"`, `"std"`, `"offset"`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `lut`
+                    - `ConfStatsLUT`
+                    - parsed lookup table
+
+            Comments
+            --------
+        """
+
+        cols = {}
+        with open(fn) as f:
+            for row in csv.DictReader(f, skipinitialspace=True):
+                col = cols.setdefault(row["passband"], ([], [], []))
+                col[0].append(float(row["z_bin"]))
+                col[1].append(float(row["std"]))
+                col[2].append(float(row["offset"]))
+
+        return cls(cols)
+
+    @classmethod
+    def from_npz(cls,
+        fn:str,
+        mmap:bool=True,
+        ) -> "ConfStatsLUT":
+        """
+            - method to load a lookup table compiled via `compile_confstats()`
+
+            Parameters
+            ----------
+                - `fn`
+                    - `str`
+                    - path to the compiled lookup table
+                - `mmap`
+                    - `bool`, optional
+                    - whether to memory-map the table instead of reading it into memory
+                    - the default is `True`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `lut`
+                    - `ConfStatsLUT`
+                    - loaded lookup table
+                    - `tables` contains views into the (memory-mapped) data
+
+            Comments
+            --------
+                - with `mmap==True` all processes loading the same file share the same pages
+        """
+
+        with np.load(fn) as npz:
+            passbands   = npz["passbands"]
+            bounds      = npz["bounds"]
+            data        = _mmap_npz_member(fn, "data") if mmap else npz["data"]
+
+        tables = {
+            str(pb): tuple(data[:,bounds[i]:bounds[i+1]])
+            for i, pb in enumerate(passbands)
+        }
+
+        return cls(tables, sort=False)
+
+    def lookup(self,
+        pb:Union[str,np.ndarray], z:Union[float,np.ndarray],
+        ) -> Tuple[np.ndarray,np.ndarray]:
+        """
+            - method to look up `std` and `offset` for given passbands and redshifts
+
+            Parameters
+            ----------
+                - `pb`
+                    - `str`, `np.ndarray`
+                    - passband(s) to look up
+                    - has to be broadcastable against `z`
+                - `z`
+                    - `float`, `np.ndarray`
+                    - redshift(s) to look up
+                    - has to be broadcastable against `pb`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `std`
+                    - `np.ndarray`
+                    - `"std"` of the closest `"z_bin"` for each element
+                    - `np.nan` if `pb` is not present in the table
+                - `offset`
+                    - `np.ndarray`
+                    - `"offset"` of the closest `"z_bin"` for each element
+                    - `np.nan` if `pb` is not present in the table
+
+            Comments
+            --------
+                - the redshift bin is the one with `"z_bin"` closest to `z`
+                    - ties are resolved towards the lower `"z_bin"`
+        """
+
+        pb, z = np.broadcast_arrays(np.asarray(pb), np.asarray(z, dtype=np.float64))
+        std     = np.full(z.shape, np.nan)
+        offset  = np.full(z.shape, np.nan)
+
+        if pb.strides == (0,)*pb.ndim:  #single passband (i.e., broadcast scalar)
+            pbs_u, pbs_idx = np.array([str(pb.flat[0])]), np.zeros(pb.shape, dtype=np.intp)
+        else:
+            pbs_u, pbs_idx = np.unique(pb.astype(str), return_inverse=True)
+            pbs_idx = pbs_idx.reshape(pb.shape)
+        for i, pb_u in enumerate(pbs_u):
+            if pb_u not in self.tables: continue    #passband not present in LUT
+            z_bin, pb_std, pb_off = self.tables[pb_u]
+
+            mask = (pbs_idx == i) if len(pbs_u) > 1 else np.ones(z.shape, dtype=bool)
+            zbin_idx = self._nearest_bin(z_bin, z[mask])
+            offset[mask] = pb_off[zbin_idx]
+            std[mask]    = pb_std[zbin_idx]
+
+        #no estimate for undefined redshifts
+        offset[np.isnan(z)] = np.nan
+        std[np.isnan(z)]    = np.nan
+
+        return std, offset
+
+    @staticmethod
+    def _nearest_bin(z_bin:np.ndarray, z:np.ndarray) -> np.ndarray:
+        """
+            - returns indices of the entries in (sorted) `z_bin` closest to `z`
+        """
+        right = np.searchsorted(z_bin, z, side="left")
+        left  = np.clip(right - 1, 0, len(z_bin)-1)
+        right = np.clip(right, 0, len(z_bin)-1)
+        use_right = np.abs(z_bin[right] - z) < np.abs(z - z_bin[left])
+        return np.where(use_right, right, left)
+
+def _mmap_npz_member(fn:str, name:str) -> np.memmap:
+    """
+        - memory-maps the (uncompressed) array `name` stored in the `.npz` archive `fn`
+    """
+    with zipfile.ZipFile(fn) as zf:
+        info = zf.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"`{name}` in {fn} is compressed and cannot be memory-mapped")
+
+    with open(fn, "rb") as f:
+        #skip local file header
+        f.seek(info.header_offset)
+        len_fname, len_extra = struct.unpack("<HH", f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + len_fname + len_extra)
+
+        #parse `.npy` header
+        version = np.lib.format.read_magic(f)
+        if version == (1,0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    return np.memmap(fn, dtype=dtype, mode="r", shape=shape, offset=offset, order="F" if fortran_order else "C")
+
+def compile_confstats(
+    fn_confstats:str,
+    fn_out:str=None,
+    ) -> str:
+    """
+        - function to compile a lookup table of confidence estimates into a binary format
+
+        Parameters
+        ----------
+            - `fn_confstats`
+                - `str`
+                - path to the csv lookup table
+                - see `Absmag.absmag()` for the required columns
+            - `fn_out`
+                - `str`, optional
+                - path to write the compiled table to
+                - the default is `None`
+                    - will replace the extension of `fn_confstats` with `.npz`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `fn_out`
+                - `str`
+                - path of the compiled table
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `os`
+
+        Comments
+        --------
+            - the compiled table is an uncompressed `.npz` archive containing
+                - `"data"`
+                    - `np.ndarray` of shape `(3,nrows)`
+                    - rows are `z_bin`, `std`, `offset`
+                    - sorted by passband and `z_bin`
+                - `"passbands"`
+                    - unique passbands
+                - `"bounds"`
+                    - `"data"[:,bounds[i]:bounds[i+1]]` contains the entries of `passbands[i]`
+            - `"data"` gets memory-mapped upon loading (see `ConfStatsLUT.from_npz()`)
+            - can be passed to `Absmag.absmag()` as `fn_confstats` directly
+    """
+
+    fn_out = os.path.splitext(fn_confstats)[0] + ".npz" if fn_out is None else fn_out
+
+    lut = ConfStatsLUT.from_csv(fn_confstats)
+    passbands = np.array(sorted(lut.tables.keys()))
+    data = np.concatenate([np.array(lut.tables[pb]) for pb in passbands], axis=1) if len(passbands) > 0 else np.empty((3,0))
+    bounds = np.cumsum([0] + [len(lut.tables[pb][0]) for pb in passbands])
+
+    np.savez(fn_out, data=data, passbands=passbands, bounds=bounds)
+
+    return fn_out
+
+_CONFSTATS_CACHE:Dict[str,Tuple[Tuple[int,int],ConfStatsLUT]] = {}
+
+def get_confstats(
+    fn_confstats:Union[str,ConfStatsLUT],
+    ) -> ConfStatsLUT:
+    """
+        - function to obtain a (cached) `ConfStatsLUT` for a lookup table on disk
+
+        Parameters
+        ----------
+            - `fn_confstats`
+                - `str`, `ConfStatsLUT`
+                - path to the lookup table
+                    - csv table
+                    - `.npz` table compiled via `compile_confstats()`
+                        - will be memory-mapped
+                - if a `ConfStatsLUT` is passed it gets returned as is
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `lut`
+                - `ConfStatsLUT`
+                - parsed lookup table
+
+        Dependencies
+        ------------
+            - `os`
+
+        Comments
+        --------
+            - tables are cached by path and modification time
+                - the file only gets parsed again if it changed on disk
+    """
+
+    if isinstance(fn_confstats, ConfStatsLUT):
+        return fn_confstats
+
+    fn = os.path.realpath(fn_confstats)
+    st = os.stat(fn)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFSTATS_CACHE.get(fn)
+    if cached is None or cached[0] != key:
+        load = ConfStatsLUT.from_npz if fn.endswith(".npz") else ConfStatsLUT.from_csv
+        cached = (key, load(fn))
+        _CONFSTATS_CACHE[fn] = cached
+
+    return cached[1]
+
+def main(argv:List[str]=None):
+    """
+        - commandline entry point (`lust-compile-confstats`) of `compile_confstats()`
+    """
+    parser = argparse.ArgumentParser(
+        prog="lust-compile-confstats",
+        description="compile a csv lookup table of confidence estimates into a memory-mappable `.npz` file",
+    )
+    parser.add_argument("fn_confstats",                 help="csv lookup table")
+    parser.add_argument("fn_out", nargs="?", default=None,  help="output file (default: `fn_confstats` with extension `.npz`)")
+    args = parser.parse_args(argv)
+
+    print(compile_confstats(args.fn_confstats, args.fn_out))
+
+    return
+
+#%%main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+
+#%%imports
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from astropy.cosmology import Cosmology     #annotations only (deferred since astropy is slow to import)
+
+#%%definitions
+def cosmo_key(cosmo:"Cosmology") -> Tuple:
+    """
+        - function to generate a hashable key identifying a cosmology by its parameters
+
+        Parameters
+        ----------
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to generate the key for
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `key`
+                - `Tuple`
+                - class name of `cosmo` alongside all of its parameter values
+                - two cosmologies with the same key yield the same distance modulus
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+
+        Comments
+        --------
+            - `cosmo.name` is not part of the key
+    """
+    params = tuple(
+        (k, None if v is None else repr(np.asarray(getattr(v, "value", v)).tolist()))
+        for k, v in cosmo.parameters.items()
+    )
+    return (type(cosmo).__qualname__, params)
+
+class DistmodGrid:
+    """
+        - class tabulating the distance modulus of a cosmology on a dense redshift grid
+        - queries are answered by linear interpolation in `log10(z)`
+
+        Attributes
+        ----------
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model the grid was tabulated for
+            - `key`
+                - `Tuple`
+                - `cosmo_key(cosmo)`
+            - `zmin`
+                - `float`
+                - lower bound of the tabulated redshift range
+            - `zmax`
+                - `float`
+                - upper bound of the tabulated redshift range
+            - `n`
+                - `int`
+                - number of gridpoints
+            - `log10z`
+                - `np.ndarray`
+                - gridpoints in `log10(z)`
+                - uniformly spaced
+            - `mu`
+                - `np.ndarray`
+                - distance modulus at `log10z`
+                - monotonically increasing
+            - `max_error`
+                - `float`
+                - maximum absolute interpolation error (in mag) within `[zmin, zmax]`
+                - measured against `cosmo.distmod()` at the midpoints between gridpoints upon construction
+
+        Methods
+        -------
+            - `distmod()`
+            - `inverse()`
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+            - `typing`
+
+        Comments
+        --------
+            - use `get_distmod_grid()` to obtain cached instances that can be shared across calls
+            - for the default settings `max_error` is well below `1e-6` mag for the realizations in `astropy.cosmology`
+            - redshifts outside of `[zmin, zmax]` fall back to `cosmo.distmod()`
+            - `inverse()` maps distance moduli back to redshifts via `np.searchsorted()` on `mu`
+    """
+
+    def __init__(self,
+        cosmo:"Cosmology",
+        zmin:float=1e-4, zmax:float=10.0,
+        n:int=10000,
+        ):
+
+        self.cosmo  = cosmo
+        self.key    = cosmo_key(cosmo)
+        self.zmin   = zmin
+        self.zmax   = zmax
+        self.n      = n
+
+        self.log10z = np.linspace(np.log10(zmin), np.log10(zmax), n)
+        self._dlog10z = self.log10z[1] - self.log10z[0]
+        self.mu     = cosmo.distmod(10**self.log10z).value
+        self._dmu   = np.append(np.diff(self.mu), 0.0)
+
+        #estimate interpolation error (largest at midpoints for linear interpolation)
+        z_mid = 10**(self.log10z[:-1] + self._dlog10z/2)
+        self.max_error = float(np.max(np.abs(self.distmod(z_mid) - cosmo.distmod(z_mid).value)))
+
+        return
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"cosmo={self.cosmo.__class__.__name__}, zmin={self.zmin}, zmax={self.zmax}, n={self.n}, "
+            f"max_error={self.max_error:.1e})"
+        )
+
+    def distmod(self,
+        z:Union[float,np.ndarray],
+        ) -> np.ndarray:
+        """
+            - method to evaluate the distance modulus at `z`
+
+            Parameters
+            ----------
+                - `z`
+                    - `float`, `np.ndarray`
+                    - redshift(s) to evaluate the distance modulus at
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `mu`
+                    - `np.ndarray`
+                    - distance modulus in mag
+                    - same shape as `z`
+
+            Comments
+            --------
+                - values outside of `[zmin, zmax]` get evaluated exactly via `cosmo.distmod()`
+        """
+
+        z = np.asarray(z, dtype=np.float64)
+        shape = z.shape
+        z = z.reshape(-1)
+
+        #fractional index on the (uniform) grid => no search needed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.log10(z)
+        x -= self.log10z[0]
+        x /= self._dlog10z
+        inrange = (x >= 0) & (x <= self.n-1)
+        allinrange = inrange.all()
+        if not allinrange: x[~inrange] = 0
+        idx = x.astype(np.intp)
+        np.minimum(idx, self.n-2, out=idx)
+
+        #linear interpolation
+        x -= idx
+        x *= self._dmu[idx]
+        mu = self.mu[idx]
+        mu += x
+
+        #exact evaluation out of range
+        if not allinrange:
+            mu[~inrange] = self.cosmo.distmod(z[~inrange]).value
+        mu = mu.reshape(shape)
+
+        return mu
+
+    def inverse(self,
+        mu:Union[float,np.ndarray],
+        ) -> np.ndarray:
+        """
+            - method to obtain the redshift corresponding to some distance modulus
+
+            Parameters
+            ----------
+                - `mu`
+                    - `float`, `np.ndarray`
+                    - distance modulus/moduli in mag
+
+            Raises
+            ------
+                - `ValueError`
+                    - if the tabulated distance modulus is not monotonically increasing
+
+            Returns
+            -------
+                - `z`
+                    - `np.ndarray`
+                    - redshift(s) corresponding to `mu`
+                    - same shape as `mu`
+                    - `np.nan` for `mu` outside of `[mu[0], mu[-1]]`
+
+            Comments
+            --------
+                - linear interpolation in `log10(z)` between the bracketing gridpoints
+                    - no per-element root finding
+        """
+
+        if not np.all(self._dmu[:-1] > 0):
+            raise ValueError("the tabulated distance modulus is not monotonically increasing and cannot be inverted")
+
+        mu = np.asarray(mu, dtype=np.float64)
+        shape = mu.shape
+        mu = mu.reshape(-1)
+
+        idx = np.clip(np.searchsorted(self.mu, mu, side="right") - 1, 0, self.n-2)
+        log10z = self.log10z[idx] + (mu - self.mu[idx])/self._dmu[idx]*self._dlog10z
+        z = 10**log10z
+        z[~((mu >= self.mu[0]) & (mu <= self.mu[-1]))] = np.nan
+
+        return z.reshape(shape)
+
+_DISTMODGRID_CACHE:Dict[Tuple,DistmodGrid] = {}
+
+def get_distmod_grid(
+    cosmo:"Cosmology",
+    zmin:float=1e-4, zmax:float=10.0,
+    n:int=10000,
+    ) -> DistmodGrid:
+    """
+        - function to obtain a (cached) `DistmodGrid` for some cosmology
+
+        Parameters
+        ----------
+            - `cosmo`
+                - `astropy.cosmology.Cosmology`
+                - cosmological model to tabulate
+            - `zmin`
+                - `float`, optional
+                - lower bound of the tabulated redshift range
+                - has to be greater than `0`
+                - the default is `1e-4`
+            - `zmax`
+                - `float`, optional
+                - upper bound of the tabulated redshift range
+                - the default is `10.0`
+            - `n`
+                - `int`, optional
+                - number of gridpoints
+                - the default is `10000`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `grid`
+                - `DistmodGrid`
+                - tabulated distance modulus
+
+        Dependencies
+        ------------
+            - `astropy`
+
+        Comments
+        --------
+            - grids are cached by `cosmo_key(cosmo)` and the grid specifications
+                - i.e., two separately instantiated but identical cosmologies share one grid
+    """
+
+    key = (cosmo_key(cosmo), zmin, zmax, n)
+    grid = _DISTMODGRID_CACHE.get(key)
+    if grid is None:
+        grid = DistmodGrid(cosmo, zmin=zmin, zmax=zmax, n=n)
+        _DISTMODGRID_CACHE[key] = grid
+
+    return grid
@@ -1,14 +1,52 @@
 #%%imports
+from importlib import resources
+import numpy as np
 import os
 import polars as pl
+from typing import Dict, List, Tuple, Union
 
 #%%definitions
-def get_passband_specs() -> pl.DataFrame:
+_PASSBAND_SPECS_RESOURCE = "data/passband_specs.csv"
+_PASSBAND_SPECS_CACHE:Dict[Union[str,Tuple[str,str]],Tuple[Tuple[int,int],pl.DataFrame]] = {}
+
+def _stamp(fn:Union[str,os.PathLike]) -> Tuple[int,int]:
+    """
+        - modification time and size of `fn` (to detect changes on disk)
+    """
+    st = os.stat(fn)
+    return (st.st_mtime_ns, st.st_size)
+
+def _categories(dtype:Union[pl.Categorical,pl.Enum]) -> pl.Series:
+    """
+        - categories of a categorical `dtype` ordered by their physical codes
+    """
+    return dtype.categories if isinstance(dtype, pl.Enum) else dtype.categories.to_series()
+
+def _join_keys(s:pl.Series, values:pl.Series) -> Tuple[pl.Series,pl.Series]:
+    """
+        - keys to join the column `s` and the (specification) column `values` on
+        - categorical columns get joined via their physical codes
+            - i.e., `values` get mapped to codes once instead of casting `s` row by row
+    """
+    if isinstance(s.dtype, (pl.Categorical, pl.Enum)):
+        codes = s.to_physical()
+        cats = _categories(s.dtype)
+        return codes, values.replace_strict(cats, pl.int_range(len(cats), eager=True), default=None, return_dtype=codes.dtype)
+    return s.cast(pl.String), values
+
+def get_passband_specs(
+    fn:str=None,
+    ) -> pl.DataFrame:
     """
         - fuction to obtain a DataFrame of passband specifications
 
         Parameters
         ----------
+            - `fn`
+                - `str`, optional
+                - path to a custom table of passband specifications
+                - the default is `None`
+                    - will use the table bundled with the package (`LuStCodeSnippets_py/Astronomy/data/passband_specs.csv`)
 
         Raises
         ------
@@ -19,18 +57,257 @@ def get_passband_specs() -> pl.DataFrame:
                 - `pl.DataFrame`
                 - contains passband specifications
                 - each row is one passband
+                - private copy of the cached table (i.e., modifying it does not affect other callers)
 
         Dependencies
         ------------
+            - `importlib`
             - `os`
             - `polars`
+            - `typing`
 
         Comments
         --------
             - if you want to have an encoding-dict instead simply call `dict(zip(df["name"], df.select(pl.exclude("name")).to_numpy()))`
+                - to encode whole columns of observations use `PassbandEncoder` instead
             - markers and colors for `mission=="lsst"` taken from https://github.com/lsst/tutorial-notebooks/blob/main/DP0.2/08_Truth_Tables.ipynb
+            - the table gets read once and cached
+                - it only gets read again if it changed on disk
+                - the bundled table gets loaded via `importlib.resources` (i.e., also from zipped installs) and cached per package and resource
+                - each call returns a private copy of the cached DataFrame
+                    - cheap since buffers are shared, not copied
+                    - in-place modifications (e.g., `df.insert_column()`) do not propagate to the cache
+    """
+
+    if fn is None:
+        #bundled table (keyed on package and resource, works for zipped installs as well)
+        res = resources.files(__package__).joinpath(_PASSBAND_SPECS_RESOURCE)
+        key = (__package__, _PASSBAND_SPECS_RESOURCE)
+        stamp = _stamp(res) if isinstance(res, os.PathLike) else None   #contents of archives do not change
+        cached = _PASSBAND_SPECS_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            with resources.as_file(res) as fn_res:
+                cached = (stamp, pl.read_csv(fn_res))
+            _PASSBAND_SPECS_CACHE[key] = cached
+    else:
+        key = os.path.realpath(fn)
+        stamp = _stamp(key)
+        cached = _PASSBAND_SPECS_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, pl.read_csv(key))
+            _PASSBAND_SPECS_CACHE[key] = cached
+    df = cached[1].clone()  #private copy (shares buffers with the cache)
+
+    return df
+
+class PassbandEncoder:
+    """
+        - class to map whole columns of passband names to their specifications
+        - keyed on (`"mission"`, `"name"`)
+
+        Attributes
+        ----------
+            - `df_specs`
+                - `pl.DataFrame`
+                - passband specifications used for the encoding
+                - see `get_passband_specs()`
+
+        Methods
+        -------
+            - `indices()`
+            - `encode()`
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - all mappings are vectorized (hash-based replacement, joins, or `np.searchsorted()`)
+                - no python-level loops over rows
+                - scales to observation logs of `10^8` rows
+            - bands that are not present in `df_specs` get encoded as `null` (`pl.DataFrame`) or `np.nan`/`""` (`np.ndarray`)
+            - raises a `ValueError` upon initialization if `df_specs` is empty
     """
-    curdir = os.path.dirname(os.path.realpath(__file__)) +"/"
-    df = pl.read_csv(f"{curdir}../../data/passband_specs.csv")
-    
-    return df
\ No newline at end of file
+
+    def __init__(self,
+        df_specs:pl.DataFrame=None,
+        ):
+        self.df_specs = get_passband_specs() if df_specs is None else df_specs
+        if self.df_specs.height == 0:
+            raise ValueError("`df_specs` has to contain at least one passband")
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(missions={self.df_specs['mission'].unique(maintain_order=True).to_list()})"
+
+    def _specs_for_mission(self, mission:str=None) -> pl.DataFrame:
+        """
+            - returns the (indexed) specifications of `mission`
+            - raises a `ValueError` if names are ambiguous
+        """
+        df = self.df_specs.with_row_index("__idx")
+        if mission is not None:
+            df = df.filter(pl.col("mission")==mission)
+        if df["name"].n_unique() < df.height:
+            raise ValueError(f"passband names are ambiguous for `mission={mission}`, please specify a (different) mission")
+        return df
+
+    def indices(self,
+        name:Union[pl.Series,np.ndarray],
+        mission:Union[str,pl.Series,np.ndarray]=None,
+        ) -> Union[pl.Series,np.ndarray]:
+        """
+            - method to obtain the row-indices in `df_specs` of each passband in `name`
+
+            Parameters
+            ----------
+                - `name`
+                    - `pl.Series`, `np.ndarray`
+                    - column of passband names
+                    - `pl.Series` can be of dtype `pl.String` or `pl.Categorical`
+                - `mission`
+                    - `str`, `pl.Series`, `np.ndarray`, optional
+                    - mission the passbands in `name` belong to
+                    - either one mission for all passbands or a column of the same length as `name`
+                    - the default is `None`
+                        - will match `name` only
+                        - requires the names in `df_specs` to be unique
+
+            Raises
+            ------
+                - `ValueError`
+                    - if `mission` is `None` or a `str` and passband names within `mission` are ambiguous
+
+            Returns
+            -------
+                - `idx`
+                    - `pl.Series`, `np.ndarray`
+                    - indices into `df_specs`
+                    - `pl.Series` of dtype `pl.UInt32` if `name` is a `pl.Series`
+                        - `null` for unknown passbands
+                    - `np.ndarray` of dtype `np.int64` otherwise
+                        - `-1` for unknown passbands
+
+            Comments
+            --------
+                - `pl.Categorical`/`pl.Enum` columns get matched via their physical codes
+                    - each category gets looked up once (no per-row cast to `pl.String`)
+        """
+
+        if isinstance(name, pl.Series):
+            if mission is None or isinstance(mission, str):
+                df = self._specs_for_mission(mission)
+                if isinstance(name.dtype, (pl.Categorical, pl.Enum)):
+                    #map each category once and gather via the physical codes
+                    lookup = _categories(name.dtype).replace_strict(df["name"], df["__idx"], default=None, return_dtype=pl.UInt32)
+                    idx = lookup.gather(name.to_physical())
+                else:
+                    idx = name.cast(pl.String).replace_strict(df["name"], df["__idx"], default=None, return_dtype=pl.UInt32)
+            else:
+                df = self.df_specs.with_row_index("__idx").select("mission", "name", "__idx")
+                mission_key, mission_specs = _join_keys(pl.Series(mission), df["mission"])
+                name_key, name_specs = _join_keys(name, df["name"])
+                idx = (pl.DataFrame(dict(mission=mission_key, name=name_key))
+                    .join(
+                        pl.DataFrame(dict(mission=mission_specs, name=name_specs, __idx=df["__idx"])),
+                        on=["mission", "name"], how="left", maintain_order="left",
+                    )
+                )["__idx"]
+            return idx.alias("idx")
+
+        name = np.asarray(name)
+        idx = np.full(name.shape, -1, dtype=np.int64)
+        if mission is None or isinstance(mission, str):
+            missions, masks = [mission], [slice(None)]
+        else:
+            mission = np.broadcast_to(np.asarray(mission), name.shape)
+            missions = self.df_specs["mission"].unique(maintain_order=True).to_list()
+            masks = [(mission == m) for m in missions]
+        for m, mask in zip(missions, masks):
+            df = self._specs_for_mission(m)
+            sortidx = np.argsort(df["name"].to_numpy().astype(str))
+            keys = df["name"].to_numpy().astype(str)[sortidx]
+            if len(keys) == 0: continue
+            name_m = name[mask]
+            pos = np.clip(np.searchsorted(keys, name_m), 0, len(keys)-1)
+            found = (keys[pos] == name_m)
+            idx[mask] = np.where(found, df["__idx"].to_numpy().astype(np.int64)[sortidx][pos], -1)
+
+        return idx
+
+    def encode(self,
+        name:Union[pl.Series,np.ndarray],
+        mission:Union[str,pl.Series,np.ndarray]=None,
+        columns:List[str]=None,
+        rgba:bool=False,
+        ) -> Union[pl.DataFrame,Dict[str,np.ndarray]]:
+        """
+            - method to map a column of passband names to their specifications
+
+            Parameters
+            ----------
+                - `name`
+                    - `pl.Series`, `np.ndarray`
+                    - column of passband names
+                    - see `indices()`
+                - `mission`
+                    - `str`, `pl.Series`, `np.ndarray`, optional
+                    - mission the passbands in `name` belong to
+                    - see `indices()`
+                    - the default is `None`
+                - `columns`
+                    - `List[str]`, optional
+                    - columns of `df_specs` to encode
+                    - the default is `None`
+                        - will use `["wavelength", "plot_color", "plot_marker", "plot_ls"]`
+                - `rgba`
+                    - `bool`, optional
+                    - whether to additionally return `"plot_color"` as RGBA values in the column `"plot_color_rgba"`
+                    - colors get converted once per passband (not per row)
+                    - the default is `False`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `encoded`
+                    - `pl.DataFrame`, `Dict[str,np.ndarray]`
+                    - `pl.DataFrame` with one column per entry in `columns` if `name` is a `pl.Series`
+                        - `"plot_color_rgba"` is of dtype `pl.Array(pl.Float64, 4)`
+                    - `Dict[str,np.ndarray]` mapping `columns` to arrays of the same shape as `name` otherwise
+                        - `"plot_color_rgba"` has shape `(*name.shape, 4)`
+
+            Comments
+            --------
+                - columns get gathered via the indices from `indices()`
+        """
+
+        #default parameters
+        columns = ["wavelength", "plot_color", "plot_marker", "plot_ls"] if columns is None else columns
+
+        idx = self.indices(name, mission)
+        df_specs = self.df_specs.select(columns)
+        if rgba:
+            import matplotlib.colors as mcolors
+            df_specs = df_specs.with_columns(
+                pl.Series("plot_color_rgba", mcolors.to_rgba_array(self.df_specs["plot_color"].to_list()), dtype=pl.Array(pl.Float64, 4))
+            )
+
+        if isinstance(idx, pl.Series):
+            return df_specs.select(pl.all().gather(idx))
+
+        encoded = {}
+        found = (idx >= 0)
+        for c in df_specs.columns:
+            vals = df_specs[c].to_numpy()
+            if vals.dtype == object: vals = vals.astype(str)
+            fill = np.full_like(vals[:1], np.nan if vals.dtype.kind == "f" else "")
+            vals = np.concatenate([vals, fill])   #index `-1` maps to `fill`
+            encoded[c] = vals[np.where(found, idx, len(vals)-1)]
+
+        return encoded
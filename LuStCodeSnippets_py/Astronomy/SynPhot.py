@@ -0,0 +1,452 @@
+
+#%%imports
+import hashlib
+import numpy as np
+import os
+from typing import TYPE_CHECKING, Dict, Literal, Tuple, Union
+
+from . import Absmag
+from .ConfStats import ConfStatsLUT
+from .Distmod import DistmodGrid
+
+if TYPE_CHECKING:
+    from astropy.cosmology import Cosmology     #annotations only (deferred since astropy is slow to import)
+
+#%%definitions
+C_LIGHT = {"AA":2.99792458e18, "nm":2.99792458e17, "um":2.99792458e14}   #speed of light in `wavelength_unit`/s
+FNU_AB = 3.631e-20  #AB zeropoint in erg/s/cm^2/Hz
+
+def load_transmission(
+    fn:str,
+    ) -> Tuple[np.ndarray,np.ndarray]:
+    """
+        - function to load a transmission curve from a local file
+
+        Parameters
+        ----------
+            - `fn`
+                - `str`
+                - path to the transmission curve
+                - whitespace or comma separated text file
+                - first column is the wavelength
+                - second column is the transmission
+                - lines starting with `#` are ignored
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `wavelength`
+                - `np.ndarray`
+                - wavelengths of the transmission curve
+                - sorted ascending
+            - `transmission`
+                - `np.ndarray`
+                - transmission at `wavelength`
+
+        Dependencies
+        ------------
+            - `numpy`
+
+        Comments
+        --------
+    """
+    with open(fn) as f:
+        delimiter = "," if "," in next(l for l in f if not l.startswith("#")) else None
+    wavelength, transmission = np.loadtxt(fn, comments="#", delimiter=delimiter, usecols=(0,1), unpack=True)
+    sortidx = np.argsort(wavelength)
+    return wavelength[sortidx], transmission[sortidx]
+
+def resampling_matrix(
+    x_from:np.ndarray, x_to:np.ndarray,
+    ) -> Tuple[np.ndarray,np.ndarray]:
+    """
+        - function to precompute linear interpolation from the (sorted) grid `x_from` onto `x_to`
+        - returns indices of the lower neighbors and weights of the upper neighbors
+        - apply via `y[...,idx]*(1-w) + y[...,idx+1]*w`
+        - weights are `np.nan` outside of `[x_from[0], x_from[-1]]`
+    """
+    idx = np.clip(np.searchsorted(x_from, x_to, side="right") - 1, 0, len(x_from)-2)
+    w = (x_to - x_from[idx])/(x_from[idx+1] - x_from[idx])
+    w[(x_to < x_from[0]) | (x_to > x_from[-1])] = np.nan
+    return idx, w
+
+class SyntheticPhotometry:
+    """
+        - class to compute synthetic AB magnitudes of (many) SEDs in (many) passbands at once
+
+        Attributes
+        ----------
+            - `bands`
+                - `np.ndarray`
+                - names of the passbands
+            - `wavelength`
+                - `np.ndarray`
+                - shared wavelength grid all transmission curves got resampled onto
+            - `wavelength_unit`
+                - `Literal["AA","nm","um"]`
+                - unit of `wavelength`
+            - `transmission`
+                - `np.ndarray`
+                - transmission curves resampled onto `wavelength`
+                - has shape `(len(bands), len(wavelength))`
+
+        Methods
+        -------
+            - `from_files()`
+            - `response()`
+            - `fluxes()`
+            - `magnitudes()`
+            - `absmag()`
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `hashlib`
+            - `numpy`
+            - `os`
+            - `typing`
+
+        Comments
+        --------
+            - photon-counting AB magnitudes
+                - `m = -2.5*log10(int(f_lambda*T*lambda dlambda)/int(f_nu_AB*c/lambda**2*T*lambda dlambda))`
+            - integration (trapezoidal rule) and normalization are folded into a response matrix of shape `(len(bands), len(wavelength))`
+                - it gets computed once per SED unit and cached
+                - synthetic fluxes of many SEDs are a single matrix product `seds @ response.T`
+            - use `get_synthetic_photometry()` to obtain cached instances for transmission curves on disk
+    """
+
+    def __init__(self,
+        transmissions:Dict[str,Tuple[np.ndarray,np.ndarray]],
+        wavelength:np.ndarray,
+        wavelength_unit:Literal["AA","nm","um"]="nm",
+        ):
+
+        self.bands = np.array(list(transmissions.keys()))
+        self.wavelength = np.asarray(wavelength, dtype=np.float64)
+        self.wavelength_unit = wavelength_unit
+
+        #resample transmission curves onto the shared grid (once)
+        self.transmission = np.array([
+            np.interp(self.wavelength, wl, t, left=0.0, right=0.0)
+            for wl, t in transmissions.values()
+        ]).reshape(len(self.bands), len(self.wavelength))
+
+        self._response = {}
+
+        return
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"bands={self.bands.tolist()}, "
+            f"wavelength=[{self.wavelength[0]}, {self.wavelength[-1]}]{self.wavelength_unit} ({len(self.wavelength)} points))"
+        )
+
+    @classmethod
+    def from_files(cls,
+        files:Dict[str,str],
+        wavelength:np.ndarray,
+        wavelength_unit:Literal["AA","nm","um"]="nm",
+        ) -> "SyntheticPhotometry":
+        """
+            - method to create an instance from transmission curves stored in local files
+
+            Parameters
+            ----------
+                - `files`
+                    - `Dict[str,str]`
+                    - maps passband names to files containing the transmission curves
+                    - see `load_transmission()` for the file format
+                    - use the names in the `"name"` column of `Passbands.get_passband_specs()` to be able to use them in `Absmag.absmag()`
+                - `wavelength`
+                    - `np.ndarray`
+                    - shared wavelength grid
+                - `wavelength_unit`
+                    - `Literal["AA","nm","um"]`, optional
+                    - unit of `wavelength` and the wavelengths in `files`
+                    - the default is `"nm"`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `synphot`
+                    - `SyntheticPhotometry`
+                    - created instance
+
+            Comments
+            --------
+        """
+        return cls({pb: load_transmission(fn) for pb, fn in files.items()}, wavelength, wavelength_unit)
+
+    def response(self,
+        sed_unit:Literal["flam","fnu"]="flam",
+        ) -> np.ndarray:
+        """
+            - method returning the (cached) response matrix
+
+            Parameters
+            ----------
+                - `sed_unit`
+                    - `Literal["flam","fnu"]`, optional
+                    - unit of the SEDs the matrix gets applied to
+                    - `"flam"`
+                        - erg/s/cm^2/`wavelength_unit`
+                    - `"fnu"`
+                        - erg/s/cm^2/Hz
+                    - the default is `"flam"`
+
+            Raises
+            ------
+                - `ValueError`
+                    - if `sed_unit` is not valid
+
+            Returns
+            -------
+                - `response`
+                    - `np.ndarray`
+                    - has shape `(len(bands), len(wavelength))`
+                    - `seds @ response.T` yields fluxes relative to the AB zeropoint
+
+            Comments
+            --------
+        """
+        if sed_unit not in self._response:
+            wl = self.wavelength
+            w = np.zeros_like(wl)   #trapezoidal weights
+            w[:-1] += np.diff(wl)/2
+            w[1:]  += np.diff(wl)/2
+            c = C_LIGHT[self.wavelength_unit]
+            norm = (self.transmission*(FNU_AB*c/wl)*w).sum(axis=1, keepdims=True)
+            if sed_unit == "flam":
+                self._response[sed_unit] = self.transmission*wl*w/norm
+            elif sed_unit == "fnu":
+                self._response[sed_unit] = self.transmission*(c/wl)*w/norm
+            else:
+                raise ValueError(f"`sed_unit` has to be one of `'flam'`, `'fnu'` but is {sed_unit}")
+        return self._response[sed_unit]
+
+    def effective_wavelengths(self) -> np.ndarray:
+        """
+            - method returning the effective wavelength `int(lambda*T dlambda)/int(T dlambda)` of each passband
+            - directly comparable to the `"wavelength"` column of `Passbands.get_passband_specs()` (if `wavelength_unit=="nm"`)
+        """
+        return np.trapezoid(self.transmission*self.wavelength, self.wavelength, axis=1)/np.trapezoid(self.transmission, self.wavelength, axis=1)
+
+    def fluxes(self,
+        seds:np.ndarray,
+        wavelength:np.ndarray=None,
+        sed_unit:Literal["flam","fnu"]="flam",
+        ) -> np.ndarray:
+        """
+            - method to compute synthetic fluxes relative to the AB zeropoint
+
+            Parameters
+            ----------
+                - `seds`
+                    - `np.ndarray`
+                    - SEDs to integrate
+                    - has shape `(nseds, len(wavelength))`
+                - `wavelength`
+                    - `np.ndarray`, optional
+                    - wavelength grid `seds` are sampled on
+                    - has to be sorted ascending
+                    - if different from `self.wavelength`
+                        - `seds` get resampled onto `self.wavelength` (linear interpolation, vectorized over all SEDs)
+                        - SEDs are assumed to be `0` outside of `wavelength`
+                    - the default is `None`
+                        - `seds` are sampled on `self.wavelength`
+                - `sed_unit`
+                    - `Literal["flam","fnu"]`, optional
+                    - unit of `seds`
+                    - see `response()`
+                    - the default is `"flam"`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `fluxes`
+                    - `np.ndarray`
+                    - has shape `(nseds, len(bands))`
+
+            Comments
+            --------
+        """
+        seds = np.atleast_2d(np.asarray(seds, dtype=np.float64))
+        if wavelength is not None and not np.array_equal(wavelength, self.wavelength):
+            idx, w = resampling_matrix(np.asarray(wavelength, dtype=np.float64), self.wavelength)
+            seds = np.nan_to_num(seds[:,idx]*(1-w) + seds[:,idx+1]*w)
+        return seds @ self.response(sed_unit).T
+
+    def magnitudes(self,
+        seds:np.ndarray,
+        wavelength:np.ndarray=None,
+        sed_unit:Literal["flam","fnu"]="flam",
+        ) -> np.ndarray:
+        """
+            - method to compute synthetic AB magnitudes
+
+            Parameters
+            ----------
+                - `seds`
+                    - `np.ndarray`
+                    - SEDs to integrate
+                    - see `fluxes()`
+                - `wavelength`
+                    - `np.ndarray`, optional
+                    - see `fluxes()`
+                    - the default is `None`
+                - `sed_unit`
+                    - `Literal["flam","fnu"]`, optional
+                    - see `fluxes()`
+                    - the default is `"flam"`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `m`
+                    - `np.ndarray`
+                    - AB magnitudes
+                    - has shape `(nseds, len(bands))`
+                    - `np.nan` for non-positive fluxes
+
+            Comments
+            --------
+        """
+        f = self.fluxes(seds, wavelength, sed_unit)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = -2.5*np.log10(np.where(f > 0, f, np.nan))
+        return m
+
+    def absmag(self,
+        seds:np.ndarray,
+        z:Union[float,np.ndarray],
+        cosmo:"Cosmology",
+        wavelength:np.ndarray=None,
+        sed_unit:Literal["flam","fnu"]="flam",
+        fn_confstats:Union[str,bool,ConfStatsLUT]=False,
+        distmod_grid:Union[bool,DistmodGrid]=False,
+        ) -> Tuple[np.ndarray,np.ndarray,np.ndarray]:
+        """
+            - method to compute absolute magnitudes from synthetic photometry of observed-frame SEDs
+            - passes `magnitudes()` on to `Absmag.absmag()`
+
+            Parameters
+            ----------
+                - `seds`
+                    - `np.ndarray`
+                    - observed-frame SEDs
+                    - see `fluxes()`
+                - `z`
+                    - `float`, `np.ndarray`
+                    - redshift of each SED
+                    - has shape `(nseds,)` if not a scalar
+                - `cosmo`
+                    - `astropy.cosmology.Cosmology`
+                    - see `Absmag.absmag()`
+                - `wavelength`
+                    - `np.ndarray`, optional
+                    - see `fluxes()`
+                    - the default is `None`
+                - `sed_unit`
+                    - `Literal["flam","fnu"]`, optional
+                    - see `fluxes()`
+                    - the default is `"flam"`
+                - `fn_confstats`
+                    - `str`, `bool`, `ConfStatsLUT`, optional
+                    - see `Absmag.absmag()`
+                    - `bands` are used as passbands
+                    - the default is `False`
+                - `distmod_grid`
+                    - `bool`, `DistmodGrid`, optional
+                    - see `Absmag.absmag()`
+                    - the default is `False`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `M`
+                    - `np.ndarray`
+                    - absolute magnitudes
+                    - has shape `(nseds, len(bands))`
+                - `std`
+                    - `np.ndarray`
+                    - see `Absmag.absmag()`
+                - `offset`
+                    - `np.ndarray`
+                    - see `Absmag.absmag()`
+
+            Comments
+            --------
+                - no K-correction is applied
+        """
+        m = self.magnitudes(seds, wavelength, sed_unit)
+        z = np.asarray(z, dtype=np.float64).reshape(-1, 1)
+        return Absmag.absmag(m, z, cosmo, self.bands[None,:], fn_confstats, distmod_grid)
+
+_SYNPHOT_CACHE:Dict[Tuple,SyntheticPhotometry] = {}
+
+def get_synthetic_photometry(
+    files:Dict[str,str],
+    wavelength:np.ndarray,
+    wavelength_unit:Literal["AA","nm","um"]="nm",
+    ) -> SyntheticPhotometry:
+    """
+        - function to obtain a (cached) `SyntheticPhotometry` for transmission curves on disk
+
+        Parameters
+        ----------
+            - `files`
+                - `Dict[str,str]`
+                - maps passband names to files containing the transmission curves
+                - see `SyntheticPhotometry.from_files()`
+            - `wavelength`
+                - `np.ndarray`
+                - shared wavelength grid
+            - `wavelength_unit`
+                - `Literal["AA","nm","um"]`, optional
+                - unit of `wavelength` and the wavelengths in `files`
+                - the default is `"nm"`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `synphot`
+                - `SyntheticPhotometry`
+                - instance with resampled transmission curves and cached response matrices
+
+        Dependencies
+        ------------
+            - `hashlib`
+            - `numpy`
+            - `os`
+
+        Comments
+        --------
+            - instances are cached by the paths and modification times of `files`, `wavelength` and `wavelength_unit`
+    """
+
+    wavelength = np.asarray(wavelength, dtype=np.float64)
+    key = (
+        tuple((pb, os.path.realpath(fn), os.stat(fn).st_mtime_ns) for pb, fn in files.items()),
+        hashlib.sha1(wavelength.tobytes()).hexdigest(),
+        wavelength_unit,
+    )
+    synphot = _SYNPHOT_CACHE.get(key)
+    if synphot is None:
+        synphot = SyntheticPhotometry.from_files(files, wavelength, wavelength_unit)
+        _SYNPHOT_CACHE[key] = synphot
+
+    return synphot
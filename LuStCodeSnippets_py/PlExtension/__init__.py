@@ -0,0 +1,16 @@
+
+#%%lazy submodules
+import importlib as _importlib
+
+_SUBMODULES = ["plConvenience", "plNamespace"]
+
+def __getattr__(name:str):
+    """
+        - imports modules on first attribute access (PEP 562)
+    """
+    if name in _SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted([*globals(), *_SUBMODULES])
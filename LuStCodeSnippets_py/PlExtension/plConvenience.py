@@ -1,23 +1,57 @@
 
 #%%imports
+import multiprocessing as mp
+import numpy as np
+import os
 import polars as pl
-from typing import Union, Literal, List
+import time
+from typing import Dict, Iterator, Union, Literal, List, Tuple
 
 #%%definitions
+def _normalize_sort(
+    lf_vc:pl.LazyFrame,
+    subset:Union[str,List[str],List[pl.Expr]],
+    normalize:Literal[None,"frequency","pdf"]=None,
+    sort:bool=True, descending:bool=False,
+    ) -> pl.LazyFrame:
+    """
+        - applies `normalize` and `sort` (see `value_counts()`) to a frame of counts in the column `"count"`
+    """
+    if normalize is None:
+        pass
+    elif normalize == "frequency":
+        lf_vc = (lf_vc
+            .with_columns(pl.col("count")/pl.col("count").max())
+        )
+    elif normalize == "pdf":
+        lf_vc = (lf_vc
+            .with_columns(pl.col("count")/pl.col("count").sum())
+        )
+    else:
+        raise ValueError(f"`normalize` has to be one of `None`, `'frequency'`, `'pdf'` but is {normalize}")
+
+    if sort:
+        lf_vc = lf_vc.sort(pl.col("count"), descending=descending)
+    else:
+        lf_vc = lf_vc.sort(subset, descending=descending)
+
+    return lf_vc
+
 def value_counts(
-    df:pl.DataFrame,
+    df:Union[pl.DataFrame,pl.LazyFrame],
     subset:Union[str,List[str],List[pl.Expr]]=None,
     normalize:Literal[None,"frequency","pdf"]=None,
     sort:bool=True, descending:bool=False,
-    ) -> pl.DataFrame:
+    ) -> Union[pl.DataFrame,pl.LazyFrame]:
     """
         - function imitating behavior of `[pandas.DataFrame.value_counts()](https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.value_counts.html)`
 
         Parameters
         ----------
             - `df`
-                - `pl.DataFrame`
+                - `pl.DataFrame`, `pl.LazyFrame`
                 - dataframe the value-counts of which should be determined
+                - can be a lazy scan (i.e., `pl.scan_parquet()`, `pl.scan_csv()`)
             - `subset`
                 - `str`, `List[str]`, `List[pl.Expr]` optional
                 - subset of columns to use when counting unique combinations
@@ -54,8 +88,9 @@ def value_counts(
         Returns
         -------
             - `df_vc`
-                - `pl.DataFrame`
+                - `pl.DataFrame`, `pl.LazyFrame`
                 - resulting dataframe displaying unique combinations of `subset` alongside their number of occurrence
+                - same type as `df`
 
         Dependencies
         ------------
@@ -63,30 +98,786 @@ def value_counts(
 
         Comments
         --------
+            - counting, normalization and sorting are built as one lazy query
+                - for `pl.LazyFrame` input the query is returned without being executed
+                - execute it via `.collect(engine="streaming")` to count inputs that do not fit into memory
     """
     #default parameters
-    subset = df.columns if subset is None else subset
+    lf = df.lazy()
+    subset = lf.collect_schema().names() if subset is None else subset
 
-    df_vc = df.group_by(subset).agg(
+    lf_vc = lf.group_by(subset).agg(
         pl.len().alias("count")
     )
+    lf_vc = _normalize_sort(lf_vc, subset, normalize, sort, descending)
 
-    if normalize is None:
-        pass
-    elif normalize == "frequency":
-        df_vc = (df_vc
-            .with_columns(pl.col("count")/pl.col("count").max())         
+    return lf_vc if isinstance(df, pl.LazyFrame) else lf_vc.collect()
+
+def _iter_batches(
+    df:Union[pl.DataFrame,pl.LazyFrame],
+    batch_size:int,
+    ) -> Iterator[pl.DataFrame]:
+    """
+        - iterates over `df` in batches of (at most) `batch_size` rows
+        - `pl.LazyFrame` gets executed on the streaming engine
+    """
+    if isinstance(df, pl.LazyFrame):
+        yield from df.collect_batches(chunk_size=batch_size, maintain_order=False, engine="streaming")
+    else:
+        yield from df.iter_slices(batch_size)
+
+def _hll_rho(h:np.ndarray, precision:int) -> np.ndarray:
+    """
+        - position of the leftmost 1-bit (1-based) in the bits of `h` following the first `precision` bits
+        - only considers the next 32 bits (i.e., capped at `33`)
+    """
+    w = ((h << np.uint64(precision)) >> np.uint64(32)).astype(np.float64)  #exact in float64
+    return (33 - np.frexp(w)[1]).astype(np.uint8)
+
+_HLL_ALPHA = {16:0.673, 32:0.697, 64:0.709}   #bias correction for small numbers of registers (Flajolet et al., 2007)
+
+def _hll_estimate(registers:np.ndarray) -> float:
+    """
+        - HyperLogLog cardinality estimate (with linear counting for small cardinalities)
+    """
+    m = len(registers)
+    alpha = _HLL_ALPHA.get(m, 0.7213/(1 + 1.079/m))     #approximation only valid for `m >= 128`
+    e = alpha*m**2/np.sum(2.0**-registers.astype(np.float64))
+    zeros = np.count_nonzero(registers == 0)
+    if e <= 2.5*m and zeros > 0:
+        e = m*np.log(m/zeros)
+    return float(e)
+
+def value_counts_approx(
+    df:Union[pl.DataFrame,pl.LazyFrame],
+    subset:Union[str,List[str],List[pl.Expr]]=None,
+    k:int=100,
+    normalize:Literal[None,"frequency","pdf"]=None,
+    sort:bool=True, descending:bool=False,
+    width:int=2**18, depth:int=5,
+    batch_size:int=1_000_000,
+    seed:int=0,
+    ) -> pl.DataFrame:
+    """
+        - function to approximate `value_counts()` for the `k` most frequent values (heavy hitters) in bounded memory
+        - meant for columns with too many distinct values for an exact `group_by()`
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`, `pl.LazyFrame`
+                - dataframe the value-counts of which should be determined
+                - can be a lazy scan (i.e., `pl.scan_parquet()`, `pl.scan_csv()`)
+            - `subset`
+                - `str`, `List[str]`, `List[pl.Expr]` optional
+                - subset of columns to use when counting unique combinations
+                - the default is `None`
+                    - will consider all columns in `df`
+            - `k`
+                - `int`, optional
+                - number of heavy hitters to return
+                - the default is `100`
+            - `normalize`
+                - `Literal[None,"frequency","pdf"]`, optional
+                - how to normalize the counts
+                - see `value_counts()`
+                - `"pdf"` normalizes w.r.t. the total number of rows in `df` (not the `k` returned counts)
+                    - i.e., values are comparable to the output of `value_counts()`
+                - the default is `None`
+            - `sort`
+                - `bool`, optional
+                - see `value_counts()`
+                - the default is `True`
+            - `descending`
+                - `bool`, optional
+                - see `value_counts()`
+                - the default is `False`
+            - `width`
+                - `int`, optional
+                - number of counters per row of the count-min sketch
+                - the default is `2**18`
+            - `depth`
+                - `int`, optional
+                - number of rows (hash functions) of the count-min sketch
+                - the default is `5`
+            - `batch_size`
+                - `int`, optional
+                - number of rows of `df` to process at once
+                - the default is `1_000_000`
+            - `seed`
+                - `int`, optional
+                - seed of the hash function
+                - the default is `0`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `df_vc`
+                - `pl.DataFrame`
+                - (at most) `k` unique combinations of `subset` with the highest estimated counts alongside their estimated counts
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+
+        Comments
+        --------
+            - count-min sketch of `depth` x `width` counters
+                - memory: `8*depth*width` bytes plus `k` candidate rows, independent of the number of distinct values
+                - estimated counts never underestimate the true counts
+                - with probability `1-exp(-depth)` the overestimate of each count is at most `e/width*n_rows`
+                    - `~1e-5*n_rows` for the default settings
+            - candidates get tracked across batches
+                - after updating the sketch with a batch, all distinct values of the batch are queried
+                - the `k` candidates with the highest estimates are kept
+                - every value occurring more than `n_rows/k + e/width*n_rows` times is returned (with probability `1-exp(-depth)`)
+            - combinations of `subset` are identified by their 64 bit hash (`pl.struct(subset).hash(seed)`)
+            - use `n_unique_approx()` to estimate the number of distinct values
+    """
+    #default parameters
+    lf = df.lazy()
+    subset = lf.collect_schema().names() if subset is None else subset
+    subset = [subset] if isinstance(subset, (str, pl.Expr)) else subset
+    lf = lf.select(subset)
+    if isinstance(df, pl.DataFrame): lf = lf.collect()
+
+    cms = np.zeros((depth, width), dtype=np.int64)
+    rows = np.arange(depth, dtype=np.uint64)[:,None]
+    def _cms_idx(h:np.ndarray) -> np.ndarray:
+        #double hashing: `depth` indices from one 64 bit hash
+        return (((h & np.uint64(0xFFFFFFFF)) + rows*(h >> np.uint64(32))) % np.uint64(width)).astype(np.intp)
+
+    n_rows = 0
+    df_cand = None
+    for batch in _iter_batches(lf, batch_size):
+        if batch.height == 0: continue
+        n_rows += batch.height
+        batch = batch.with_columns(pl.struct(pl.all()).hash(seed).alias("__hash"))
+        idx = _cms_idx(batch["__hash"].to_numpy())
+        for i in range(depth):
+            cms[i] += np.bincount(idx[i], minlength=width)
+
+        #query all distinct values of the batch and keep the top `k` candidates
+        df_u = batch.unique("__hash")
+        if df_cand is not None:
+            df_u = pl.concat([df_cand.drop("count"), df_u]).unique("__hash", keep="first")
+        est = cms[np.arange(depth)[:,None], _cms_idx(df_u["__hash"].to_numpy())].min(axis=0)
+        df_cand = df_u.with_columns(count=pl.Series(est)).top_k(k, by="count")
+
+    if df_cand is None:
+        df_cand = lf.lazy().head(0).collect().with_columns(pl.lit(0, dtype=pl.get_index_type()).alias("count"), pl.lit(0, dtype=pl.UInt64).alias("__hash"))
+
+    df_vc = df_cand.drop("__hash").with_columns(pl.col("count").cast(pl.get_index_type()))
+    if normalize == "pdf":
+        df_vc = df_vc.with_columns(pl.col("count")/n_rows)
+        normalize = None
+    df_vc = _normalize_sort(df_vc.lazy(), lf.collect_schema().names(), normalize, sort, descending).collect()
+
+    return df_vc
+
+def n_unique_approx(
+    df:Union[pl.DataFrame,pl.LazyFrame],
+    subset:Union[str,List[str],List[pl.Expr]]=None,
+    precision:int=14,
+    batch_size:int=1_000_000,
+    seed:int=0,
+    ) -> float:
+    """
+        - function to estimate the number of unique combinations of `subset` in bounded memory (HyperLogLog)
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`, `pl.LazyFrame`
+                - dataframe the number of unique values of which should be determined
+                - can be a lazy scan (i.e., `pl.scan_parquet()`, `pl.scan_csv()`)
+            - `subset`
+                - `str`, `List[str]`, `List[pl.Expr]` optional
+                - subset of columns to use when counting unique combinations
+                - the default is `None`
+                    - will consider all columns in `df`
+            - `precision`
+                - `int`, optional
+                - number of hash bits used to select a register
+                - has to be in `[4, 18]`
+                - the default is `14`
+            - `batch_size`
+                - `int`, optional
+                - number of rows of `df` to process at once
+                - the default is `1_000_000`
+            - `seed`
+                - `int`, optional
+                - seed of the hash function
+                - the default is `0`
+
+        Raises
+        ------
+            - `ValueError`
+                - if `precision` is out of range
+
+        Returns
+        -------
+            - `n_unique`
+                - `float`
+                - estimated number of unique combinations of `subset`
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+
+        Comments
+        --------
+            - memory: `2**precision` bytes of registers
+            - relative standard error of `1.04/sqrt(2**precision)`
+                - `~0.8%` for the default settings
+            - small cardinalities (`<2.5*2**precision`) are estimated via linear counting
+    """
+    if not 4 <= precision <= 18:
+        raise ValueError(f"`precision` has to be in `[4, 18]` but is {precision}")
+
+    #default parameters
+    lf = df.lazy()
+    subset = lf.collect_schema().names() if subset is None else subset
+    subset = [subset] if isinstance(subset, (str, pl.Expr)) else subset
+    lf = lf.select(subset)
+    if isinstance(df, pl.DataFrame): lf = lf.collect()
+
+    registers = np.zeros(2**precision, dtype=np.uint8)
+    for batch in _iter_batches(lf, batch_size):
+        h = batch.select(pl.struct(pl.all()).hash(seed)).to_series().to_numpy()
+        np.maximum.at(registers, (h >> np.uint64(64-precision)).astype(np.intp), _hll_rho(h, precision))
+
+    return _hll_estimate(registers)
+
+def _merge_counts(runs:List[pl.DataFrame]) -> pl.DataFrame:
+    """
+        - merges partial counts (frames with key columns followed by `"count"`) by summing the counts of identical keys
+    """
+    return (pl.concat(runs)
+        .group_by(runs[0].columns[:-1])
+        .agg(pl.col("count").sum())
+    )
+
+class ValueCounter:
+    """
+        - class to incrementally count unique combinations of `subset` over a stream of batches
+        - exact counterpart of `value_counts()` that can be updated, merged and saved to disk
+
+        Attributes
+        ----------
+            - `subset`
+                - `str`, `List[str]`, `List[pl.Expr]`
+                - subset of columns to use when counting unique combinations
+                - `None` until the first call to `update()` if not passed upon instantiation
+                    - will consider all columns of the first batch
+            - `n_rows`
+                - `int`
+                - number of rows counted so far
+
+        Methods
+        -------
+            - `update()`
+            - `merge()`
+            - `compact()`
+            - `to_frame()`
+            - `save()`
+            - `load()`
+
+        Dependencies
+        ------------
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - partial counts are stored as runs in a log-structured merge (LSM) fashion
+                - `update()` counts the new batch and appends it as a new run
+                - whenever the newest run is at least half as large as the previous one, both get merged
+                - runs therefore roughly double in size from newest to oldest
+                - the cost of `update()` is amortized `O(len(batch)*log(n_runs))` instead of `O(len(history))`
+            - `to_frame()` merges all runs once and yields the same frame as `value_counts()` applied to the concatenation of all batches
+    """
+
+    def __init__(self,
+        subset:Union[str,List[str],List[pl.Expr]]=None,
+        ):
+
+        self.subset = subset
+        self.n_rows = 0
+        self._keys:List[str] = None
+        self._runs:List[pl.DataFrame] = []
+
+        return
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"keys={self._keys}, n_rows={self.n_rows}, runs={[r.height for r in self._runs]})"
         )
-    elif normalize == "pdf":
-        df_vc = (df_vc
-            .with_columns(pl.col("count")/pl.col("count").sum())         
+
+    def _push(self, run:pl.DataFrame):
+        self._runs.append(run)
+        while len(self._runs) > 1 and 2*self._runs[-1].height >= self._runs[-2].height:
+            run = _merge_counts(self._runs[-2:])
+            self._runs[-2:] = [run]
+        return
+
+    def update(self,
+        df:Union[pl.DataFrame,pl.LazyFrame],
+        ) -> "ValueCounter":
+        """
+            - method to add the counts of a new batch
+
+            Parameters
+            ----------
+                - `df`
+                    - `pl.DataFrame`, `pl.LazyFrame`
+                    - batch to count
+
+            Raises
+            ------
+                - `ValueError`
+                    - if the columns resulting from `subset` differ from previous batches
+
+            Returns
+            -------
+                - `self`
+                    - `ValueCounter`
+                    - updated instance
+
+            Comments
+            --------
+        """
+        lf = df.lazy()
+        if self.subset is None:
+            self.subset = lf.collect_schema().names()
+
+        df_vc = (lf
+            .group_by(self.subset)
+            .agg(pl.len().cast(pl.UInt64).alias("count"))
+            .collect()
         )
+        keys = df_vc.columns[:-1]
+        if self._keys is None:
+            self._keys = keys
+        elif keys != self._keys:
+            raise ValueError(f"`df` yields the columns {keys} but previous batches yielded {self._keys}")
+
+        self.n_rows += int(df_vc["count"].sum())
+        self._push(df_vc)
+
+        return self
+
+    def merge(self,
+        other:"ValueCounter",
+        ) -> "ValueCounter":
+        """
+            - method to add the counts of another `ValueCounter` (i.e., built in another process)
+
+            Parameters
+            ----------
+                - `other`
+                    - `ValueCounter`
+                    - instance to merge into `self`
+                    - will not be modified
+
+            Raises
+            ------
+                - `ValueError`
+                    - if `other` counts different columns than `self`
+
+            Returns
+            -------
+                - `self`
+                    - `ValueCounter`
+                    - updated instance
+
+            Comments
+            --------
+        """
+        if other._keys is None:
+            return self
+        if self._keys is None:
+            self.subset, self._keys = other.subset, other._keys
+        elif other._keys != self._keys:
+            raise ValueError(f"`other` counts the columns {other._keys} but `self` counts {self._keys}")
+
+        self.n_rows += other.n_rows
+        for run in sorted(other._runs, key=lambda r: r.height, reverse=True):
+            self._push(run)
+
+        return self
+
+    def compact(self) -> pl.DataFrame:
+        """
+            - method to merge all runs into one
+            - returns the (unsorted) counts
+        """
+        if len(self._runs) > 1:
+            self._runs = [_merge_counts(self._runs)]
+        return self._runs[0] if len(self._runs) > 0 else None
+
+    def to_frame(self,
+        normalize:Literal[None,"frequency","pdf"]=None,
+        sort:bool=True, descending:bool=False,
+        ) -> pl.DataFrame:
+        """
+            - method to obtain the counts in the format of `value_counts()`
+
+            Parameters
+            ----------
+                - `normalize`
+                    - `Literal[None,"frequency","pdf"]`, optional
+                    - see `value_counts()`
+                    - the default is `None`
+                - `sort`
+                    - `bool`, optional
+                    - see `value_counts()`
+                    - the default is `True`
+                - `descending`
+                    - `bool`, optional
+                    - see `value_counts()`
+                    - the default is `False`
+
+            Raises
+            ------
+                - `ValueError`
+                    - if nothing has been counted yet
+
+            Returns
+            -------
+                - `df_vc`
+                    - `pl.DataFrame`
+                    - see `value_counts()`
+
+            Comments
+            --------
+        """
+        df_vc = self.compact()
+        if df_vc is None:
+            raise ValueError("nothing has been counted yet. call `update()` first")
+        lf_vc = df_vc.lazy().with_columns(pl.col("count").cast(pl.get_index_type()))
+        return _normalize_sort(lf_vc, self._keys, normalize, sort, descending).collect()
+
+    def save(self,
+        fn:str,
+        ):
+        """
+            - method to store the counts as parquet file
+            - merges all runs before saving
+        """
+        df_vc = self.compact()
+        if df_vc is None:
+            raise ValueError("nothing has been counted yet. call `update()` first")
+        df_vc.write_parquet(fn)
+        return
+
+    @classmethod
+    def load(cls,
+        fn:str,
+        ) -> "ValueCounter":
+        """
+            - method to restore an instance stored via `save()`
+            - further batches have to contain the columns of the stored counts
+        """
+        df_vc = pl.read_parquet(fn)
+        vc = cls(subset=df_vc.columns[:-1])
+        vc._keys = df_vc.columns[:-1]
+        vc.n_rows = int(df_vc["count"].sum())
+        vc._runs = [df_vc]
+        return vc
+
+def _scan_partition(path:str) -> pl.LazyFrame:
+    """
+        - lazily scans a partition based on its file extension
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in [".parquet", ".pq"]:
+        return pl.scan_parquet(path)
+    elif ext == ".csv":
+        return pl.scan_csv(path)
     else:
-        raise ValueError(f"`count` has to be one of `None`, `'frequency'`, `'pdf'` but is {normalize}")
+        raise ValueError(f"extension of `path` has to be one of `.parquet`, `.pq`, `.csv` but is {ext}")
 
-    if sort:
-        df_vc = df_vc.sort(pl.col("count"), descending=descending)
+def _count_partition(
+    args:Tuple[str,Union[str,List[str],List[pl.Expr]]],
+    ) -> Tuple[pl.DataFrame,Dict]:
+    """
+        - counts unique combinations of `subset` in one partition
+        - returns the partial counts alongside timing information
+    """
+    path, subset = args
+    t0 = time.perf_counter()
+    lf = _scan_partition(path)
+    df_vc = (lf
+        .group_by(lf.collect_schema().names() if subset is None else subset)
+        .agg(pl.len().cast(pl.UInt64).alias("count"))
+        .collect()
+    )
+    timing = dict(
+        path=path, n_rows=int(df_vc["count"].sum()), n_groups=df_vc.height,
+        seconds=time.perf_counter() - t0, pid=os.getpid(),
+    )
+    return df_vc, timing
+
+def value_counts_many(
+    paths:List[str],
+    subset:Union[str,List[str],List[pl.Expr]]=None,
+    normalize:Literal[None,"frequency","pdf"]=None,
+    sort:bool=True, descending:bool=False,
+    workers:int=None,
+    chunksize:int=None,
+    fanin:int=8,
+    ) -> Tuple[pl.DataFrame,pl.DataFrame]:
+    """
+        - function to compute `value_counts()` over many partitions (files) on multiple cores
+
+        Parameters
+        ----------
+            - `paths`
+                - `List[str]`
+                - partitions to count
+                - `.parquet`, `.pq` or `.csv` files
+            - `subset`
+                - `str`, `List[str]`, `List[pl.Expr]` optional
+                - subset of columns to use when counting unique combinations
+                - the default is `None`
+                    - will consider all columns in each partition
+            - `normalize`
+                - `Literal[None,"frequency","pdf"]`, optional
+                - see `value_counts()`
+                - the default is `None`
+            - `sort`
+                - `bool`, optional
+                - see `value_counts()`
+                - the default is `True`
+            - `descending`
+                - `bool`, optional
+                - see `value_counts()`
+                - the default is `False`
+            - `workers`
+                - `int`, optional
+                - number of worker processes
+                - the default is `None`
+                    - will use `os.cpu_count()`
+            - `chunksize`
+                - `int`, optional
+                - number of partitions sent to a worker at once
+                - the default is `None`
+                    - will split `paths` into `4*workers` tasks
+            - `fanin`
+                - `int`, optional
+                - number of partial counts merged per task during the reduction
+                - the default is `8`
+
+        Raises
+        ------
+            - `ValueError`
+                - if `paths` is empty
+
+        Returns
+        -------
+            - `df_vc`
+                - `pl.DataFrame`
+                - see `value_counts()`
+            - `df_timings`
+                - `pl.DataFrame`
+                - one row per partition (in the order of `paths`)
+                - columns
+                    - `"path"`
+                    - `"n_rows"`: number of rows in the partition
+                    - `"n_groups"`: number of unique combinations in the partition
+                    - `"seconds"`: wall time spent on scanning and counting the partition
+                    - `"pid"`: process id of the worker that processed the partition
+
+        Dependencies
+        ------------
+            - `multiprocessing`
+            - `os`
+            - `polars`
+            - `time`
+            - `typing`
+
+        Comments
+        --------
+            - every partition gets opened, decoded and counted in a worker process
+                - scales when the bottleneck is opening and decoding many small files one after another
+            - partial counts get combined via a tree reduction
+                - in each round groups of `fanin` partial counts get merged in parallel
+                - `ceil(log_fanin(len(paths)))` rounds
+            - `normalize` and `sort` get applied once after the reduction
+            - uses the `"spawn"` start method
+                - call from within an `if __name__ == "__main__":` block in scripts
+            - runs in the calling process for `workers==1`
+    """
+
+    if len(paths) == 0:
+        raise ValueError("`paths` has to contain at least one partition")
+
+    #default parameters
+    workers = os.cpu_count() if workers is None else workers
+    chunksize = max(1, -(-len(paths)//(4*workers))) if chunksize is None else chunksize
+    tasks = [(path, subset) for path in paths]
+
+    def _reduce(mapper) -> Tuple[pl.DataFrame,List[Dict]]:
+        results = list(mapper(_count_partition, tasks))
+        partials = [r[0] for r in results]
+        while len(partials) > 1:
+            partials = list(mapper(_merge_counts, [partials[i:i+fanin] for i in range(0, len(partials), fanin)]))
+        return partials[0], [r[1] for r in results]
+
+    if workers == 1:
+        df_vc, timings = _reduce(map)
     else:
-        df_vc = df_vc.sort(subset, descending=descending)
+        with mp.get_context("spawn").Pool(workers) as pool:
+            df_vc, timings = _reduce(lambda fn, it: pool.imap(fn, it, chunksize=chunksize if fn is _count_partition else 1))
+
+    df_vc = df_vc.with_columns(pl.col("count").cast(pl.get_index_type()))
+    df_vc = _normalize_sort(df_vc.lazy(), df_vc.columns[:-1], normalize, sort, descending).collect()
+    df_timings = pl.DataFrame(timings, schema=dict(path=pl.String, n_rows=pl.UInt64, n_groups=pl.UInt64, seconds=pl.Float64, pid=pl.Int64))
+
+    return df_vc, df_timings
+
+def _bin_index(
+    col:str, edges:np.ndarray,
+    ) -> pl.Expr:
+    """
+        - expression assigning the (integer) bin index within `edges` to each value of `col`
+        - same assignment as `np.histogram2d()`, i.e., `edges[idx] <= x < edges[idx+1]`
+        - values equal to the upper edge get assigned to the last bin
+        - values outside of `edges` (and `NaN`) get assigned `null`
+    """
+    nbins = len(edges) - 1
+    x = pl.col(col).cast(pl.Float64)
+    idx = pl.lit(pl.Series(edges, dtype=pl.Float64)).search_sorted(x, side="right").cast(pl.Int64) - 1
+    idx = pl.when(x == edges[-1]).then(nbins-1).otherwise(idx)
+    return (pl.when((x >= edges[0]) & (x <= edges[-1]))
+        .then(idx)
+        .otherwise(None)
+        .cast(pl.Int64)
+    )
+
+def hist2d(
+    df:Union[pl.DataFrame,pl.LazyFrame],
+    x:str, y:str,
+    bins:Union[int,Tuple[int,int],Tuple[np.ndarray,np.ndarray]]=10,
+    trange:Tuple[Tuple[float,float],Tuple[float,float]]=None,
+    normalize:Literal[None,"frequency","pdf"]=None,
+    ) -> Tuple[np.ndarray,np.ndarray,np.ndarray]:
+    """
+        - function to compute a 2d histogram of two columns without materializing them in numpy
+        - polars equivalent of `np.histogram2d()`
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`, `pl.LazyFrame`
+                - dataframe containing the data to bin
+                - can be a lazy scan (i.e., `pl.scan_parquet()`, `pl.scan_csv()`)
+            - `x`
+                - `str`
+                - column to bin along the x-axis
+            - `y`
+                - `str`
+                - column to bin along the y-axis
+            - `bins`
+                - `int`, `Tuple[int,int]`, `Tuple[np.ndarray,np.ndarray]`, optional
+                - binning to use
+                - one of
+                    - `int`
+                        - number of uniform bins in both directions
+                    - `Tuple[int,int]`
+                        - number of uniform bins in x- and y-direction
+                    - `Tuple[np.ndarray,np.ndarray]`
+                        - (monotonically increasing) bin edges in x- and y-direction
+                - the default is `10`
+            - `trange`
+                - `Tuple[Tuple[float,float],Tuple[float,float]]`, optional
+                - `((xmin, xmax), (ymin, ymax))` spanned by uniform bins
+                - ignored for explicitly passed bin edges
+                - the default is `None`
+                    - will use the minimum and maximum of `x` and `y`
+            - `normalize`
+                - `Literal[None,"frequency","pdf"]`, optional
+                - how to normalize the counts
+                - see `value_counts()`
+                - `"pdf"` ensures that `H.sum() == 1`
+                - the default is `None`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `H`
+                - `np.ndarray`
+                - (normalized) counts
+                - has shape `(len(yedges)-1, len(xedges)-1)`
+                    - i.e., rows correspond to `y`
+                    - can directly be passed to `ax.pcolormesh(xedges, yedges, H)` and `Elements.pcolormesh_text(ax, H)`
+            - `xedges`
+                - `np.ndarray`
+                - bin edges along the x-axis
+            - `yedges`
+                - `np.ndarray`
+                - bin edges along the y-axis
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - bin indices are computed as integer expressions and counted via `group_by()`
+                - only the counts of non-empty bins get materialized
+                - for `pl.LazyFrame` input the query gets executed on the streaming engine
+            - bin indices are found via `search_sorted()` against the edges (also for uniform bins)
+                - avoids floating-point errors of arithmetic binning at (interior and upper) edges
+            - values equal to the upper edge get assigned to the last bin
+            - values outside of the binning range, `null` and `NaN` get ignored
+            - `H` is transposed w.r.t. the output of `np.histogram2d()`
+    """
+
+    #default parameters
+    lf = df.lazy()
+    nbins = (bins, bins) if isinstance(bins, (int, np.integer)) else bins
+    uniform = [isinstance(b, (int, np.integer)) for b in nbins]
+    if trange is None and any(uniform):
+        lims = lf.select(
+            pl.col(x).cast(pl.Float64).fill_nan(None).min().alias("xmin"), pl.col(x).cast(pl.Float64).fill_nan(None).max().alias("xmax"),
+            pl.col(y).cast(pl.Float64).fill_nan(None).min().alias("ymin"), pl.col(y).cast(pl.Float64).fill_nan(None).max().alias("ymax"),
+        ).collect(engine="streaming").row(0)
+        trange = ((lims[0], lims[1]), (lims[2], lims[3]))
+    edges = []
+    for b, u, r in zip(nbins, uniform, trange if trange is not None else (None, None)):
+        if u:
+            lo, hi = (0.0, 1.0) if r[0] is None else (float(r[0]), float(r[1]))
+            if lo == hi: lo, hi = lo - 0.5, hi + 0.5   #same as `np.histogram()`
+            edges.append(np.linspace(lo, hi, b+1))
+        else:
+            edges.append(np.asarray(b, dtype=np.float64))
+    xedges, yedges = edges
+
+    #count
+    lf_h = (lf
+        .select(
+            _bin_index(x, xedges).alias("__ix"),
+            _bin_index(y, yedges).alias("__iy"),
+        )
+        .drop_nulls()
+        .group_by("__ix", "__iy")
+        .agg(pl.len().alias("count"))
+    )
+    df_h = _normalize_sort(lf_h, ["__iy", "__ix"], normalize, sort=False).collect(engine="streaming")
+
+    #densify
+    H = np.zeros((len(yedges)-1, len(xedges)-1), dtype=np.float64)
+    H[df_h["__iy"].to_numpy(), df_h["__ix"].to_numpy()] = df_h["count"].to_numpy()
 
-    return df_vc
\ No newline at end of file
+    return H, xedges, yedges
@@ -0,0 +1,125 @@
+
+#%%imports
+import numpy as np
+import polars as pl
+from typing import TYPE_CHECKING, Union
+
+from ..Astronomy import Absmag
+from ..Astronomy.ConfStats import ConfStatsLUT, get_confstats
+from ..Astronomy.Distmod import DistmodGrid
+
+if TYPE_CHECKING:
+    from astropy.cosmology import Cosmology     #annotations only (deferred since astropy is slow to import)
+
+#%%definitions
+ABSMAG_DTYPE = pl.Struct({"M":pl.Float64, "std":pl.Float64, "offset":pl.Float64})
+
+@pl.api.register_expr_namespace("lust")
+class LuStExprNamespace:
+    """
+        - custom namespace of `pl.Expr`
+        - accessible via `pl.col(...).lust`
+        - gets registered upon importing this module
+
+        Methods
+        -------
+            - `absmag()`
+
+        Dependencies
+        ------------
+            - `astropy`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+    """
+
+    def __init__(self, expr:pl.Expr):
+        self._expr = expr
+
+    def absmag(self,
+        z:Union[str,pl.Expr],
+        cosmo:"Cosmology",
+        pb:Union[str,pl.Expr]=None,
+        lut:Union[str,bool,ConfStatsLUT]=False,
+        distmod_grid:Union[bool,DistmodGrid]=False,
+        ) -> pl.Expr:
+        """
+            - method to convert the apparent magnitudes in the expression to absolute magnitudes
+            - expression equivalent of `Absmag.absmag()`
+
+            Parameters
+            ----------
+                - `z`
+                    - `str`, `pl.Expr`
+                    - column (name) containing the redshifts
+                - `cosmo`
+                    - `astropy.cosmology.Cosmology`
+                    - cosmological model to consider for the conversion of `z` to a luminosity distance
+                - `pb`
+                    - `str`, `pl.Expr`, optional
+                    - column (name) containing the passbands
+                    - use `pl.lit()` to pass a single passband for all rows
+                    - the default is `None`
+                        - no confidence estimate made
+                - `lut`
+                    - `str`, `bool`, `ConfStatsLUT`, optional
+                    - lookup table containing confidence estimates
+                    - passed as `fn_confstats` to `Absmag.absmag()`
+                    - the default is `False`
+                        - no confidence estimate made
+                - `distmod_grid`
+                    - `bool`, `DistmodGrid`, optional
+                    - passed to `Absmag.absmag()`
+                    - the default is `False`
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `expr`
+                    - `pl.Expr`
+                    - struct expression with fields `"M"`, `"std"`, `"offset"`
+                    - named `"absmag"`
+                    - use `.struct.unnest()` to obtain individual columns
+
+            Comments
+            --------
+                - elementwise, i.e., can be used in `pl.LazyFrame` queries executed on the streaming engine
+                - operates on whole batches
+                    - `Absmag.absmag()` gets called once per batch and unique passband
+                    - passbands never get converted to python objects
+        """
+
+        #parse inputs
+        z  = pl.col(z) if isinstance(z, str) else z
+        pb = pl.lit(None, dtype=pl.String) if pb is None else (pl.col(pb) if isinstance(pb, str) else pb)
+        lut = get_confstats(lut) if isinstance(lut, (str, ConfStatsLUT)) else lut
+
+        def _absmag_batch(s:pl.Series) -> pl.Series:
+            m_b  = s.struct.field("m").cast(pl.Float64).to_numpy()
+            z_b  = s.struct.field("z").cast(pl.Float64).to_numpy()
+            pb_b = s.struct.field("pb")
+
+            #process per passband
+            M       = np.empty(len(s))
+            std     = np.full(len(s), np.nan)
+            offset  = np.full(len(s), np.nan)
+            for pb_u in pb_b.unique().to_list():
+                mask = (pb_b.is_null() if pb_u is None else (pb_b == pb_u).fill_null(False)).to_numpy()
+                if mask.all():
+                    M, std, offset = (np.atleast_1d(r) for r in Absmag.absmag(m_b, z_b, cosmo, pb_u, lut, distmod_grid))
+                else:
+                    M[mask], std[mask], offset[mask] = Absmag.absmag(m_b[mask], z_b[mask], cosmo, pb_u, lut, distmod_grid)
+
+            return pl.DataFrame(dict(M=M, std=std, offset=offset)).to_struct("absmag")
+
+        expr = (pl.struct(self._expr.alias("m"), z.alias("z"), pb.cast(pl.String).alias("pb"))
+            .map_batches(_absmag_batch, return_dtype=ABSMAG_DTYPE, is_elementwise=True)
+            .alias("absmag")
+        )
+
+        return expr
@@ -1,11 +1,220 @@
 #%%imports
+import matplotlib.artist as martist
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+import matplotlib.text as mtext
 import numpy as np
 from typing import Dict, Tuple, Union
 
 
 #%%definitions
+class TextCollection(martist.Artist):
+    """
+        - artist drawing many single-styled text labels at once
+        - behaves like a collection of `ax.text()` calls sharing all properties except for position, label and color
+
+        Attributes
+        ----------
+            - `xy`
+                - `np.ndarray`
+                - positions of the labels in coordinates of `transform`
+                - has shape `(n, 2)`
+            - `labels`
+                - `np.ndarray`
+                - labels to draw
+                - has shape `(n,)`
+            - `colors`
+                - `np.ndarray`
+                - RGBA colors of the labels
+                - has shape `(n, 4)`
+
+        Methods
+        -------
+            - `set_data()`
+            - `draw()`
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `typing`
+
+        Comments
+        --------
+            - all text properties (font, alignment, rotation, ...) get parsed once into a template `mtext.Text`
+            - glyph layout gets computed once per unique label (and dpi) and cached
+                - i.e., a matrix of `n` cells but `k` distinct labels requires only `k` layouts
+            - drawing passes all labels directly to `renderer.draw_text()`
+                - no `mtext.Text` artist per label
+            - clipping follows `clip_on` of the template (`ax.text()` does not clip by default)
+            - relies on private internals of `mtext.Text` (`_get_layout()`, `_preprocess_math()`, `_antialiased`)
+                - if those are unavailable or changed their signature (`AttributeError`, `TypeError`), labels get drawn one by one through the template instead
+                - i.e., same output as one `ax.text()` per label but without the speedup
+            - labels with a box (`bbox`) or wrapping (`wrap=True`) always get drawn one by one through the template
+    """
+
+    def __init__(self,
+        xy:np.ndarray, labels:np.ndarray,
+        colors:np.ndarray=None,
+        **text_kwargs,
+        ):
+
+        self._template = mtext.Text(0, 0, "", **text_kwargs)
+        super().__init__()
+        self.update_from(self._template)
+        self.set_zorder(self._template.get_zorder())
+        self.set_clip_on(self._template.get_clip_on())
+        if "transform" in text_kwargs: self.set_transform(text_kwargs["transform"])
+
+        self._layout_cache:Dict[Tuple,list] = {}
+        self._batched_draw = True
+        self.set_data(xy, labels, colors)
+
+        return
+
+    def set_data(self,
+        xy:np.ndarray, labels:np.ndarray,
+        colors:np.ndarray=None,
+        ):
+        """
+            - method to replace positions, labels and (optionally) colors of the drawn labels
+
+            Parameters
+            ----------
+                - `xy`
+                    - `np.ndarray`
+                    - positions of the labels
+                    - has shape `(n, 2)`
+                - `labels`
+                    - `np.ndarray`
+                    - labels to draw
+                    - has shape `(n,)`
+                - `colors`
+                    - `np.ndarray`, optional
+                    - RGBA colors of the labels
+                    - has shape `(n, 4)`
+                    - the default is `None`
+                        - will use the `color` of the template for all labels
+
+            Raises
+            ------
+
+            Returns
+            -------
+
+            Comments
+            --------
+        """
+        self.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.labels = np.asarray(labels, dtype=str).reshape(-1)
+        if colors is None:
+            colors = mcolors.to_rgba(self._template.get_color())
+        self.colors = np.broadcast_to(np.asarray(colors, dtype=np.float64), (len(self.labels), 4))
+        self._labels_u, self._labels_idx = np.unique(self.labels, return_inverse=True)
+        self.stale = True
+        return
+
+    def set_figure(self, fig):
+        super().set_figure(fig)
+        self._template.set_figure(fig)
+        return
+
+    def _get_layout(self, renderer, label:str) -> list:
+        """
+            - returns lines and their offsets (in pixels) w.r.t. the anchor of `label`
+            - cached by label and dpi
+        """
+        key = (label, self.get_figure(root=True).dpi)
+        if key not in self._layout_cache:
+            self._template.set_text(label)
+            _, info, _ = self._template._get_layout(renderer)
+            self._layout_cache[key] = [
+                (*self._template._preprocess_math(line), x, y) for line, _, (x, y) in info
+            ]
+        return self._layout_cache[key]
+
+    def _draw_unbatched(self, renderer):
+        """
+            - fallback drawing every label through the (public) `draw()` of the template
+            - equivalent to one `ax.text()` per label
+        """
+        color = self._template.get_color()
+        self._template.set_transform(self.get_transform())
+        self._template.set_clip_box(self.get_clip_box())
+        self._template.set_clip_path(self.get_clip_path())
+        for i in range(len(self.labels)):
+            self._template.set_position(self.xy[i])
+            self._template.set_text(self.labels[i])
+            self._template.set_color(self.colors[i])
+            self._template.draw(renderer)
+        self._template.set_color(color)
+        return
+
+    @martist.allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible() or len(self.labels) == 0:
+            return
+
+        #features only supported by `mtext.Text.draw()` (boxes around and wrapping of labels)
+        if self._template.get_bbox_patch() is not None or self._template.get_wrap():
+            self._draw_unbatched(renderer)
+            self.stale = False
+            return
+
+        #private `mtext.Text` internals might change between matplotlib versions
+        if self._batched_draw:
+            try:
+                layouts = [self._get_layout(renderer, l) for l in self._labels_u]
+                antialiased = self._template._antialiased
+            except (AttributeError, TypeError):
+                self._batched_draw = False
+                self._layout_cache.clear()
+        if not self._batched_draw:
+            self._draw_unbatched(renderer)
+            self.stale = False
+            return
+
+        renderer.open_group("textcollection", self.get_gid())
+
+        #all positions at once
+        pos = self.get_transform().transform(self.xy)
+        finite = np.isfinite(pos).all(axis=1)
+        canvasw, canvash = renderer.get_canvas_width_height()
+        flipy = renderer.flipy()
+
+        gc = renderer.new_gc()
+        gc.set_alpha(self._template.get_alpha())
+        gc.set_url(self._template.get_url())
+        gc.set_antialiased(antialiased)
+        gc.set_snap(self.get_snap())
+        self._set_gc_clip(gc)
+
+        prop = self._template.get_fontproperties()
+        angle = self._template.get_rotation()
+        usetex = self._template.get_usetex()
+        if self._template.get_path_effects():
+            from matplotlib.patheffects import PathEffectRenderer
+            textrenderer = PathEffectRenderer(self._template.get_path_effects(), renderer)
+        else:
+            textrenderer = renderer
+
+        for i in np.flatnonzero(finite):
+            gc.set_foreground(self.colors[i], isRGBA=True)
+            for line, ismath, dx, dy in layouts[self._labels_idx[i]]:
+                x = pos[i,0] + dx
+                y = pos[i,1] + dy
+                if flipy: y = canvash - y
+                if usetex:
+                    textrenderer.draw_tex(gc, x, y, line, prop, angle)
+                else:
+                    textrenderer.draw_text(gc, x, y, line, prop, angle, ismath=ismath)
+
+        gc.restore()
+        renderer.close_group("textcollection")
+        self.stale = False
+
+        return
+
 def pcolormesh_text(
     ax:plt.Axes,
     X:np.ndarray,
@@ -14,7 +223,9 @@ def pcolormesh_text(
     numformat:str=None,
     xoffset:float=0.5, yoffset:float=0.5,
     text_kwargs:Dict=None,
-    ):
+    batched:bool=False,
+    lod:bool=False, lod_min_px:float=None,
+    ) -> Union[TextCollection,None]:
     """
         - function to add labels to the cells of a `ax.pcolormesh()`
 
@@ -62,12 +273,38 @@ def pcolormesh_text(
                 - `Dict`, optional
                 - kwargs to pass to `ax.text()`
                 - the default is `dict(ha="center", va="center")`
+            - `batched`
+                - `bool`, optional
+                - whether to draw all labels through a single `TextCollection`
+                - recommended for large `X`
+                - the default is `False`
+                    - will create one `ax.text()` per cell
+            - `lod`
+                - `bool`, optional
+                - whether to use level-of-detail (LOD) mode
+                - if `True`
+                    - implies `batched==True`
+                    - only labels of cells within the current view get drawn
+                    - no labels get drawn if cells are smaller than `lod_min_px`
+                    - labels get updated whenever the view limits or the figure size change
+                - recommended for interactive exploration of large `X`
+                - the default is `False`
+            - `lod_min_px`
+                - `float`, optional
+                - minimum size of a cell (width and height in pixels) for its label to be drawn
+                - only relevant if `lod==True`
+                - the default is `None`
+                    - will use 1.5 times the fontsize in pixels
 
         Raises
         ------
 
         Returns
         -------
+            - `tc`
+                - `TextCollection`, `None`
+                - artist containing all labels
+                - `None` if `batched==False`
 
         Dependencies
         ------------
@@ -77,6 +314,13 @@ def pcolormesh_text(
 
         Comments
         --------
+            - for `batched==True`
+                - all labels get formatted in one pass via `np.char.mod()`
+                - the output looks the same as for `batched==False`, but only one artist gets created
+            - for `lod==True`
+                - labels get updated via callbacks on `"xlim_changed"`, `"ylim_changed"` of `ax` and `"resize_event"` of the canvas
+                - cost of an update is proportional to the number of visible cells, not to `X.size`
+                - call `tc.lod_disconnect()` to stop updating
     """
 
     #default parameters
@@ -99,6 +343,53 @@ def pcolormesh_text(
     colors = cmap((norm(colorvals)>0.5).astype(np.float64))
     colors[np.isnan(X)] = mcolors.to_rgba(nancolor)
 
+    #add text (level of detail)
+    if lod:
+        tc = TextCollection(
+            np.empty((0, 2)), np.empty(0, dtype=str), None,
+            **{"clip_on":False, "transform":ax.transData, **text_kwargs},
+        )
+        ax.add_artist(tc)
+        use_colors = "color" not in text_kwargs.keys()
+
+        def _update_lod(*args):
+            (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+            min_px = 1.5*tc._template.get_fontsize()*ax.get_figure(root=True).dpi/72 if lod_min_px is None else lod_min_px
+            if x1 <= x0 or y1 <= y0 or min(ax.bbox.width/(x1-x0), ax.bbox.height/(y1-y0)) < min_px:
+                tc.set_data(np.empty((0, 2)), np.empty(0, dtype=str), None)
+                return
+            j0, j1 = max(0, int(np.ceil(x0-xoffset))), min(X.shape[1], int(np.floor(x1-xoffset))+1)
+            i0, i1 = max(0, int(np.ceil(y0-yoffset))), min(X.shape[0], int(np.floor(y1-yoffset))+1)
+            ii, jj = np.mgrid[i0:max(i0, i1), j0:max(j0, j1)]
+            tc.set_data(
+                np.column_stack([jj.ravel()+xoffset, ii.ravel()+yoffset]),
+                np.char.mod(numformat, X[ii, jj]).ravel(),
+                colors[ii, jj].reshape(-1, 4) if use_colors else None,
+            )
+            return
+
+        #callbacks hold strong references to the closure
+        cids = [
+            (ax.callbacks, ax.callbacks.connect("xlim_changed", _update_lod)),
+            (ax.callbacks, ax.callbacks.connect("ylim_changed", _update_lod)),
+            (ax.figure.canvas.callbacks, ax.figure.canvas.mpl_connect("resize_event", _update_lod)),
+        ]
+        tc.lod_disconnect = lambda: [registry.disconnect(cid) for registry, cid in cids]
+        _update_lod()
+        return tc
+
+    #add text (batched)
+    if batched:
+        ii, jj = np.indices(X.shape)
+        tc = TextCollection(
+            np.column_stack([jj.ravel()+xoffset, ii.ravel()+yoffset]),
+            np.char.mod(numformat, X).ravel(),
+            None if "color" in text_kwargs.keys() else colors.reshape(-1, 4),
+            **{"clip_on":False, "transform":ax.transData, **text_kwargs},
+        )
+        ax.add_artist(tc)
+        return tc
+
     #add text
     for i in range(X.shape[0]):
         for j in range(X.shape[1]):
@@ -1,15 +1,343 @@
 
 #%%imports
 import polars as pl
+import matplotlib.collections as mcollections
+import matplotlib.dates as mdates
+import matplotlib.image as mimage
+import matplotlib.patches as mpatches
+import matplotlib.path as mpath
 import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import matplotlib.transforms as mtransforms
 import numpy as np
+from typing import Callable, Dict, List, Tuple, Union
 
 #%%definitions
+_CLOSED_RECT_CODES = np.array([mpath.Path.MOVETO] + 3*[mpath.Path.LINETO] + [mpath.Path.CLOSEPOLY], dtype=mpath.Path.code_type)
+
+def to_num(s:pl.Series) -> np.ndarray:
+    """
+        - function to convert a series of times/durations to floats as used for plotting
+
+        Parameters
+        ----------
+            - `s`
+                - `pl.Series`
+                - series to convert
+                - temporal, duration or numeric
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `s_num`
+                - `np.ndarray`
+                - converted values
+                - in units of `matplotlib.dates` (days) if `s` is temporal or a duration
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+
+        Comments
+        --------
+            - numeric series get cast to `pl.Float64`
+    """
+    if s.dtype == pl.Duration:
+        return s.dt.total_microseconds().to_numpy()/86400e6
+    elif s.dtype.is_temporal():
+        return mdates.date2num(s.to_numpy())
+    return s.cast(pl.Float64).to_numpy()
+
+def _bar_verts(y:np.ndarray, left:np.ndarray, width:np.ndarray, height:float=.9) -> np.ndarray:
+    """
+        - vertices of horizontal bars centered at `y`
+        - has shape `(len(y), 4, 2)`
+    """
+    verts = np.empty((len(y), 4, 2))
+    verts[:,:2,0] = left[:,None]
+    verts[:,2:,0] = (left + width)[:,None]
+    verts[:,[0,3],1] = (y - height/2)[:,None]
+    verts[:,[1,2],1] = (y + height/2)[:,None]
+    return verts
+
+def category_colors(
+    cats:pl.Series,
+    cmap:str=None,
+    vmin:float=0.0, vmax:float=1.0,
+    ) -> np.ndarray:
+    """
+        - function to obtain the colors of categories as used by all GANTT-plots
+
+        Parameters
+        ----------
+            - `cats`
+                - `pl.Series`
+                - sorted categories
+            - `cmap`
+                - `str`, optional
+                - colormap to sample the colors from
+                - the default is `None`
+                    - will use `plt.rcParams["image.cmap"]`
+            - `vmin`
+                - `float`, optional
+                - lower bound for colormap plotting
+                - the default is `0.0`
+            - `vmax`
+                - `float`, optional
+                - upper bound for colormap plotting
+                - the default is `1.0`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `colors`
+                - `np.ndarray`
+                - RGBA colors of `cats`
+                - has shape `(len(cats), 4)`
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+
+        Comments
+        --------
+            - used to keep colors consistent across `plot_gantt()`, `GanttView` and the plots of `GANTTAnalytics`
+    """
+    cmap = cmap if cmap is not None else plt.rcParams["image.cmap"]
+    return plt.get_cmap(cmap)(np.linspace(vmin,vmax,len(cats), endpoint=True))
+
+class _BarCollection(mcollections.PolyCollection):
+    """
+        - `PolyCollection` of bars with vertices that are already converted to floats
+        - skips the per-path unit conversion matplotlib applies to collections on axes with units (i.e., dates)
+    """
+    def have_units(self) -> bool:
+        return False
+
+def _decorate(
+    ax:plt.Axes,
+    cats:pl.Series, colors:np.ndarray,
+    task_label:Callable[[int],str],
+    ):
+    """
+        - adds legend, (thinned) task tick labels, grid and axis labels of the collection-based GANTT-charts
+        - `task_label` maps a row (`"#"`) to the label of its task
+    """
+    for cat, c in zip(cats, colors):
+        ax.add_artist(mpatches.Rectangle((np.nan, np.nan), 0, 0, color=c, label=cat))   #legend proxy
+    ax.yaxis.set_major_locator(mticker.MaxNLocator(nbins="auto", integer=True, min_n_ticks=1))
+    ax.yaxis.set_major_formatter(mticker.FuncFormatter(
+        lambda v, pos: task_label(int(v)) if float(v).is_integer() else ""
+    ))
+
+    ax.margins(y=0)
+    ax.legend(loc="upper left")
+    ax.grid()
+    ax.set_xlabel("Time [YYYY-MM]")
+    return
+
+class GanttLODImage(mimage.AxesImage):
+    """
+        - image artist rendering the aggregated occupancy of a GANTT-chart at the current view
+        - used by `plot_gantt()` for `lod==True`
+
+        Attributes
+        ----------
+            - `lf`
+                - `pl.LazyFrame`
+                - tasks with numeric columns `"__y"` (row), `"__s"` (start), `"__e"` (end), `"__c"` (category code)
+            - `colors`
+                - `np.ndarray`
+                - RGBA color of each category code
+                - has shape `(ncategories, 4)`
+            - `height`
+                - `float`
+                - height of a bar in rows
+            - `occupancy`
+                - `np.ndarray`
+                - number of tasks per category, pixel row and time bucket of the last aggregation
+                - has shape `(ncategories, nrows, nbuckets)`
+
+        Methods
+        -------
+            - `aggregate()`
+            - `lod_disconnect()`
+            - `get_extent()`
+            - `draw()`
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - the current view gets divided into one bucket per pixel (rows along y, time along x)
+            - tasks overlapping the view get binned into their first and last pixel row/time bucket via integer expressions
+                - the counts of the corners of these boxes get aggregated via `group_by()` on the streaming engine
+                - the occupancy follows from a 2d difference array (cumulative sums along both axes)
+                - i.e., the cost does not depend on the number of pixels a task covers
+            - each pixel shows
+                - the color mix of the categories weighted by their occupancy
+                - an opacity equal to the fraction of busy rows in the pixel (capped at `1`)
+            - the view gets re-aggregated upon drawing after `"xlim_changed"`, `"ylim_changed"` or `"resize_event"`
+                - i.e., zooming into a region shows more details
+            - the extent set via `set_extent()` (i.e., of all tasks) determines the data limits of the image
+                - the rendered pixels span the last aggregated view instead (see `get_extent()`)
+                - drawing does not modify data limits, sticky edges or view limits of the axes
+    """
+
+    def __init__(self,
+        ax:plt.Axes,
+        lf:pl.LazyFrame,
+        colors:np.ndarray,
+        height:float=.9,
+        **kwargs,
+        ):
+
+        super().__init__(ax, origin="lower", interpolation="nearest", **kwargs)
+        self.lf = lf
+        self.colors = np.asarray(colors)
+        self.height = height
+        self.occupancy = None
+        self._view = None
+        self._view_extent = None
+
+        #callbacks only flag the view as outdated => one aggregation per draw
+        def _invalidate(*args):
+            self._view = None
+            self.stale = True
+            return
+        self._cids = [
+            (ax.callbacks, ax.callbacks.connect("xlim_changed", _invalidate)),
+            (ax.callbacks, ax.callbacks.connect("ylim_changed", _invalidate)),
+            (ax.figure.canvas.callbacks, ax.figure.canvas.mpl_connect("resize_event", _invalidate)),
+        ]
+
+        return
+
+    def lod_disconnect(self):
+        """
+            - method to stop re-aggregating upon changes of the view
+        """
+        for registry, cid in self._cids: registry.disconnect(cid)
+        self._cids = []
+        return
+
+    def aggregate(self,
+        xlim:Tuple[float,float], ylim:Tuple[float,float],
+        shape:Tuple[int,int],
+        ) -> np.ndarray:
+        """
+            - method to compute the occupancy of the view `xlim` x `ylim` on a grid of `shape=(nrows, nbuckets)` pixels
+
+            Parameters
+            ----------
+                - `xlim`
+                    - `Tuple[float,float]`
+                    - time range of the view
+                - `ylim`
+                    - `Tuple[float,float]`
+                    - row range of the view
+                - `shape`
+                    - `Tuple[int,int]`
+                    - number of pixel rows and time buckets
+
+            Raises
+            ------
+
+            Returns
+            -------
+                - `occupancy`
+                    - `np.ndarray`
+                    - number of tasks per category, pixel row and time bucket
+                    - has shape `(ncategories, nrows, nbuckets)`
+
+            Comments
+            --------
+        """
+        (x0, x1), (y0, y1) = xlim, ylim
+        ny, nx = shape
+        def _bin(col:pl.Expr, lo:float, hi:float, n:int, offset:int=0) -> pl.Expr:
+            return (((col - lo)*(n/(hi - lo))).floor() + offset).clip(0, n).cast(pl.Int64)
+
+        df_corners = (self.lf
+            .filter(
+                (pl.col("__e") >= x0) & (pl.col("__s") <= x1)
+                & (pl.col("__y") + self.height/2 >= y0) & (pl.col("__y") - self.height/2 <= y1)
+            )
+            .select(
+                pl.col("__c"),
+                _bin(pl.col("__y") - self.height/2, y0, y1, ny).alias("__r0"),
+                _bin(pl.col("__y") + self.height/2, y0, y1, ny, 1).alias("__r1"),
+                _bin(pl.col("__s"), x0, x1, nx).alias("__b0"),
+                _bin(pl.col("__e"), x0, x1, nx, 1).alias("__b1"),
+            )
+            .group_by("__c", "__r0", "__r1", "__b0", "__b1")
+            .agg(pl.len().cast(pl.Int64).alias("__n"))
+            .collect(engine="streaming")
+        )
+
+        #2d difference array
+        d = np.zeros((len(self.colors), ny+1, nx+1), dtype=np.int64)
+        c, r0, r1, b0, b1, n = (df_corners[col].to_numpy() for col in df_corners.columns)
+        np.add.at(d, (c, r0, b0), n)
+        np.add.at(d, (c, r0, b1), -n)
+        np.add.at(d, (c, r1, b0), -n)
+        np.add.at(d, (c, r1, b1), n)
+        occupancy = d.cumsum(axis=1).cumsum(axis=2)[:,:ny,:nx]
+
+        return occupancy
+
+    def _update_view(self):
+        ax = self.axes
+        xlim, ylim = tuple(sorted(ax.get_xlim())), tuple(sorted(ax.get_ylim()))
+        shape = (max(1, int(np.ceil(ax.bbox.height))), max(1, int(np.ceil(ax.bbox.width))))
+        view = (xlim, ylim, shape)
+        if view == self._view: return
+        self._view = view
+
+        self.occupancy = self.aggregate(xlim, ylim, shape)
+        total = self.occupancy.sum(axis=0)
+        rows_per_px = max(1.0, (ylim[1] - ylim[0])/shape[0]/self.height)
+        rgba = np.zeros((*shape, 4))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rgba[...,:3] = np.einsum("cyx,ck->yxk", self.occupancy, self.colors[:,:3])/total[...,None]
+        rgba[...,3] = np.clip(total/rows_per_px, 0, 1)
+        rgba[total == 0] = 0
+        self.set_data(rgba)
+        self._view_extent = [*xlim, *ylim]
+        return
+
+    def get_extent(self) -> List[float]:
+        """
+            - extent of the rendered pixels (i.e., of the last aggregated view)
+            - extent passed to `set_extent()` before the first aggregation
+        """
+        return list(super().get_extent()) if self._view_extent is None else list(self._view_extent)
+
+    def draw(self, renderer):
+        self._update_view()
+        super().draw(renderer)
+        return
+
 def plot_gantt(
-    df:pl.DataFrame,
+    df:Union[pl.DataFrame,pl.LazyFrame],
     cmap:str=None,
     ax:plt.Axes=None,
     vmin:float=0.0, vmax:float=1.0,
+    fast:bool=False,
+    lod:bool=False,
     ) -> plt.Axes:
     """
         - function to plot a GANTT-chart based on a DataFrame of tasks
@@ -17,8 +345,9 @@ def plot_gantt(
         Parameters
         ----------
             - `df`
-                - `pl.DataFrame`
+                - `pl.DataFrame`, `pl.LazyFrame`
                 - dataframe containing the tasks to plot
+                - `pl.LazyFrame` only supported for `lod==True`
                 - has to have the following columns
                     - `"task"
                     - `"start"
@@ -40,6 +369,20 @@ def plot_gantt(
                 - upper bound for colormap plotting
                 - has to be between `0` and `1`
                 - the default is `1.0`
+            - `fast`
+                - `bool`, optional
+                - whether to draw all tasks through a single `PolyCollection`
+                - recommended for large schedules (`>~1e3` tasks)
+                - the default is `False`
+                    - will call `ax.barh()` once per category
+            - `lod`
+                - `bool`, optional
+                - whether to use level-of-detail (LOD) mode
+                - if `True`
+                    - draws the occupancy per category aggregated to pixel rows and time buckets instead of individual bars
+                    - re-aggregates whenever the view changes (see `GanttLODImage`)
+                - recommended for schedules with more tasks than the axes has vertical pixels
+                - the default is `False`
         
         Raises
         ------
@@ -59,6 +402,18 @@ def plot_gantt(
         Comments
         --------
             - one could also pass names of people to `"category"` if you prefer to group the tasks that way
+            - for `fast==True`
+                - category codes get computed in a single pass over `df`
+                - bars are drawn as one `PolyCollection` with per-bar colors
+                - temporal columns get converted via `matplotlib.dates.date2num()`
+                - legend entries are proxy patches (i.e., also picked up by later calls to `ax.legend()`)
+                - y-tick labels get thinned automatically (`MaxNLocator`) and show the `"task"` of the respective `"#"`
+            - for `lod==True`
+                - `df` only gets scanned to determine the extent and categories of the schedule
+                    - `"task"` is not required
+                - afterwards only the tasks within the current view get aggregated on each draw
+                - autoscaling of `ax` gets turned off
+                - y-ticks show `"#"`
 
     """
 
@@ -68,11 +423,37 @@ def plot_gantt(
         ax = fig.add_subplot(111)
     cmap = cmap if cmap is not None else plt.rcParams["image.cmap"]
 
+    #plot (level of detail)
+    if lod:
+        return _plot_gantt_lod(df.lazy(), cmap, ax, vmin, vmax)
+
     #get colors
-    colors = plt.get_cmap(cmap)(np.linspace(vmin,vmax,df["category"].n_unique(), endpoint=True))
+    cats = df["category"].unique().sort()
+    colors = category_colors(cats, cmap, vmin, vmax)
         
+    #plot (single collection)
+    if fast:
+        codes = df["category"].rank("dense").cast(pl.Int64).to_numpy() - 1
+        y = df["#"].cast(pl.Float64).to_numpy()
+        left = to_num(df["start"])
+        verts = _bar_verts(y, left, to_num(df["duration"]))
+        pc = _BarCollection(verts, facecolors=colors[codes], edgecolors="none", linewidths=0)
+        ax.add_collection(pc, autolim=False)
+        if len(left) > 0:
+            ax.update_datalim([np.nanmin(verts, axis=(0,1)), np.nanmax(verts, axis=(0,1))])    #no per-path extents needed for rectangles
+            pc.sticky_edges.x.append(float(np.nanmin(left)))   #no margin before the first task (same as `ax.barh()`)
+        if df["start"].dtype.is_temporal(): ax.xaxis_date()
+        ax.autoscale_view()
+
+        #thinned tick labels
+        tasks = np.full(int(y.max()) + 1 if len(y) > 0 else 0, "", dtype=object)
+        tasks[y.astype(np.int64)] = df["task"].to_numpy()
+        _decorate(ax, cats, colors, lambda i: tasks[i] if 0 <= i < len(tasks) else "")
+
+        return ax
+
     #plot
-    for cat, c in zip(sorted(df["category"].unique()), colors):
+    for cat, c in zip(cats, colors):
         ax.barh(
             df.filter(pl.col("category")==cat)["#"], 
             df.filter(pl.col("category")==cat)["duration"],
@@ -94,4 +475,321 @@ def plot_gantt(
     ax.set_xlabel("Time [YYYY-MM]")
 
     return ax
-# %%
+
+def _plot_gantt_lod(
+    lf:pl.LazyFrame,
+    cmap:str,
+    ax:plt.Axes,
+    vmin:float, vmax:float,
+    height:float=.9,
+    ) -> plt.Axes:
+    """
+        - LOD mode of `plot_gantt()`
+    """
+
+    #numeric columns (in units of `matplotlib.dates` for temporal data)
+    schema = lf.collect_schema()
+    temporal = schema["start"].is_temporal()
+    def _num(col:str) -> pl.Expr:
+        if schema[col] == pl.Duration:
+            return pl.col(col).dt.total_microseconds()/86400e6
+        elif schema[col].is_temporal():
+            return pl.col(col).cast(pl.Datetime("us")).dt.epoch("us")/86400e6 + float(mdates.date2num(np.datetime64("1970-01-01T00:00:00")))
+        return pl.col(col).cast(pl.Float64)
+
+    #categories and extent
+    cats = lf.select(pl.col("category").unique().sort()).collect(engine="streaming")["category"]
+    lf_num = lf.select(
+        pl.col("#").cast(pl.Float64).alias("__y"),
+        _num("start").alias("__s"),
+        (_num("start") + _num("duration")).alias("__e"),
+        pl.col("category").replace_strict(cats, pl.int_range(len(cats), eager=True), return_dtype=pl.Int64).alias("__c"),
+    )
+    ext = lf_num.select(
+        pl.col("__s").min(), pl.col("__e").max(), pl.col("__y").min().alias("__ymin"), pl.col("__y").max().alias("__ymax"),
+    ).collect(engine="streaming").row(0)
+
+    #plot
+    colors = category_colors(cats, cmap, vmin, vmax)
+    im = GanttLODImage(ax, lf_num, colors, height=height)
+    im.set_data(np.zeros((1, 1, 4)))    #placeholder until first draw
+    ax.add_image(im)
+    im.set_extent((ext[0], ext[1], ext[2] - height/2, ext[3] + height/2))  #data limits (the view gets set below)
+    ax.set_xlim(ext[0], ext[1] + 0.05*(ext[1] - ext[0]))    #margin as `ax.barh()`
+    ax.set_ylim(ext[2] - height/2, ext[3] + height/2)
+    ax.set_autoscale_on(False)
+    if temporal:
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.AutoDateFormatter(locator))
+    ax.yaxis.set_major_locator(mticker.MaxNLocator(nbins="auto", integer=True))
+    for cat, c in zip(cats, colors):
+        ax.add_artist(mpatches.Rectangle((np.nan, np.nan), 0, 0, color=c, label=cat))   #legend proxy
+
+    ax.legend(loc="upper left")
+    ax.grid()
+    ax.set_xlabel("Time [YYYY-MM]")
+
+    return ax
+
+class GanttView:
+    """
+        - class for live-updating GANTT-charts (i.e., dashboards of running jobs)
+        - keeps its artists alive and updates only the tasks that changed
+
+        Attributes
+        ----------
+            - `ax`
+                - `plt.Axes`
+                - axes the chart is drawn into
+            - `categories`
+                - `pl.Series`
+                - categories that can be displayed
+            - `colors`
+                - `np.ndarray`
+                - RGBA color of each category
+                - has shape `(len(categories), 4)`
+            - `key`
+                - `str`
+                - column identifying a task across updates
+            - `chunksize`
+                - `int`
+                - maximum number of bars per collection
+            - `autoscale`
+                - `bool`
+                - whether to rescale the view (full redraw) when tasks get added outside of it
+            - `n_tasks`
+                - `int`
+                - number of displayed tasks
+
+        Methods
+        -------
+            - `update()`
+            - `savefig()`
+            - `disconnect()`
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - live counterpart of `plot_gantt(fast=True)`
+                - same input columns, colors, legend and tick labels
+            - bars are stored in collections of `chunksize` bars each
+                - changed tasks get updated by overwriting the vertices of their bars in place
+                - new tasks get appended to the last collection
+                - i.e., no collection gets rebuilt
+            - after the initial (full) draw the background without bars is cached
+                - `update()` restores the background only within the region covered by the old and new bars of changed tasks
+                - only collections overlapping that region get redrawn (clipped to it) and blitted
+                - i.e., the cost of an update scales with the number of changed tasks and not with the history
+                - falls back to `canvas.draw_idle()` if the canvas does not support blitting or the view has to be rescaled
+            - collections are `animated` (i.e., get drawn by `GanttView` and not by the figure)
+                - use `savefig()` instead of `fig.savefig()`
+                - on screen bars are drawn on top of all other artists of `ax` (i.e., also on top of grid and legend)
+    """
+
+    def __init__(self,
+        df:pl.DataFrame,
+        ax:plt.Axes=None,
+        cmap:str=None,
+        vmin:float=0.0, vmax:float=1.0,
+        categories:List[str]=None,
+        key:str="#",
+        chunksize:int=4096,
+        autoscale:bool=True,
+        ):
+
+        #default values
+        if ax is None:  #create new figure if necessary
+            fig = plt.figure()
+            ax = fig.add_subplot(111)
+
+        self.ax = ax
+        self.categories = (df["category"].unique() if categories is None else pl.Series("category", categories)).sort()
+        self.colors = category_colors(self.categories, cmap, vmin, vmax)
+        self.key = key
+        self.chunksize = chunksize
+        self.autoscale = autoscale
+        self.n_tasks = 0
+
+        self._index:Dict = {}           #key -> position of the bar
+        self._tasks:Dict[int,str] = {}  #row -> task
+        self._chunks:List[_BarCollection] = []
+        self._facecolors:List[np.ndarray] = []
+        self._extents:List[np.ndarray] = []     #(xmin, ymin, xmax, ymax) per chunk
+        self._background = None
+        self._saving = False
+
+        self.update(df, redraw=False)
+        if len(df) > 0 and df["start"].dtype.is_temporal(): ax.xaxis_date()
+        ax.autoscale_view()
+        _decorate(ax, self.categories, self.colors, lambda i: self._tasks.get(i, ""))
+
+        self._cid = ax.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_tasks={self.n_tasks}, chunks={len(self._chunks)}, key={self.key!r})"
+
+    def _on_draw(self, event):
+        """
+            - caches the background after a full draw and draws the bars on top of it
+        """
+        canvas = self.ax.figure.canvas
+        if self._saving or (event is not None and event.canvas is not canvas): return     #bars already drawn by `savefig()`
+        self._background = canvas.copy_from_bbox(self.ax.bbox) if getattr(canvas, "supports_blit", False) else None
+        for pc in self._chunks: self.ax.draw_artist(pc)
+        return
+
+    def _new_chunk(self):
+        pc = _BarCollection([], edgecolors="none", linewidths=0, animated=True)
+        self.ax.add_collection(pc, autolim=False)
+        self._chunks.append(pc)
+        self._facecolors.append(np.zeros((self.chunksize, 4)))
+        self._extents.append(np.array([np.inf, np.inf, -np.inf, -np.inf]))
+        return
+
+    def update(self,
+        df:pl.DataFrame,
+        redraw:bool=True,
+        ) -> "GanttView":
+        """
+            - method to add new or modify existing tasks
+
+            Parameters
+            ----------
+                - `df`
+                    - `pl.DataFrame`
+                    - new or changed tasks
+                    - same columns as for `plot_gantt()` and `key`
+                    - tasks with a `key` that is already displayed get replaced
+                - `redraw`
+                    - `bool`, optional
+                    - whether to redraw the changed region
+                    - the default is `True`
+
+            Raises
+            ------
+                - `ValueError`
+                    - if `df` contains categories not in `categories`
+
+            Returns
+            -------
+                - `self`
+                    - `GanttView`
+                    - updated instance
+
+            Comments
+            --------
+        """
+        if len(df) == 0: return self
+        df = df.unique(self.key, keep="last", maintain_order=True)
+
+        #codes, vertices
+        codes = df["category"].replace_strict(self.categories, pl.int_range(len(self.categories), eager=True), default=None, return_dtype=pl.Int64)
+        if codes.null_count() > 0:
+            raise ValueError(f"`df` contains categories not in `categories` ({self.categories.to_list()}): {df.filter(codes.is_null())['category'].unique().to_list()}")
+        codes = codes.to_numpy()
+        y = df["#"].cast(pl.Float64).to_numpy()
+        verts = _bar_verts(y, to_num(df["start"]), to_num(df["duration"]))
+        self._tasks.update(zip(y.astype(np.int64).tolist(), df["task"].to_list()))
+
+        #positions of the bars (existing or appended)
+        pos = np.array([self._index.get(k, -1) for k in df[self.key].to_list()], dtype=np.int64)
+        new = np.flatnonzero(pos < 0)
+        pos[new] = self.n_tasks + np.arange(len(new))
+        self._index.update(zip(df[self.key].gather(new).to_list(), pos[new].tolist()))
+        self.n_tasks += len(new)
+
+        #update vertices in place
+        region = [np.nanmin(verts, axis=(0,1)), np.nanmax(verts, axis=(0,1))]
+        chunk_idx, slot_idx = np.divmod(pos, self.chunksize)
+        for c in np.unique(chunk_idx):
+            while c >= len(self._chunks): self._new_chunk()
+            pc = self._chunks[c]
+            paths = pc.get_paths()
+            for i in np.flatnonzero(chunk_idx == c):
+                v = np.concatenate([verts[i], verts[i,:1]])
+                if slot_idx[i] < len(paths):
+                    old = paths[slot_idx[i]].vertices
+                    region = [np.fmin(region[0], old.min(axis=0)), np.fmax(region[1], old.max(axis=0))]
+                    old[:] = v
+                else:
+                    paths.append(mpath.Path(v, _CLOSED_RECT_CODES))
+            self._facecolors[c][slot_idx[chunk_idx == c]] = self.colors[codes[chunk_idx == c]]
+            pc.set_facecolor(self._facecolors[c][:len(paths)])
+            ext = self._extents[c]
+            ext[:2] = np.fmin(ext[:2], np.nanmin(verts[chunk_idx == c], axis=(0,1)))
+            ext[2:] = np.fmax(ext[2:], np.nanmax(verts[chunk_idx == c], axis=(0,1)))
+            pc.stale = True
+
+        #limits
+        self.ax.update_datalim(region)
+        for pc in self._chunks[:1]:
+            pc.sticky_edges.x[:] = [float(min(e[0] for e in self._extents))]   #no margin before the first task (same as `ax.barh()`)
+
+        if redraw:
+            self._redraw(region)
+
+        return self
+
+    def _redraw(self, region:List[np.ndarray]):
+        """
+            - redraws the data-region `region=[(xmin, ymin), (xmax, ymax)]` via blitting
+        """
+        ax = self.ax
+        canvas = ax.figure.canvas
+
+        #full redraw if tasks leave the view
+        (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        outside = region[0][0] < x0 or region[1][0] > x1 or region[0][1] < y0 or region[1][1] > y1
+        if self._background is None or (outside and self.autoscale):
+            if outside and self.autoscale: ax.autoscale_view()
+            canvas.draw_idle()
+            return
+
+        #changed region in display coordinates (padded for antialiasing, snapped to pixels)
+        xy = np.sort(ax.transData.transform(np.array(region)), axis=0)
+        bbox = mtransforms.Bbox.intersection(mtransforms.Bbox([np.floor(xy[0]) - 2, np.ceil(xy[1]) + 2]), ax.bbox)
+        if bbox is None: return
+        bbox = mtransforms.Bbox([np.floor(bbox.p0), np.ceil(bbox.p1)])
+
+        canvas.restore_region(self._background, bbox=bbox, xy=self._background.get_extents()[:2])
+        for pc, ext in zip(self._chunks, self._extents):
+            if ext[0] > region[1][0] or ext[2] < region[0][0] or ext[1] > region[1][1] or ext[3] < region[0][1]: continue
+            pc.set_clip_box(bbox)
+            ax.draw_artist(pc)
+            pc.set_clip_box(ax.bbox)
+        canvas.blit(bbox)
+
+        return
+
+    def savefig(self, *args, **kwargs):
+        """
+            - method to save the figure including all bars
+            - passes `args` and `kwargs` to `fig.savefig()`
+        """
+        self._saving = True
+        for pc in self._chunks: pc.set_animated(False)
+        try:
+            self.ax.figure.savefig(*args, **kwargs)
+        finally:
+            for pc in self._chunks: pc.set_animated(True)
+            self._saving = False
+            self._background = None     #renderer might have changed (full redraw on next update)
+        return
+
+    def disconnect(self):
+        """
+            - method to stop caching the background upon full draws (bars will not be drawn anymore)
+        """
+        self.ax.figure.canvas.mpl_disconnect(self._cid)
+        return
+
+# %%
\ No newline at end of file
@@ -0,0 +1,612 @@
+
+#%%imports
+import polars as pl
+import matplotlib.pyplot as plt
+import numpy as np
+from typing import List, Literal, Tuple, Union
+
+from .GANTT import category_colors, to_num
+
+#%%definitions
+def _end(columns:List[str]) -> pl.Expr:
+    """
+        - expression for the end of each task (`"end"` or `"start" + "duration"`)
+    """
+    if "end" in columns:
+        return pl.col("end")
+    elif "duration" in columns:
+        return pl.col("start") + pl.col("duration")
+    raise ValueError(f"`df` has to have a column `'end'` or `'duration'` but has {columns}")
+
+def _intervals(df:pl.DataFrame) -> Tuple[np.ndarray,np.ndarray]:
+    """
+        - numeric start and end of each task (days in units of `matplotlib.dates` for temporal data)
+        - ends before the start get clipped to the start (i.e., zero-length tasks)
+    """
+    s = to_num(df["start"])
+    e = to_num(df["end"]) if "end" in df.columns else to_num(df.select(_end(df.columns))[:,0])
+    return s, np.maximum(e, s)
+
+def _groups(df:pl.DataFrame, by:str=None) -> Tuple[np.ndarray,pl.Series]:
+    """
+        - integer code of each task and sorted groups (same order as `plot_gantt()`)
+        - codes use the smallest integer type (i.e., `np.argsort(kind="stable")` uses radix sort)
+        - `by=None` puts all tasks into a single group `None`
+    """
+    if by is None:
+        return np.zeros(len(df), dtype=np.int8), pl.Series(by, [None])
+    groups = df[by].unique().sort()
+    codes = df[by].replace_strict(groups, pl.int_range(len(groups), eager=True), return_dtype=pl.Int64).to_numpy()
+    return codes.astype(np.min_scalar_type(-len(groups))), groups
+
+def _argsort_by(values:np.ndarray, *keys:np.ndarray) -> np.ndarray:
+    """
+        - indices sorting by `keys` (last key varies slowest) and `values`
+        - one `np.argsort()` of `values` followed by stable sorts of the (small integer) `keys`
+            - much faster than `np.lexsort()` for floats
+    """
+    order = np.argsort(values)
+    for key in keys:
+        order = order[np.argsort(key[order], kind="stable")]
+    return order
+
+def _sweep(s:np.ndarray, e:np.ndarray, codes:np.ndarray) -> Tuple[np.ndarray,np.ndarray,np.ndarray,np.ndarray]:
+    """
+        - sorted start- (`+1`) and end-events (`-1`) of all tasks grouped by `codes`
+        - returns
+            - `order`: indices into `np.concatenate([e, s])`
+            - `t`: sorted times
+            - `code`: group of each event
+            - `conc`: number of running tasks of the same group after each event
+                - plain cumulative sum since each group sums to `0`
+    """
+    n = len(s)
+    order = _argsort_by(np.concatenate([e, s]), np.concatenate([codes, codes]))
+    t = np.concatenate([e, s])[order]
+    conc = np.cumsum(np.where(order >= n, 1, -1))
+    return order, t, np.concatenate([codes, codes])[order], conc
+
+def _pack_lanes(s:np.ndarray, e:np.ndarray) -> np.ndarray:
+    """
+        - assigns each interval `[s, e)` to a lane such that intervals in a lane do not overlap
+        - uses the minimum number of lanes (i.e., the maximum concurrency)
+        - sweep over the sorted start- and end-events with a stack of free lanes (freed lanes get reused last-in-first-out)
+            - height of the stack is a cumulative sum reflected at `0` (i.e., new lanes get opened when no lane is free)
+            - each start pops the lane pushed by the last end that left the stack at the same height
+                - i.e., the preceding event after a stable sort by height
+            - lanes propagate along the resulting chains of intervals via pointer jumping
+    """
+    n = len(s)
+    if n == 0: return np.zeros(0, dtype=np.int64)
+
+    #events (at equal times: ends, starts, ends of zero-length intervals)
+    t = np.concatenate([e, s])
+    kind = np.concatenate([np.where(e > s, 0, 2), np.ones(n)]).astype(np.int8)
+    order = np.argsort(t)
+    tie = np.concatenate([[0], np.cumsum(t[order][1:] != t[order][:-1])])    #ties share an id
+    order = order[np.argsort(tie*3 + kind[order], kind="stable")]           #already sorted except within ties
+    task = order % n
+    is_start = kind[order] == 1
+
+    #number of free lanes after each event
+    free = np.cumsum(np.where(is_start, -1, 1))
+    free -= np.minimum(np.minimum.accumulate(free), 0)
+    free_before = np.concatenate([[0], free[:-1]])
+    opens = is_start & (free_before == 0)
+
+    #match each pop to the last push at the same height (per height pushes and pops alternate)
+    idx = np.flatnonzero(~opens)
+    height = np.where(is_start, free_before, free)[idx]
+    idx = idx[np.argsort(height.astype(np.min_scalar_type(height.max())), kind="stable")]
+    k = np.flatnonzero(is_start[idx])
+    pops, matched = idx[k], idx[k-1]
+
+    #propagate lanes along chains
+    pred = np.arange(n)
+    pred[task[pops]] = task[matched]
+    while True:
+        nxt = pred[pred]
+        if np.array_equal(nxt, pred): break
+        pred = nxt
+    lane = np.full(n, -1, dtype=np.int64)
+    lane[task[opens]] = np.arange(opens.sum())
+
+    return lane[pred]
+
+def prepare_gantt(
+    df:pl.DataFrame,
+    lanes:Literal["row","task","pack"]="row",
+    ) -> pl.DataFrame:
+    """
+        - function to add the columns required by `plot_gantt()` to a DataFrame of tasks
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - has to have the columns `"start"` and `"task"` (for `lanes=="task"`)
+                - has to have at least one of the columns `"end"` and `"duration"`
+            - `lanes`
+                - `Literal["row","task","pack"]`, optional
+                - how to assign tasks to rows (`"#"`) of the GANTT-chart
+                - `"row"`
+                    - one row per task (order of `df`)
+                - `"task"`
+                    - one row per unique `"task"` (ordered by first start)
+                    - i.e., recurring tasks share a row
+                - `"pack"`
+                    - as few rows as possible such that tasks in a row do not overlap
+                    - the number of rows equals the maximum concurrency
+                        - zero-length tasks count as running at their start
+                - the default is `"row"`
+
+        Raises
+        ------
+            - `ValueError`
+                - if `lanes` is not valid
+                - if `df` has neither `"end"` nor `"duration"`
+
+        Returns
+        -------
+            - `df`
+                - `pl.DataFrame`
+                - input with the (missing) columns `"end"`, `"duration"` and `"#"`
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - intervals are half-open (`[start, end)`)
+                - i.e., a task ending when another starts can share its row
+            - `lanes=="pack"` is a single sort-and-sweep over the start- and end-events (no pairwise comparisons)
+                - scales to `~1e7` tasks within seconds
+    """
+    if lanes not in ["row", "task", "pack"]:
+        raise ValueError(f"`lanes` has to be one of `'row'`, `'task'`, `'pack'` but is {lanes!r}")
+
+    df = df.with_columns(
+        _end(df.columns).alias("end"),
+        (_end(df.columns) - pl.col("start")).alias("duration"),
+    )
+
+    if lanes == "row":
+        df = df.with_columns(pl.int_range(pl.len()).alias("#"))
+    elif lanes == "task":
+        df_lanes = (df
+            .group_by("task").agg(pl.col("start").min())
+            .sort("start", "task")
+            .select("task", pl.int_range(pl.len()).alias("#"))
+        )
+        df = df.drop("#", strict=False).join(df_lanes, on="task", how="left", maintain_order="left")
+    else:
+        df = df.with_columns(pl.Series("#", _pack_lanes(*_intervals(df))))
+
+    return df
+
+def concurrency(
+    df:pl.DataFrame,
+    by:str="category",
+    ) -> pl.DataFrame:
+    """
+        - function to compute the number of concurrently running tasks over time
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - has to have the column `"start"` and at least one of the columns `"end"` and `"duration"`
+            - `by`
+                - `str`, optional
+                - column to compute the concurrency for separately
+                - if `None`
+                    - will consider all tasks together
+                - the default is `"category"`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `df_conc`
+                - `pl.DataFrame`
+                - step function of the concurrency
+                - has the columns `by` (if not `None`), `"time"` and `"concurrency"`
+                    - `"time"` has the dtype of `"start"`
+                    - `"concurrency"` is the number of running tasks from `"time"` until the next `"time"` (of the same `by`)
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - each task contributes a `+1` event at its start and a `-1` event at its end
+                - events get sorted once and cumulatively summed (sort-and-sweep)
+                - only the last event at each time (per `by`) is kept
+            - intervals are half-open (`[start, end)`)
+    """
+    s, e = _intervals(df)
+    codes, groups = _groups(df, by)
+    order, t, code, conc = _sweep(s, e, codes)
+
+    #last event per time
+    last = np.ones(len(t), dtype=bool)
+    last[:-1] = (t[1:] != t[:-1]) | (code[1:] != code[:-1])
+    times = pl.concat([df.select(_end(df.columns).cast(df["start"].dtype))[:,0], df["start"]])
+
+    df_conc = pl.DataFrame([
+        *([groups.gather(code[last])] if by is not None else []),
+        times.gather(order[last]).alias("time"),
+        pl.Series("concurrency", conc[last]),
+    ])
+
+    return df_conc
+
+def overlaps(
+    df:pl.DataFrame,
+    by:str="category",
+    ) -> Tuple[pl.Series,pl.DataFrame]:
+    """
+        - function to find overlapping tasks within each category
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - has to have the column `"start"` and at least one of the columns `"end"` and `"duration"`
+            - `by`
+                - `str`, optional
+                - column defining the groups within which overlaps get counted
+                - if `None`
+                    - will consider all tasks together
+                - the default is `"category"`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `n_overlaps`
+                - `pl.Series`
+                - number of other tasks of the same group each task overlaps with
+                - same order as `df`
+            - `df_overlaps`
+                - `pl.DataFrame`
+                - summary per group
+                - has the columns
+                    - `by` (if not `None`)
+                    - `"n_tasks"`: number of tasks
+                    - `"n_overlapping"`: number of tasks overlapping at least one other task
+                    - `"n_pairs"`: number of overlapping pairs of tasks
+                    - `"busy_time"`: time during which at least one task is running
+                    - `"overlap_time"`: time during which at least two tasks are running
+                - times are in days for temporal `"start"` (same as `matplotlib.dates`)
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - two tasks overlap if `start_i < end_j` and `start_j < end_i`
+            - counts follow from `np.searchsorted()` on the sorted starts and ends of each group
+                - number of tasks starting before `end_i` minus number of tasks ending until `start_i`
+                - queries are sorted as well (i.e., cache friendly)
+                - i.e., no pairwise comparisons
+            - `"busy_time"` and `"overlap_time"` follow from the same sweep as `concurrency()`
+    """
+    s, e = _intervals(df)
+    codes, groups = _groups(df, by)
+    ngroups = len(groups)
+
+    order, t, code, conc = _sweep(s, e, codes)
+
+    #overlaps per task
+    n_overlaps = -(s < e).astype(np.int64)  #task itself
+    zero = s == e                           #zero-length tasks at the same time are not counted as ending before
+    n_overlaps[zero] = pl.DataFrame(dict(c=codes[zero], s=s[zero])).select(pl.len().over("c", "s"))[:,0].to_numpy()
+    order_s = order[order >= len(s)] - len(s)   #sorted by group and start
+    order_e = order[order < len(s)]             #sorted by group and end
+    bounds = np.searchsorted(codes[order_s], np.arange(ngroups + 1))
+    for b0, b1 in zip(bounds[:-1], bounds[1:]):
+        idx_s, idx_e = order_s[b0:b1], order_e[b0:b1]
+        n_overlaps[idx_e] += np.searchsorted(s[idx_s], e[idx_e], side="left")
+        n_overlaps[idx_s] -= np.searchsorted(e[idx_e], s[idx_s], side="right")
+
+    #busy and overlapping time
+    dt = np.diff(t)
+    busy_time = np.bincount(code[:-1], weights=dt*(conc[:-1] >= 1), minlength=ngroups)
+    overlap_time = np.bincount(code[:-1], weights=dt*(conc[:-1] >= 2), minlength=ngroups)
+
+    df_overlaps = pl.DataFrame([
+        *([groups] if by is not None else []),
+        pl.Series("n_tasks", np.bincount(codes, minlength=ngroups)),
+        pl.Series("n_overlapping", np.bincount(codes, weights=n_overlaps > 0, minlength=ngroups).astype(np.int64)),
+        pl.Series("n_pairs", np.bincount(codes, weights=n_overlaps, minlength=ngroups).astype(np.int64)//2),
+        pl.Series("busy_time", busy_time),
+        pl.Series("overlap_time", overlap_time),
+    ])
+
+    return pl.Series("n_overlaps", n_overlaps), df_overlaps
+
+def utilization(
+    df:pl.DataFrame,
+    bins:Union[int,np.ndarray]=100,
+    trange:Tuple[float,float]=None,
+    by:str="category",
+    ) -> Tuple[np.ndarray,np.ndarray,pl.Series]:
+    """
+        - function to compute the mean number of running tasks within time bins
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - has to have the column `"start"` and at least one of the columns `"end"` and `"duration"`
+            - `bins`
+                - `int`, `np.ndarray`, optional
+                - number of bins or bin edges
+                - bin edges are in units of `matplotlib.dates` (days) for temporal `"start"`
+                - the default is `100`
+            - `trange`
+                - `Tuple[float,float]`, optional
+                - lower and upper edge of the bins
+                - ignored if `bins` are edges
+                - the default is `None`
+                    - will use first start and last end
+                    - widened to `(lo, lo+1)` if all tasks start and end at the same time `lo`
+            - `by`
+                - `str`, optional
+                - column to compute the utilization for separately
+                - if `None`
+                    - will consider all tasks together
+                - the default is `"category"`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `U`
+                - `np.ndarray`
+                - mean number of running tasks per group and bin
+                - has shape `(len(groups), nbins)`
+            - `edges`
+                - `np.ndarray`
+                - bin edges
+            - `groups`
+                - `pl.Series`
+                - sorted groups (order of the rows of `U`)
+                - `[None]` if `by` is `None`
+
+        Dependencies
+        ------------
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - integrates the concurrency exactly (no sampling)
+                - the cumulative integral of the concurrency is piecewise linear between events
+                - i.e., evaluating it at the bin edges via `np.interp()` and differencing yields the integral per bin
+            - divide by the number of available resources (i.e., lanes) to obtain a fraction
+    """
+    s, e = _intervals(df)
+    codes, groups = _groups(df, by)
+
+    #edges
+    if np.ndim(bins) == 0:
+        lo, hi = trange if trange is not None else ((s.min(), e.max()) if len(s) > 0 else (0.0, 1.0))
+        if hi <= lo: hi = lo + 1    #degenerate range (i.e., only zero-length tasks)
+        edges = np.linspace(lo, hi, int(bins) + 1)
+    else:
+        edges = np.asarray(bins, dtype=np.float64)
+
+    #cumulative integral of the concurrency at each event (does not change across groups since concurrency is 0 there)
+    order, t, code, conc = _sweep(s, e, codes)
+    busy = np.concatenate([[0.0], np.cumsum(conc[:-1]*np.diff(t))])
+
+    U = np.zeros((len(groups), len(edges) - 1))
+    bounds = np.searchsorted(code, np.arange(len(groups) + 1))
+    for i, (b0, b1) in enumerate(zip(bounds[:-1], bounds[1:])):
+        if b1 == b0: continue
+        U[i] = np.diff(np.interp(edges, t[b0:b1], busy[b0:b1] - busy[b0]))/np.diff(edges)
+
+    return U, edges, groups
+
+def plot_utilization(
+    df:pl.DataFrame,
+    bins:Union[int,np.ndarray]=100,
+    trange:Tuple[float,float]=None,
+    cmap:str=None,
+    ax:plt.Axes=None,
+    vmin:float=0.0, vmax:float=1.0,
+    by:str="category",
+    ) -> plt.Axes:
+    """
+        - function to plot the utilization (stacked per category) of a DataFrame of tasks
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - see `utilization()`
+            - `bins`
+                - `int`, `np.ndarray`, optional
+                - see `utilization()`
+                - the default is `100`
+            - `trange`
+                - `Tuple[float,float]`, optional
+                - see `utilization()`
+                - the default is `None`
+            - `cmap`
+                - `str`, optional
+                - colormap to use for plotting individual categories
+            - `ax`
+                - `plt.Axes`
+                - axes to plot into
+            - `vmin`
+                - `float`, optional
+                - lower bound for colormap plotting
+                - the default is `0.0`
+            - `vmax`
+                - `float`, optional
+                - upper bound for colormap plotting
+                - the default is `1.0`
+            - `by`
+                - `str`, optional
+                - see `utilization()`
+                - the default is `"category"`
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `ax`
+                - `plt.Axes`
+                - created axes
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - colors are the same as in `plot_gantt()` for the same `cmap`, `vmin` and `vmax`
+    """
+    #default values
+    if ax is None:  #create new figure if necessary
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+
+    U, edges, groups = utilization(df, bins=bins, trange=trange, by=by)
+    colors = category_colors(groups, cmap, vmin, vmax)
+
+    #plot
+    baseline = np.zeros(U.shape[1])
+    for group, u, c in zip(groups, U, colors):
+        ax.stairs(baseline + u, edges, baseline=baseline, fill=True, color=c, label=group)
+        baseline = baseline + u
+    if df["start"].dtype.is_temporal(): ax.xaxis_date()
+
+    if by is not None: ax.legend(loc="upper left")
+    ax.grid()
+    ax.set_xlabel("Time [YYYY-MM]")
+    ax.set_ylabel("Running Tasks")
+
+    return ax
+
+def plot_concurrency(
+    df:pl.DataFrame,
+    cmap:str=None,
+    ax:plt.Axes=None,
+    vmin:float=0.0, vmax:float=1.0,
+    by:str="category",
+    trange:Tuple[float,float]=None,
+    ) -> plt.Axes:
+    """
+        - function to plot the exact concurrency (step function per category) of a DataFrame of tasks
+
+        Parameters
+        ----------
+            - `df`
+                - `pl.DataFrame`
+                - dataframe containing the tasks
+                - see `concurrency()`
+            - `cmap`
+                - `str`, optional
+                - colormap to use for plotting individual categories
+            - `ax`
+                - `plt.Axes`
+                - axes to plot into
+            - `vmin`
+                - `float`, optional
+                - lower bound for colormap plotting
+                - the default is `0.0`
+            - `vmax`
+                - `float`, optional
+                - upper bound for colormap plotting
+                - the default is `1.0`
+            - `by`
+                - `str`, optional
+                - see `concurrency()`
+                - the default is `"category"`
+            - `trange`
+                - `Tuple[float,float]`, optional
+                - time window to plot the concurrency in
+                - in units of `matplotlib.dates` (days) for temporal `"start"`
+                - the default is `None`
+                    - will plot all events
+
+        Raises
+        ------
+
+        Returns
+        -------
+            - `ax`
+                - `plt.Axes`
+                - created axes
+
+        Dependencies
+        ------------
+            - `matplotlib`
+            - `numpy`
+            - `polars`
+            - `typing`
+
+        Comments
+        --------
+            - colors are the same as in `plot_gantt()` for the same `cmap`, `vmin` and `vmax`
+            - `concurrency()` gets computed once and split into groups via `partition_by()`
+            - for `trange` the step functions get clipped to the window (same as the bins of `utilization()`)
+    """
+    #default values
+    if ax is None:  #create new figure if necessary
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+
+    #step functions (sorted by group and time)
+    df_conc = concurrency(df, by=by)
+    parts = df_conc.partition_by(by, maintain_order=True) if by is not None else [df_conc]
+    groups = pl.Series(by, [p[by][0] for p in parts]) if by is not None else pl.Series(by, [None])
+    colors = category_colors(groups, cmap, vmin, vmax)
+
+    #plot
+    for group, df_g, c in zip(groups, parts, colors):
+        t, conc = to_num(df_g["time"]), df_g["concurrency"].to_numpy()
+        if trange is not None:
+            #value at the window edges is the one after the last preceding event
+            lo, hi = trange
+            i0, i1 = np.searchsorted(t, lo, side="right"), np.searchsorted(t, hi, side="left")
+            i1 = max(i0, i1)
+            t = np.concatenate([[lo], t[i0:i1], [hi]])
+            conc = np.concatenate([[conc[i0-1] if i0 > 0 else 0], conc[i0:i1], [conc[i1-1] if i1 > 0 else 0]])
+        ax.step(t, conc, where="post", color=c, label=group)
+    if df["start"].dtype.is_temporal(): ax.xaxis_date()
+
+    if by is not None: ax.legend(loc="upper left")
+    ax.grid()
+    ax.set_xlabel("Time [YYYY-MM]")
+    ax.set_ylabel("Running Tasks")
+
+    return ax
+
+# %%
@@ -4,15 +4,12 @@ from cycler import cycler
 import logging
 import matplotlib as mpl
 import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 #%%custom registered mpl elements
-#fink colormap
-if "fink" in plt.colormaps:
-    logger.info("colormap `fink` was already registered ... overwriting existing")
+_CMAPS_REGISTERED = False
 
 fink_colors = [
     [0.0, "#15284F"],
@@ -20,10 +17,60 @@ fink_colors = [
     [0.5, "#D5D5D3"],
     [1.0, "#F5622E"],
 ]
-cmap   = mcolors.LinearSegmentedColormap.from_list(name="fink", colors=fink_colors)
-cmap_r = cmap.reversed()
-mpl.colormaps.register(cmap, force=True)
-mpl.colormaps.register(cmap_r, force=True)
+
+def register_cmaps(force:bool=False):
+    """
+        - function to register the custom colormaps with `matplotlib`
+            - `fink`
+            - `fink_r`
+
+        Parameters
+        ----------
+            - `force`
+                - `bool`, optional
+                - whether to register the colormaps again even if they were registered already
+                - the default is `False`
+
+        Raises
+        ------
+
+        Returns
+        -------
+
+        Dependencies
+        ------------
+            - `matplotlib`
+
+        Comments
+        --------
+            - called by all styles (via `layout_specs()`) on first use
+                - i.e., importing this module does not touch the colormap registry
+            - call explicitly to use the colormaps without applying a style
+            - sets the module attributes `cmap` and `cmap_r` to the registered colormaps
+    """
+    global _CMAPS_REGISTERED, cmap, cmap_r
+    if _CMAPS_REGISTERED and not force: return
+
+    #fink colormap
+    if "fink" in mpl.colormaps:
+        logger.info("colormap `fink` was already registered ... overwriting existing")
+
+    cmap   = mcolors.LinearSegmentedColormap.from_list(name="fink", colors=fink_colors)
+    cmap_r = cmap.reversed()
+    mpl.colormaps.register(cmap, force=True)
+    mpl.colormaps.register(cmap_r, force=True)
+
+    _CMAPS_REGISTERED = True
+    return
+
+def __getattr__(name:str):
+    """
+        - registers the custom colormaps on first access of `cmap` or `cmap_r` (PEP 562)
+    """
+    if name in ["cmap", "cmap_r"]:
+        register_cmaps()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 #%%global setup
 def layout_specs():
@@ -60,50 +107,52 @@ def layout_specs():
         -------- 
     """
     
-    # for k, v in plt.rcParams.items(): print(k, v)
+    register_cmaps()
+
+    # for k, v in mpl.rcParams.items(): print(k, v)
     #text
-    plt.rcParams["text.usetex"]             = True
+    mpl.rcParams["text.usetex"]             = True
 
     #fontsizes
-    plt.rcParams["font.size"]               = 16
-    plt.rcParams["figure.titlesize"]        = "large"
-    plt.rcParams["axes.titlesize"]          = "large"
-    plt.rcParams["axes.labelsize"]          = "medium"
-    plt.rcParams["xtick.labelsize"]         = "medium"
-    plt.rcParams["ytick.labelsize"]         = "medium"
-    plt.rcParams["legend.title_fontsize"]   = "small"
-    plt.rcParams["legend.fontsize"]         = "small"
+    mpl.rcParams["font.size"]               = 16
+    mpl.rcParams["figure.titlesize"]        = "large"
+    mpl.rcParams["axes.titlesize"]          = "large"
+    mpl.rcParams["axes.labelsize"]          = "medium"
+    mpl.rcParams["xtick.labelsize"]         = "medium"
+    mpl.rcParams["ytick.labelsize"]         = "medium"
+    mpl.rcParams["legend.title_fontsize"]   = "small"
+    mpl.rcParams["legend.fontsize"]         = "small"
 
     #frame layout
-    plt.rcParams["figure.figsize"]          = (9.0,5.0)
-    plt.rcParams["figure.dpi"]              = 180
+    mpl.rcParams["figure.figsize"]          = (9.0,5.0)
+    mpl.rcParams["figure.dpi"]              = 180
 
     #grid layout
-    plt.rcParams["axes.grid"]               = True
-    plt.rcParams["axes.grid.which"]         = "major"
-    plt.rcParams["grid.alpha"]              = 0.3
+    mpl.rcParams["axes.grid"]               = True
+    mpl.rcParams["axes.grid.which"]         = "major"
+    mpl.rcParams["grid.alpha"]              = 0.3
 
     #marker and line defaults
-    plt.rcParams["lines.linewidth"]         = 2
-    plt.rcParams["lines.linewidth"]         = 2
-    plt.rcParams["lines.linestyle"]         = "-"
-    plt.rcParams["lines.markersize"]        = 4
-    plt.rcParams["scatter.marker"]          = "o"
+    mpl.rcParams["lines.linewidth"]         = 2
+    mpl.rcParams["lines.linewidth"]         = 2
+    mpl.rcParams["lines.linestyle"]         = "-"
+    mpl.rcParams["lines.markersize"]        = 4
+    mpl.rcParams["scatter.marker"]          = "o"
 
     #legend
-    plt.rcParams["legend.framealpha"]       = 0.2                   #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.framealpha"]       = 0.2                   #:fglegend, :legendbackgroundcolor
 
     #python specific
-    plt.rcParams["errorbar.capsize"]        = 3
-    plt.rcParams["savefig.transparent"]     = False
-    plt.rcParams["savefig.bbox"]            = "tight"
-    plt.rcParams["savefig.dpi"]             = 180
-    plt.rcParams["xtick.direction"]         = "in" 
-    plt.rcParams["ytick.direction"]         = "in" 
-    plt.rcParams["xtick.minor.visible"]     = True
-    plt.rcParams["ytick.minor.visible"]     = True
-    plt.rcParams["axes.spines.top"]         = False
-    plt.rcParams["axes.spines.right"]       = False
+    mpl.rcParams["errorbar.capsize"]        = 3
+    mpl.rcParams["savefig.transparent"]     = False
+    mpl.rcParams["savefig.bbox"]            = "tight"
+    mpl.rcParams["savefig.dpi"]             = 180
+    mpl.rcParams["xtick.direction"]         = "in" 
+    mpl.rcParams["ytick.direction"]         = "in" 
+    mpl.rcParams["xtick.minor.visible"]     = True
+    mpl.rcParams["ytick.minor.visible"]     = True
+    mpl.rcParams["axes.spines.top"]         = False
+    mpl.rcParams["axes.spines.right"]       = False
 
 
     #options for monochrome plots
@@ -122,7 +171,7 @@ def layout_specs():
 
     ncolors_mono        = 3
 
-    mono_colors_base = plt.get_cmap("gray")(np.linspace(0,1,ncolors_mono+2))[1:-1]
+    mono_colors_base = mpl.colormaps["gray"](np.linspace(0,1,ncolors_mono+2))[1:-1]
     mono_ls_base        = ["-", "--", ":", "-."]              #linestyles to cycle through when plotting
     mono_markers_base   = ["o", "^", "v", "d", "x"]
     mono_hatches_base   = ["/","\\","o","*", "|"]
@@ -193,21 +242,21 @@ def tre_light():
     tre_light_bg = "FFFFFF"
 
     #color scheme                                               #julia equivalent
-    plt.rcParams["figure.facecolor"]        = tre_light_bg      #:bg
-    # plt.rcParams["figure.edgecolor"]      = (0,0,0,1)     
-    plt.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
-    plt.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = tre_light_cmap    #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["figure.facecolor"]        = tre_light_bg      #:bg
+    # mpl.rcParams["figure.edgecolor"]      = (0,0,0,1)     
+    mpl.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
+    mpl.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = tre_light_cmap    #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
 
     return tre_light_palette, tre_light_ls, tre_light_markers, tre_light_cmap, tre_light_hatches
 
@@ -266,21 +315,21 @@ def tre_dark():
     tre_dark_bg = "000000"
 
     #color scheme                                                   #julia equivalent
-    plt.rcParams["figure.facecolor"]        = tre_dark_bg           #:bg
-    # plt.rcParams["figure.edgecolor"]        = (1,1,1,1)     
-    plt.rcParams["axes.facecolor"]          = "000000"              #:bginside
-    plt.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle            #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = tre_dark_cmap         #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)            #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)            #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["figure.facecolor"]        = tre_dark_bg           #:bg
+    # mpl.rcParams["figure.edgecolor"]        = (1,1,1,1)     
+    mpl.rcParams["axes.facecolor"]          = "000000"              #:bginside
+    mpl.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle            #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = tre_dark_cmap         #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)            #
 
 
     return tre_dark_palette, tre_dark_ls, tre_dark_markers, tre_dark_cmap, tre_dark_hatches
@@ -340,21 +389,21 @@ def lust_light():
     lust_light_bg = "FFFFFF"
 
     #color scheme                                               #julia equivalent
-    plt.rcParams["figure.facecolor"]        = lust_light_bg      #:bg
-    # plt.rcParams["figure.edgecolor"]      = (0,0,0,1)     
-    plt.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
-    plt.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = lust_light_cmap    #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["figure.facecolor"]        = lust_light_bg      #:bg
+    # mpl.rcParams["figure.edgecolor"]      = (0,0,0,1)     
+    mpl.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
+    mpl.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = lust_light_cmap    #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
 
     return lust_light_palette, lust_light_ls, lust_light_markers, lust_light_cmap, lust_light_hatches
 
@@ -413,21 +462,21 @@ def lust_dark():
     lust_dark_bg = "000000"
 
     #color scheme                                                   #julia equivalent
-    plt.rcParams["figure.facecolor"]        = lust_dark_bg           #:bg
-    # plt.rcParams["figure.edgecolor"]        = (1,1,1,1)     
-    plt.rcParams["axes.facecolor"]          = "000000"              #:bginside
-    plt.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle            #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = lust_dark_cmap         #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)            #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)            #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["figure.facecolor"]        = lust_dark_bg           #:bg
+    # mpl.rcParams["figure.edgecolor"]        = (1,1,1,1)     
+    mpl.rcParams["axes.facecolor"]          = "000000"              #:bginside
+    mpl.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle            #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = lust_dark_cmap         #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)            #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)            #
 
 
     return lust_dark_palette, lust_dark_ls, lust_dark_markers, lust_dark_cmap, lust_dark_hatches
@@ -490,21 +539,21 @@ def fink_light():
     fink_bg = "FFFFFF"
 
     #color scheme                                               #julia equivalent
-    plt.rcParams["figure.facecolor"]        = fink_bg      #:bg
-    # plt.rcParams["figure.edgecolor"]      = (0,0,0,1)     
-    plt.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
-    plt.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = fink_cmap    #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["figure.facecolor"]        = fink_bg      #:bg
+    # mpl.rcParams["figure.edgecolor"]      = (0,0,0,1)     
+    mpl.rcParams["axes.facecolor"]          = "FFFFFF"          #:bginside
+    mpl.rcParams["text.color"]              = (0,0,0,1)         #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["ytick.color"]             = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0,0,0,1)         #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0,0,0,1)         #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = fink_cmap    #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.9)        #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.9)        #
 
     return fink_palette, fink_ls, fink_markers, fink_cmap, fink_hatches
 
@@ -567,21 +616,21 @@ def fink_dark():
     fink_bg = "000000"
 
     #color scheme                                               #julia equivalent
-    plt.rcParams["figure.facecolor"]        = fink_bg      #:bg
-    # plt.rcParams["figure.edgecolor"]      = (0,0,0,1)     
-    plt.rcParams["axes.facecolor"]          = "000000"          #:bginside
-    plt.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
-    plt.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
-    plt.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
-    plt.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
-    plt.rcParams["legend.edgecolor"]        = "inherit"               #
-    plt.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
-    plt.rcParams["image.cmap"]              = fink_cmap    #:colorgradient
-    plt.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)        #
-    plt.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)        #
-    plt.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)        #
+    mpl.rcParams["figure.facecolor"]        = fink_bg      #:bg
+    # mpl.rcParams["figure.edgecolor"]      = (0,0,0,1)     
+    mpl.rcParams["axes.facecolor"]          = "000000"          #:bginside
+    mpl.rcParams["text.color"]              = (0.75,0.75,0.75,1)    #:fgtext, :legendfontcolor, :legendtitlefontcolor, :titlefontcolor
+    mpl.rcParams["xtick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["ytick.color"]             = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.labelcolor"]         = (0.75,0.75,0.75,1)    #:fgtext
+    mpl.rcParams["axes.edgecolor"]          = (0.75,0.75,0.75,1)    #:fgguide
+    mpl.rcParams["legend.facecolor"]        = "inherit"         #:fglegend, :legendbackgroundcolor
+    mpl.rcParams["legend.edgecolor"]        = "inherit"               #
+    mpl.rcParams["axes.prop_cycle"]         = prop_cycle        #:palette, cycling through :ls
+    mpl.rcParams["image.cmap"]              = fink_cmap    #:colorgradient
+    mpl.rcParams["axes3d.xaxis.panecolor"]  = (1,1,1,.1)        #
+    mpl.rcParams["axes3d.yaxis.panecolor"]  = (1,1,1,.1)        #
+    mpl.rcParams["axes3d.zaxis.panecolor"]  = (1,1,1,.1)        #
 
     return fink_palette, fink_ls, fink_markers, fink_cmap, fink_hatches
 
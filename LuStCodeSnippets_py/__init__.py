@@ -9,4 +9,21 @@ __author_email__ = ""
 __maintainer__ = "Lukas Steinwender"
 __maintainer_email__ = ""
 __url__ = "https://github.com/TheRedElement/LuStCodeSnippets"
-__credits__ = ""
\ No newline at end of file
+__credits__ = ""
+
+#%%lazy submodules
+import importlib as _importlib
+
+_SUBMODULES = ["Astronomy", "PlExtension", "Plots", "Styles"]
+
+def __getattr__(name:str):
+    """
+        - imports subpackages on first attribute access (PEP 562)
+        - i.e., `import LuStCodeSnippets_py` does not import any heavy dependencies
+    """
+    if name in _SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted([*globals(), *_SUBMODULES])
@@ -0,0 +1,165 @@
+
+#%%imports
+import argparse
+from astropy.cosmology import FlatLambdaCDM, LambdaCDM, Planck18, WMAP9
+from astropy.utils.data import conf as apconf
+import datetime
+import json
+import numpy as np
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+
+import astropy
+import polars as pl
+from LuStCodeSnippets_py import __version__
+from LuStCodeSnippets_py.Astronomy import Absmag, Passbands
+
+apconf.allow_internet = False   #benchmarks have to run offline
+
+#%%definitions
+COSMOS = {
+    "FlatLambdaCDM":        FlatLambdaCDM(H0=70, Om0=0.3),
+    "FlatLambdaCDM_Tcmb":   FlatLambdaCDM(H0=70, Om0=0.3, Tcmb0=2.725),
+    "LambdaCDM":            LambdaCDM(H0=70, Om0=0.3, Ode0=0.65),
+    "WMAP9":                WMAP9,
+    "Planck18":             Planck18,
+}
+
+def timeit(
+    fn:Callable,
+    min_time:float=0.2, min_repeat:int=3, max_repeat:int=1000,
+    ) -> List[float]:
+    """
+        - function to time `fn()`
+        - repeats `fn()` at least `min_repeat` times and until `min_time` seconds have passed (at most `max_repeat` times)
+        - returns the individual timings in seconds
+    """
+    times = []
+    while len(times) < max_repeat and (len(times) < min_repeat or sum(times) < min_time):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+def make_result(name:str, params:Dict, n:int, times:List[float]) -> Dict:
+    """
+        - summarizes timings of one benchmark case
+    """
+    best = min(times)
+    return dict(
+        name=name, params=params, n=n,
+        repeat=len(times), times=times,
+        best=best, mean=float(np.mean(times)),
+        throughput=n/best if best > 0 else float("inf"),
+    )
+
+def bench_absmag(
+    sizes:List[int],
+    cosmos:List[str],
+    fn_confstats:str,
+    max_seconds:float=60.0,
+    seed:int=0,
+    ) -> List[Dict]:
+    """
+        - benchmarks `Absmag.absmag()` for all combinations of `sizes`, `cosmos`, with/without `fn_confstats` and with/without `distmod_grid`
+        - `sizes==0` corresponds to scalar input
+        - cases are skipped if the runtime extrapolated from the next smaller size exceeds `max_seconds`
+    """
+    rng = np.random.default_rng(seed)
+    nmax = max(sizes)
+    m_all  = rng.uniform(18, 25, max(nmax, 1))
+    z_all  = rng.uniform(0.01, 1.2, max(nmax, 1))
+    pb_all = rng.choice(["g", "r", "i", "z", "Y"], max(nmax, 1))
+
+    results = []
+    for cosmo_name in cosmos:
+        cosmo = COSMOS[cosmo_name]
+        for lut in [False, fn_confstats]:
+            for distmod_grid in [False, True]:
+                Absmag.absmag(m_all[:10], z_all[:10], cosmo, pb_all[:10], lut, distmod_grid)   #warm up caches
+                params = dict(cosmo=cosmo_name, fn_confstats=lut is not False, distmod_grid=distmod_grid)
+                t_per_el = None
+                for n in sorted(sizes):
+                    if t_per_el is not None and t_per_el*max(n, 1) > max_seconds:
+                        print(f"skipping absmag {params} n={n} (estimated {t_per_el*n:.0f}s)", file=sys.stderr)
+                        continue
+                    if n == 0:
+                        args = (m_all[0].item(), z_all[0].item(), cosmo, pb_all[0].item(), lut, distmod_grid)
+                    else:
+                        args = (m_all[:n], z_all[:n], cosmo, pb_all[:n], lut, distmod_grid)
+                    times = timeit(lambda: Absmag.absmag(*args), max_repeat=1000 if n < 10**5 else 3)
+                    results.append(make_result("absmag", params, max(n, 1), times))
+                    t_per_el = min(times)/max(n, 1)
+                    print(f"absmag {params} n={n}: {min(times):.3e}s", file=sys.stderr)
+
+    return results
+
+def bench_passbands() -> List[Dict]:
+    """
+        - benchmarks `Passbands.get_passband_specs()`
+    """
+    times = timeit(Passbands.get_passband_specs, max_repeat=1000)
+    print(f"get_passband_specs: {min(times):.3e}s", file=sys.stderr)
+    return [make_result("get_passband_specs", dict(), 1, times)]
+
+def compare(results:List[Dict], fn_baseline:str, tolerance:float) -> List[str]:
+    """
+        - compares the throughput of `results` against a previous run stored in `fn_baseline`
+        - returns descriptions of all cases that got slower by more than `tolerance` (relative)
+    """
+    with open(fn_baseline) as f:
+        baseline = {(r["name"], json.dumps(r["params"], sort_keys=True), r["n"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        b = baseline.get((r["name"], json.dumps(r["params"], sort_keys=True), r["n"]))
+        if b is not None and r["throughput"] < (1-tolerance)*b["throughput"]:
+            regressions.append(f"{r['name']} {r['params']} n={r['n']}: {b['throughput']:.3e}/s -> {r['throughput']:.3e}/s")
+    return regressions
+
+def main(argv:List[str]=None):
+    """
+        - runs the benchmark suite of the `Astronomy` module
+        - writes results to a json file
+    """
+    parser = argparse.ArgumentParser(description="benchmark suite for `LuStCodeSnippets_py.Astronomy`")
+    parser.add_argument("--output",         default="bench_output.json",                        help="json file to write results to (default: %(default)s)")
+    parser.add_argument("--sizes",          type=int, nargs="+", default=[0, 10**3, 10**6, 10**7], help="input sizes to benchmark (`0` = scalar input; default: %(default)s)")
+    parser.add_argument("--cosmos",         nargs="+", default=list(COSMOS.keys()), choices=list(COSMOS.keys()), help="cosmologies to benchmark (default: all)")
+    parser.add_argument("--fn-confstats",   default=os.path.join(os.path.dirname(__file__), "../../data/lut_snana_snia.csv"), help="lookup table to use for `fn_confstats`")
+    parser.add_argument("--max-seconds",    type=float, default=60.0,                           help="skip cases estimated to take longer than this per call (default: %(default)s)")
+    parser.add_argument("--quick",          action="store_true",                                help="only run small sizes (`0 1000 100000`)")
+    parser.add_argument("--compare",        default=None,                                       help="json file of a previous run to check for throughput regressions")
+    parser.add_argument("--tolerance",      type=float, default=0.2,                            help="relative throughput loss counted as regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+    sizes = [0, 10**3, 10**5] if args.quick else args.sizes
+
+    results = []
+    results += bench_absmag(sizes, args.cosmos, args.fn_confstats, args.max_seconds)
+    results += bench_passbands()
+
+    out = dict(
+        meta=dict(
+            timestamp=datetime.datetime.now().isoformat(),
+            python=sys.version, platform=platform.platform(), cpu_count=os.cpu_count(),
+            versions=dict(LuStCodeSnippets_py=__version__, numpy=np.__version__, astropy=astropy.__version__, polars=pl.__version__),
+        ),
+        results=results,
+    )
+    with open(args.output, "w") as f:
+        json.dump(out, f, indent=2)
+    print(f"wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+    if args.compare is not None:
+        regressions = compare(results, args.compare, args.tolerance)
+        for r in regressions: print(f"REGRESSION: {r}", file=sys.stderr)
+        if len(regressions) > 0: sys.exit(1)
+
+    return
+
+#%%main
+if __name__ == "__main__":
+    main()
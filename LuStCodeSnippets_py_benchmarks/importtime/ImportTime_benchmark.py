@@ -0,0 +1,122 @@
+
+#%%imports
+import argparse
+import datetime
+import json
+import numpy as np
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List
+
+from LuStCodeSnippets_py import __version__
+
+#%%definitions
+MODULES = [
+    "LuStCodeSnippets_py",
+    "LuStCodeSnippets_py.Astronomy.Absmag",
+    "LuStCodeSnippets_py.Astronomy.AbsmagCLI",
+    "LuStCodeSnippets_py.Astronomy.SynPhot",
+    "LuStCodeSnippets_py.PlExtension.plConvenience",
+    "LuStCodeSnippets_py.PlExtension.plNamespace",
+    "LuStCodeSnippets_py.Plots.GANTT",
+    "LuStCodeSnippets_py.Styles.PlotStyles",
+]
+HEAVY = ["astropy", "matplotlib", "matplotlib.pyplot", "polars", "scipy"]   #dependencies reported separately
+
+def importtime(module:str) -> Dict[str,Dict[str,float]]:
+    """
+        - imports `module` in a fresh interpreter via `python -X importtime`
+        - returns self and cumulative import time in seconds for each imported module
+    """
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line: continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = dict(self=int(self_us)*1e-6, cumulative=int(cum_us)*1e-6)
+    return times
+
+def bench_import(modules:List[str], repeat:int, top:int) -> List[Dict]:
+    """
+        - benchmarks the cold import of each module in `modules`
+    """
+    results = []
+    for module in modules:
+        runs = [importtime(module) for _ in range(repeat)]
+        times = [r[module]["cumulative"] for r in runs]
+        best = runs[int(np.argmin(times))]
+        heaviest = sorted(best.items(), key=lambda kv: kv[1]["self"], reverse=True)[:top]
+        results.append(dict(
+            name="import", params=dict(module=module), n=1,
+            repeat=len(times), times=times,
+            best=min(times), mean=float(np.mean(times)),
+            throughput=1/min(times),
+            heavy=[m for m in HEAVY if m in best],
+            heaviest=[dict(module=m, **t) for m, t in heaviest],
+        ))
+        print(f"{module}: {min(times):.3f}s (heavy: {', '.join(results[-1]['heavy']) or '-'})", file=sys.stderr)
+    return results
+
+def compare(results:List[Dict], fn_baseline:str, tolerance:float) -> List[str]:
+    """
+        - compares the import time of `results` against a previous run stored in `fn_baseline`
+        - returns descriptions of all modules that got slower by more than `tolerance` (relative) or import new heavy dependencies
+    """
+    with open(fn_baseline) as f:
+        baseline = {r["params"]["module"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        b = baseline.get(r["params"]["module"])
+        if b is None: continue
+        if r["best"] > b["best"]/(1-tolerance):
+            regressions.append(f"{r['params']['module']}: {b['best']:.3f}s -> {r['best']:.3f}s")
+        new_heavy = set(r["heavy"]) - set(b["heavy"])
+        if len(new_heavy) > 0:
+            regressions.append(f"{r['params']['module']}: now imports {sorted(new_heavy)}")
+    return regressions
+
+def main(argv:List[str]=None):
+    """
+        - runs the import-time benchmark (cold start of each module in a fresh interpreter)
+        - writes results to a json file
+    """
+    parser = argparse.ArgumentParser(description="import-time benchmark for `LuStCodeSnippets_py`")
+    parser.add_argument("--output",         default="bench_importtime.json",    help="json file to write results to (default: %(default)s)")
+    parser.add_argument("--modules",        nargs="+", default=MODULES,         help="modules to import (default: all)")
+    parser.add_argument("--repeat",         type=int, default=5,                help="number of fresh interpreters per module (default: %(default)s)")
+    parser.add_argument("--top",            type=int, default=10,               help="number of slowest imports to report per module (default: %(default)s)")
+    parser.add_argument("--compare",        default=None,                       help="json file of a previous run to check for import-time regressions")
+    parser.add_argument("--tolerance",      type=float, default=0.2,            help="relative slowdown counted as regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = bench_import(args.modules, args.repeat, args.top)
+
+    out = dict(
+        meta=dict(
+            timestamp=datetime.datetime.now().isoformat(),
+            python=sys.version, platform=platform.platform(), cpu_count=os.cpu_count(),
+            versions=dict(LuStCodeSnippets_py=__version__, numpy=np.__version__),
+        ),
+        results=results,
+    )
+    with open(args.output, "w") as f:
+        json.dump(out, f, indent=2)
+    print(f"wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+    if args.compare is not None:
+        regressions = compare(results, args.compare, args.tolerance)
+        for r in regressions: print(f"REGRESSION: {r}", file=sys.stderr)
+        if len(regressions) > 0: sys.exit(1)
+
+    return
+
+#%%main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Astronomy import Absmag, AbsmagCLI
+
+from astropy.cosmology import FlatLambdaCDM
+import numpy as np
+import polars as pl
+
+#%%tests
+class Test_main:
+
+    @pytest.fixture(params=[".parquet", ".csv"])
+    def action(self, request, tmp_path):
+        #arrange
+        rng = np.random.default_rng(0)
+        df = pl.DataFrame(dict(
+            id=np.arange(50),
+            mag=rng.uniform(18, 25, 50),
+            z=rng.uniform(0.01, 1.5, 50),
+        ))
+        fn_in = str(tmp_path/f"catalog{request.param}")
+        fn_out = str(tmp_path/f"catalog_absmag{request.param}")
+        df.write_parquet(fn_in) if request.param == ".parquet" else df.write_csv(fn_in)
+
+        #act
+        AbsmagCLI.main([fn_in, fn_out, "--H0", "70", "--Om0", "0.3", "--m-col", "mag", "--batch-size", "7"])
+        df_out = pl.read_parquet(fn_out) if request.param == ".parquet" else pl.read_csv(fn_out)
+        return df, fn_in, fn_out, df_out
+
+    #assert
+    def test_matches_absmag(self, action):
+        df, fn_in, fn_out, df_out = action
+        M, std, offset = Absmag.absmag(df["mag"].to_numpy(), df["z"].to_numpy(), FlatLambdaCDM(H0=70, Om0=0.3))
+        assert df_out.columns == ["id", "mag", "z", "M", "std", "offset"]
+        assert df_out["id"].to_list() == df["id"].to_list()
+        assert np.allclose(df_out["M"].to_numpy(), M)
+        assert np.isnan(df_out["std"].cast(pl.Float64).to_numpy()).all()
+
+    def test_conflicting_columns(self, action, tmp_path):
+        df, fn_in, fn_out, df_out = action
+        fn_conflict = str(tmp_path/"conflict.parquet")
+        df.with_columns(pl.lit(0.0).alias("M")).write_parquet(fn_conflict)
+        with pytest.raises(SystemExit):
+            AbsmagCLI.main([fn_conflict, str(tmp_path/"out.parquet"), "--m-col", "mag"])
+
+    def test_invalid_extension(self, action, tmp_path):
+        df, fn_in, fn_out, df_out = action
+        with pytest.raises(ValueError):
+            AbsmagCLI.scan_catalog(str(tmp_path/"catalog.fits"))
@@ -1,7 +1,7 @@
 
 #%%imports
 import pytest
-from LuStCodeSnippets_py.Astronomy import Absmag
+from LuStCodeSnippets_py.Astronomy import Absmag, Distmod
 
 from astropy.cosmology import FlatLambdaCDM
 import numpy as np
@@ -56,3 +56,138 @@ class Test_absmag:
 
     def test_absmag(self, action):
         assert action[0] == pytest.approx(action[3], rel=1e-2)
+
+class Test_absmag_array:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        m  = np.array([22.6803, 21.333, 24.031, 20.9328, 23.3801])
+        z  = np.array([0.36966, 0.29686, 0.89888, 0.26628, 0.65992])
+        pb = np.array(["g", "Y", "z", "r", "r"])
+
+        #act
+        res_arr = Absmag.absmag(m, z, cosmo, pb, "./data/lut_snana_snia.csv")
+        res_sca = [Absmag.absmag(mi, zi, cosmo, pbi, "./data/lut_snana_snia.csv") for mi, zi, pbi in zip(m, z, pb)]
+        return res_arr, np.array(res_sca).T
+
+    #assert
+    def test_outtypes(self, action):
+        res_arr, res_sca = action
+        for r in res_arr:
+            assert isinstance(r, np.ndarray)
+            assert r.shape == (5,)
+
+    def test_matches_scalar(self, action):
+        res_arr, res_sca = action
+        np.testing.assert_allclose(np.array(res_arr), res_sca, equal_nan=True)
+
+class Test_absmag_distmod_grid:
+
+    @pytest.fixture(params=[FlatLambdaCDM(H0=70, Om0=0.3), FlatLambdaCDM(H0=67.7, Om0=0.31, Tcmb0=2.7255)])
+    def action(self, request):
+        #arrange
+        cosmo = request.param
+        z = np.concatenate([np.geomspace(1e-3, 3, 200), [1e-5, 20.0]])
+
+        #act
+        M_exact, _, _ = Absmag.absmag(20.0, z, cosmo)
+        M_grid, _, _  = Absmag.absmag(20.0, z, cosmo, distmod_grid=True)
+        grid = Distmod.get_distmod_grid(cosmo)
+        return M_exact, M_grid, grid
+
+    #assert
+    def test_max_error(self, action):
+        M_exact, M_grid, grid = action
+        assert grid.max_error < 1e-5
+        assert np.max(np.abs(M_exact - M_grid)) <= grid.max_error
+
+    def test_cached(self, action):
+        M_exact, M_grid, grid = action
+        assert Distmod.get_distmod_grid(type(grid.cosmo)(**grid.cosmo.parameters, name="other")) is grid
+
+    def test_cosmo_mismatch(self, action):
+        M_exact, M_grid, grid = action
+        with pytest.raises(ValueError):
+            Absmag.absmag(20.0, 0.5, FlatLambdaCDM(H0=50, Om0=0.5), distmod_grid=grid)
+
+class Test_absmag_parallel:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        rng = np.random.default_rng(0)
+        m  = rng.uniform(18, 24, 1000)
+        z  = rng.uniform(0.01, 1.2, 1000)
+        pb = rng.choice(["g", "r", "i", "z", "Y"], 1000)
+
+        #act
+        res_par = Absmag.absmag_parallel(m, z, cosmo, pb, "./data/lut_snana_snia.csv", workers=2, chunksize=300)
+        res_ser = Absmag.absmag(m, z, cosmo, pb, "./data/lut_snana_snia.csv")
+        return res_par, res_ser
+
+    #assert
+    def test_matches_serial(self, action):
+        res_par, res_ser = action
+        np.testing.assert_allclose(np.array(res_par), np.array(res_ser), equal_nan=True)
+
+class Test_absmag_mc:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        m  = np.array([22.6803, 21.333, 24.031, 20.9328])
+        z  = np.array([0.36966, 0.29686, 0.89888, 0.26628])
+        pb = np.array(["g", "Y", "z", "r"])
+
+        #act
+        M, std, offset = Absmag.absmag(m, z, cosmo, pb, "./data/lut_snana_snia.csv")
+        M_pct_noerr = Absmag.absmag_mc(m, z, cosmo, nsamples=10, max_elements=20)
+        M_pct = Absmag.absmag_mc(m, z, cosmo, 0.05, 0.0, pb, "./data/lut_snana_snia.csv", nsamples=20000, max_elements=50000, seed=0)
+        return M, std, M_pct_noerr, M_pct
+
+    #assert
+    def test_shape(self, action):
+        M, std, M_pct_noerr, M_pct = action
+        assert M_pct.shape == (3, 4)
+
+    def test_noerr(self, action):
+        M, std, M_pct_noerr, M_pct = action
+        np.testing.assert_allclose(M_pct_noerr, np.repeat(M[None,:], 3, axis=0), atol=1e-6)
+
+    def test_spread(self, action):
+        M, std, M_pct_noerr, M_pct = action
+        np.testing.assert_allclose(M_pct[1], M, atol=0.02)
+        np.testing.assert_allclose((M_pct[2]-M_pct[0])/2, np.sqrt(0.05**2 + np.nan_to_num(std)**2), rtol=0.05)
+
+class Test_inverse:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        m  = np.array([22.6803, 21.333, 24.031, 20.9328])
+        z  = np.array([0.36966, 0.29686, 0.89888, 0.26628])
+        pb = np.array(["g", "Y", "z", "r"])
+
+        #act
+        M, std, offset = Absmag.absmag(m, z, cosmo, pb, "./data/lut_snana_snia.csv")
+        m_pred, std_m, offset_m = Absmag.appmag(M, z, cosmo, pb, "./data/lut_snana_snia.csv")
+        z_pred, std_z, offset_z = Absmag.z_from_distmod(m - M, cosmo, pb, "./data/lut_snana_snia.csv")
+        return (m, z, std, offset), (m_pred, std_m, offset_m), (z_pred, std_z, offset_z)
+
+    #assert
+    def test_appmag(self, action):
+        (m, z, std, offset), (m_pred, std_m, offset_m), _ = action
+        np.testing.assert_allclose(m_pred, m)
+        np.testing.assert_array_equal(std_m, std)
+        np.testing.assert_array_equal(offset_m, offset)
+
+    def test_z_from_distmod(self, action):
+        (m, z, std, offset), _, (z_pred, std_z, offset_z) = action
+        np.testing.assert_allclose(z_pred, z, rtol=1e-6)
+        np.testing.assert_array_equal(std_z, std)
+        np.testing.assert_array_equal(offset_z, offset)
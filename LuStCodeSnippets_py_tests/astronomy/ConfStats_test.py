@@ -0,0 +1,63 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Astronomy import ConfStats
+
+import numpy as np
+
+#%%tests
+class Test_ConfStatsLUT:
+
+    @pytest.fixture
+    def lut(self):
+        return ConfStats.get_confstats("./data/lut_snana_snia.csv")
+
+    #assert
+    def test_cached(self, lut):
+        assert ConfStats.get_confstats("./data/lut_snana_snia.csv") is lut
+
+    def test_invalidated(self, tmp_path, lut):
+        fn = tmp_path/"lut.csv"
+        fn.write_text("passband,z_bin,std,offset\ng,0.1,1.0,2.0\n")
+        lut1 = ConfStats.get_confstats(str(fn))
+        fn.write_text("passband,z_bin,std,offset\ng,0.1,3.0,4.0\ng,0.2,5.0,6.0\n")
+        lut2 = ConfStats.get_confstats(str(fn))
+        assert lut2 is not lut1
+        assert lut2.lookup("g", 0.2)[0] == 5.0
+
+    @pytest.mark.parametrize("pb, z, std, offset", [
+        ("g", 0.0,  0.25706963245997155, 0.17774732963311024),
+        ("g", 0.14, 0.25706963245997155, 0.17774732963311024),
+        ("g", 0.16, 0.33483516047412354, 0.2506661395286329),
+        ("g", 5.0,  0.2630397010863248,  0.6571087326401575),
+        ("i", 0.46, 0.2504067969084529,  0.18248020194416625),
+        ("Y", 0.3,  np.nan,              np.nan),
+    ])
+    def test_lookup(self, lut, pb, z, std, offset):
+        std_pred, offset_pred = lut.lookup(pb, z)
+        np.testing.assert_allclose([std_pred, offset_pred], [std, offset], equal_nan=True)
+
+class Test_compile_confstats:
+
+    @pytest.fixture
+    def action(self, tmp_path):
+        #arrange
+        fn_out = str(tmp_path/"lut.npz")
+        rng = np.random.default_rng(0)
+        z  = rng.uniform(0, 1.2, 500)
+        pb = rng.choice(["g", "r", "i", "z", "Y"], 500)
+
+        #act
+        ConfStats.compile_confstats("./data/lut_snana_snia.csv", fn_out)
+        lut_npz = ConfStats.get_confstats(fn_out)
+        lut_csv = ConfStats.get_confstats("./data/lut_snana_snia.csv")
+        return lut_npz, lut_csv, pb, z
+
+    #assert
+    def test_mmap(self, action):
+        lut_npz, lut_csv, pb, z = action
+        assert all(isinstance(a, np.memmap) for a in lut_npz.tables["g"])
+
+    def test_lookup(self, action):
+        lut_npz, lut_csv, pb, z = action
+        np.testing.assert_array_equal(np.array(lut_npz.lookup(pb, z)), np.array(lut_csv.lookup(pb, z)))
@@ -0,0 +1,96 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Astronomy import Passbands
+
+import numpy as np
+import os
+import polars as pl
+import subprocess
+import sys
+import zipfile
+
+#%%tests
+class Test_get_passband_specs:
+
+    #assert
+    def test_bundled(self):
+        df = Passbands.get_passband_specs()
+        assert df.columns == ["name", "wavelength", "plot_color", "plot_marker", "plot_ls", "mission", "source"]
+        assert df.equals(Passbands.get_passband_specs())
+
+    def test_invalidated(self, tmp_path):
+        fn = tmp_path/"specs.csv"
+        fn.write_text("name,wavelength\na,1.0\n")
+        df1 = Passbands.get_passband_specs(str(fn))
+        fn.write_text("name,wavelength\na,1.0\nb,2.0\n")
+        df2 = Passbands.get_passband_specs(str(fn))
+        assert df1.height == 1
+        assert df2.height == 2
+
+    def test_private_copy(self):
+        df = Passbands.get_passband_specs()
+        df.insert_column(0, pl.Series("x", np.zeros(df.height)))
+        assert Passbands.get_passband_specs().columns[0] == "name"
+        assert ("LuStCodeSnippets_py.Astronomy", "data/passband_specs.csv") in Passbands._PASSBAND_SPECS_CACHE
+
+    def test_zipped(self, tmp_path):
+        root = os.path.join(os.path.dirname(__file__), "../..")
+        fn_zip = str(tmp_path/"pkg.zip")
+        with zipfile.ZipFile(fn_zip, "w") as z:
+            for d, _, files in os.walk(os.path.join(root, "LuStCodeSnippets_py")):
+                for f in files:
+                    if not f.endswith((".py", ".csv")): continue
+                    z.write(os.path.join(d, f), os.path.relpath(os.path.join(d, f), root))
+        res = subprocess.run(
+            [sys.executable, "-c", "from LuStCodeSnippets_py.Astronomy import Passbands; print(Passbands.__file__, Passbands.get_passband_specs().height)"],
+            capture_output=True, text=True, check=True, cwd=str(tmp_path),
+            env={**os.environ, "PYTHONPATH": fn_zip},
+        )
+        fn_module, height = res.stdout.split()
+        assert fn_module.startswith(fn_zip)
+        assert int(height) == Passbands.get_passband_specs().height
+
+class Test_PassbandEncoder:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        enc = Passbands.PassbandEncoder()
+        mission = np.array(["lsst", "lsst", "des", "ogle", "lsst"])
+        name    = np.array(["g", "Y", "DES g", "I", "X"])
+
+        #act
+        enc_np  = enc.encode(name, mission, rgba=True)
+        enc_pl  = enc.encode(pl.Series(name).cast(pl.Categorical), pl.Series(mission), rgba=True)
+        enc_one = enc.encode(pl.Series(["g", "r", "X"]), "lsst")
+        return enc_np, enc_pl, enc_one
+
+    #assert
+    def test_numpy(self, action):
+        enc_np, enc_pl, enc_one = action
+        np.testing.assert_array_equal(enc_np["wavelength"], [482.7, 971.2, 473.0, 810.0, np.nan])
+        np.testing.assert_array_equal(enc_np["plot_color"], ["#49be61", "#5d0000", "#49be61", "tab:red", ""])
+        assert enc_np["plot_color_rgba"].shape == (5, 4)
+
+    def test_polars(self, action):
+        enc_np, enc_pl, enc_one = action
+        assert enc_pl["wavelength"].to_list() == [482.7, 971.2, 473.0, 810.0, None]
+        np.testing.assert_array_equal(enc_pl["plot_color_rgba"].to_numpy()[:4], enc_np["plot_color_rgba"][:4])
+        assert enc_one["plot_marker"].to_list() == ["^", "v", None]
+
+    @pytest.mark.parametrize("dtype", [pl.Categorical, pl.Enum(["X", "I", "g", "DES g", "Y", "r"])])
+    def test_categorical(self, action, dtype):
+        enc = Passbands.PassbandEncoder()
+        mission = pl.Series(["lsst", "lsst", "des", "ogle", "lsst", None, "lsst"])
+        name    = pl.Series(["g", "Y", "DES g", "I", "X", "g", None])
+        expected_one = enc.indices(name, "lsst")
+        expected = enc.indices(name, mission)
+        assert expected_one.null_count() == 4
+        assert enc.indices(name.cast(dtype), "lsst").to_list() == expected_one.to_list()
+        assert enc.indices(name.cast(dtype), mission).to_list() == expected.to_list()
+        assert enc.indices(name.cast(dtype), mission.cast(pl.Categorical)).to_list() == expected.to_list()
+
+    def test_empty_specs(self, action):
+        with pytest.raises(ValueError):
+            Passbands.PassbandEncoder(Passbands.get_passband_specs().clear())
@@ -0,0 +1,69 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Astronomy import Absmag, SynPhot
+
+from astropy.cosmology import FlatLambdaCDM
+import numpy as np
+
+#%%tests
+class Test_SyntheticPhotometry:
+
+    @pytest.fixture
+    def action(self, tmp_path):
+        #arrange
+        wl_t = np.linspace(400, 600, 21)
+        fn_g = tmp_path/"g.dat"
+        fn_r = tmp_path/"r.csv"
+        np.savetxt(fn_g, np.column_stack([wl_t[::-1], np.exp(-((wl_t[::-1]-480)/40)**2)]), header="wavelength transmission")
+        np.savetxt(fn_r, np.column_stack([wl_t+150, np.exp(-((wl_t-470)/40)**2)]), delimiter=",")
+        files = dict(g=str(fn_g), r=str(fn_r))
+        wl = np.linspace(300, 900, 1201)
+
+        #flat in f_nu at the AB zeropoint => m=0 in every band
+        seds = np.array([1.0, 10**(-0.4*20)])[:,None]*SynPhot.FNU_AB*SynPhot.C_LIGHT["nm"]/wl**2
+
+        #act
+        synphot = SynPhot.get_synthetic_photometry(files, wl)
+        m_flam = synphot.magnitudes(seds)
+        m_fnu = synphot.magnitudes(np.full((1, len(wl)), SynPhot.FNU_AB), sed_unit="fnu")
+        m_resampled = synphot.magnitudes(seds[:,::2], wavelength=wl[::2])
+        return files, wl, synphot, seds, m_flam, m_fnu, m_resampled
+
+    #assert
+    def test_magnitudes(self, action):
+        files, wl, synphot, seds, m_flam, m_fnu, m_resampled = action
+        assert synphot.bands.tolist() == ["g", "r"]
+        assert m_flam.shape == (2, 2)
+        assert np.allclose(m_flam, [[0, 0], [20, 20]])
+        assert np.allclose(m_fnu, 0)
+        assert np.allclose(m_resampled, m_flam, atol=1e-4)
+
+    def test_vs_loop(self, action):
+        files, wl, synphot, seds, m_flam, m_fnu, m_resampled = action
+        rng = np.random.default_rng(0)
+        seds = rng.uniform(0.5, 2, (3, len(wl)))*1e-15
+        m = synphot.magnitudes(seds)
+        for i, sed in enumerate(seds):
+            for j, t in enumerate(synphot.transmission):
+                num = np.trapezoid(sed*t*wl, wl)
+                den = np.trapezoid(SynPhot.FNU_AB*SynPhot.C_LIGHT["nm"]/wl*t, wl)
+                assert np.isclose(m[i,j], -2.5*np.log10(num/den))
+
+    def test_effective_wavelengths(self, action):
+        files, wl, synphot, seds, m_flam, m_fnu, m_resampled = action
+        assert np.allclose(synphot.effective_wavelengths(), [480, 620], atol=1)
+
+    def test_cached(self, action):
+        files, wl, synphot, seds, m_flam, m_fnu, m_resampled = action
+        assert SynPhot.get_synthetic_photometry(files, wl) is synphot
+        assert SynPhot.get_synthetic_photometry(files, wl[::2]) is not synphot
+
+    def test_absmag(self, action):
+        files, wl, synphot, seds, m_flam, m_fnu, m_resampled = action
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        z = np.array([0.1, 0.5])
+        M, std, offset = synphot.absmag(seds, z, cosmo, distmod_grid=True)
+        assert M.shape == (2, 2)
+        assert np.allclose(M, m_flam - cosmo.distmod(z).value[:,None], atol=1e-6)
+        assert np.isnan(std).all()
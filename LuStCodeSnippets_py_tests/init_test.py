@@ -0,0 +1,57 @@
+
+#%%imports
+import pytest
+
+import json
+import os
+import subprocess
+import sys
+
+#%%helpers
+def _modules_after(code:str):
+    """
+        - runs `code` in a fresh interpreter and returns the names of all imported modules
+    """
+    root = os.path.join(os.path.dirname(__file__), "..")
+    res = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport json, sys; print(json.dumps(sorted(sys.modules)))"],
+        capture_output=True, text=True, check=True, cwd=root,
+        env={**os.environ, "PYTHONPATH": root},
+    )
+    return set(json.loads(res.stdout.splitlines()[-1]))
+
+#%%tests
+class Test_lazy_import:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        #act
+        modules_pkg = _modules_after("import LuStCodeSnippets_py")
+        modules_lazy = _modules_after("import LuStCodeSnippets_py as lust; lust.Astronomy.Absmag; lust.PlExtension.plNamespace")
+        modules_cli = _modules_after("from LuStCodeSnippets_py.Astronomy import AbsmagCLI")
+        return modules_pkg, modules_lazy, modules_cli
+
+    #assert
+    def test_package(self, action):
+        modules_pkg, modules_lazy, modules_cli = action
+        assert "LuStCodeSnippets_py.Astronomy" not in modules_pkg
+        assert not {"numpy", "polars", "matplotlib", "astropy"} & modules_pkg
+
+    def test_attribute_access(self, action):
+        modules_pkg, modules_lazy, modules_cli = action
+        assert {"LuStCodeSnippets_py.Astronomy.Absmag", "LuStCodeSnippets_py.PlExtension.plNamespace"} <= modules_lazy
+        assert "LuStCodeSnippets_py.Plots" not in modules_lazy
+
+    def test_no_astropy(self, action):
+        modules_pkg, modules_lazy, modules_cli = action
+        assert "astropy" not in modules_lazy
+        assert "astropy" not in modules_cli
+        assert "matplotlib" not in modules_cli
+
+    def test_unknown(self, action):
+        import LuStCodeSnippets_py as lust
+        with pytest.raises(AttributeError):
+            lust.NotASubpackage
+        assert "Plots" in dir(lust)
+        assert "GANTT" in dir(lust.Plots)
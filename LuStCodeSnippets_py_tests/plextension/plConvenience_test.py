@@ -0,0 +1,246 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.PlExtension import plConvenience
+
+import numpy as np
+import polars as pl
+
+#%%tests
+class Test_value_counts:
+
+    @pytest.fixture(params=[None, "frequency", "pdf"])
+    def action(self, request, tmp_path):
+        #arrange
+        df = pl.DataFrame(dict(
+            a=["x", "y", "x", "z", "x", "y"],
+            b=[1, 2, 1, 3, 2, 2],
+        ))
+        fn = tmp_path/"df.parquet"
+        df.write_parquet(fn)
+
+        #act
+        df_vc = plConvenience.value_counts(df, subset="a", normalize=request.param, descending=True)
+        lf_vc = plConvenience.value_counts(pl.scan_parquet(fn), subset="a", normalize=request.param, descending=True)
+        return request.param, df_vc, lf_vc
+
+    #assert
+    def test_types(self, action):
+        normalize, df_vc, lf_vc = action
+        assert isinstance(df_vc, pl.DataFrame)
+        assert isinstance(lf_vc, pl.LazyFrame)
+
+    def test_lazy_matches_eager(self, action):
+        normalize, df_vc, lf_vc = action
+        assert lf_vc.collect(engine="streaming").equals(df_vc)
+
+    def test_values(self, action):
+        normalize, df_vc, lf_vc = action
+        expected = dict(x=3, y=2, z=1)
+        norm = dict(frequency=3, pdf=6).get(normalize, 1)
+        assert df_vc["a"].to_list() == ["x", "y", "z"]
+        assert df_vc["count"].to_list() == [expected[k]/norm for k in ["x", "y", "z"]]
+
+    def test_all_columns(self, action):
+        df = pl.DataFrame(dict(a=[1, 1, 2], b=[3, 3, 3])).lazy()
+        df_vc = plConvenience.value_counts(df, sort=False).collect()
+        assert df_vc.to_dict(as_series=False) == dict(a=[1, 2], b=[3, 3], count=[2, 1])
+
+    def test_invalid_normalize(self, action):
+        with pytest.raises(ValueError):
+            plConvenience.value_counts(pl.DataFrame(dict(a=[1])).lazy(), normalize="cdf")
+
+class Test_value_counts_approx:
+
+    @pytest.fixture(params=["eager", "lazy"])
+    def action(self, request):
+        #arrange
+        rng = np.random.default_rng(0)
+        df = pl.DataFrame(dict(a=rng.zipf(1.5, 200_000), b=rng.integers(0, 2, 200_000)))
+        df_in = df if request.param == "eager" else df.lazy()
+
+        #act
+        df_ex = plConvenience.value_counts(df, subset=["a", "b"], descending=True)
+        df_ap = plConvenience.value_counts_approx(df_in, subset=["a", "b"], k=10, descending=True, batch_size=30_000)
+        df_pdf = plConvenience.value_counts_approx(df_in, subset="a", k=3, normalize="pdf", descending=True, batch_size=30_000)
+        n_unique = plConvenience.n_unique_approx(df_in, subset="a", batch_size=30_000)
+        return df, df_ex, df_ap, df_pdf, n_unique
+
+    #assert
+    def test_heavy_hitters(self, action):
+        df, df_ex, df_ap, df_pdf, n_unique = action
+        assert df_ap.columns == ["a", "b", "count"]
+        assert df_ap.height == 10
+        assert df_ap.select("a", "b").equals(df_ex.head(10).select("a", "b"))
+        assert (df_ap["count"] >= df_ex.head(10)["count"]).all()
+        assert (df_ap["count"] - df_ex.head(10)["count"]).max() <= np.e/2**18*df.height
+
+    def test_pdf(self, action):
+        df, df_ex, df_ap, df_pdf, n_unique = action
+        df_ex_pdf = plConvenience.value_counts(df, subset="a", normalize="pdf", descending=True).head(3)
+        assert np.allclose(df_pdf["count"].to_numpy(), df_ex_pdf["count"].to_numpy(), atol=1e-4)
+
+    def test_n_unique(self, action):
+        df, df_ex, df_ap, df_pdf, n_unique = action
+        assert abs(n_unique/df["a"].n_unique() - 1) < 5*1.04/2**7
+
+    def test_empty(self, action):
+        df_vc = plConvenience.value_counts_approx(pl.DataFrame(dict(a=[], b=[]), schema=dict(a=pl.Int64, b=pl.Int64)), subset="a")
+        assert df_vc.columns == ["a", "count"]
+        assert df_vc.height == 0
+
+class Test_n_unique_approx:
+
+    @pytest.fixture(params=[4, 5, 6, 7])
+    def action(self, request):
+        #arrange
+        df = pl.DataFrame(dict(a=np.arange(5_000)))
+
+        #act
+        n_unique = np.array([plConvenience.n_unique_approx(df, subset="a", precision=request.param, seed=seed) for seed in range(200)])
+        return request.param, n_unique
+
+    #assert
+    def test_alpha(self, action):
+        precision, n_unique = action
+        m = 2**precision
+        alpha = {4:0.673, 5:0.697, 6:0.709, 7:0.7213/(1 + 1.079/128)}[precision]
+        assert np.isclose(plConvenience._hll_estimate(np.ones(m, dtype=np.uint8)), alpha*2*m)
+
+    def test_unbiased(self, action):
+        precision, n_unique = action
+        assert abs(n_unique.mean()/5_000 - 1) < 3*1.04/np.sqrt(2**precision)/np.sqrt(len(n_unique))
+
+class Test_ValueCounter:
+
+    @pytest.fixture
+    def action(self, tmp_path):
+        #arrange
+        rng = np.random.default_rng(0)
+        batches = [pl.DataFrame(dict(a=rng.integers(0, 50, n), b=rng.choice(["x", "y"], n))) for n in rng.integers(1, 500, 40)]
+        fn = tmp_path/"vc.parquet"
+
+        #act
+        vc1 = plConvenience.ValueCounter(subset=["a", "b"])
+        vc2 = plConvenience.ValueCounter(subset=["a", "b"])
+        for b in batches[:25]: vc1.update(b)
+        for b in batches[25:]: vc2.update(b.lazy())
+        vc2.save(fn)
+        vc = plConvenience.ValueCounter.load(fn).merge(vc1)
+        return pl.concat(batches), vc1, vc
+
+    #assert
+    def test_runs_bounded(self, action):
+        df, vc1, vc = action
+        assert len(vc1._runs) <= 2*np.log2(25) + 1
+        assert all(r1.height >= r2.height/2 for r1, r2 in zip(vc1._runs[:-1], vc1._runs[1:]))
+
+    def test_matches_value_counts(self, action):
+        df, vc1, vc = action
+        assert vc.n_rows == df.height
+        for normalize in [None, "frequency", "pdf"]:
+            expected = plConvenience.value_counts(df, subset=["a", "b"], normalize=normalize, sort=False)
+            assert vc.to_frame(normalize=normalize, sort=False).equals(expected)
+
+    def test_mismatch(self, action):
+        df, vc1, vc = action
+        with pytest.raises(ValueError):
+            vc.merge(plConvenience.ValueCounter().update(df.select("a")))
+        with pytest.raises(ValueError):
+            plConvenience.ValueCounter().to_frame()
+
+class Test_value_counts_many:
+
+    @pytest.fixture(params=[1, 2])
+    def action(self, request, tmp_path):
+        #arrange
+        rng = np.random.default_rng(0)
+        dfs = [pl.DataFrame(dict(a=rng.integers(0, 20, 100), b=rng.choice(["x", "y"], 100))) for _ in range(19)]
+        paths = []
+        for i, df in enumerate(dfs):
+            paths.append(str(tmp_path/(f"part{i}.parquet" if i%2 else f"part{i}.csv")))
+            df.write_parquet(paths[-1]) if i%2 else df.write_csv(paths[-1])
+
+        #act
+        df_vc, df_timings = plConvenience.value_counts_many(paths, subset=["a", "b"], normalize="pdf", sort=False, workers=request.param, fanin=3)
+        return pl.concat(dfs), paths, df_vc, df_timings
+
+    #assert
+    def test_matches_value_counts(self, action):
+        df, paths, df_vc, df_timings = action
+        assert df_vc.equals(plConvenience.value_counts(df, subset=["a", "b"], normalize="pdf", sort=False))
+
+    def test_timings(self, action):
+        df, paths, df_vc, df_timings = action
+        assert df_timings["path"].to_list() == paths
+        assert df_timings["n_rows"].sum() == df.height
+        assert (df_timings["seconds"] > 0).all()
+
+class Test_hist2d:
+
+    @pytest.fixture(params=["eager", "lazy"])
+    def action(self, request):
+        #arrange
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=10_000)
+        y = rng.normal(size=10_000)
+        x[:3] = np.nan
+        x[3], y[3] = x[4:].max(), y[4:].max()   #upper edge
+        df = pl.DataFrame(dict(x=x, y=y))
+        df_in = df if request.param == "eager" else df.lazy()
+        edges = (np.sort(rng.uniform(-3, 3, 8)), np.linspace(-2, 2, 5))
+
+        #act
+        res_uniform = plConvenience.hist2d(df_in, "x", "y", bins=(20, 15))
+        res_edges = plConvenience.hist2d(df_in, "x", "y", bins=edges, normalize="pdf")
+        res_range = plConvenience.hist2d(df_in, "x", "y", bins=5, trange=((-1, 1), (-1, 1)), normalize="frequency")
+        return x[3:], y[3:], edges, res_uniform, res_edges, res_range
+
+    #assert
+    def test_uniform(self, action):
+        x, y, edges, (H, xedges, yedges), res_edges, res_range = action
+        H_np, xedges_np, yedges_np = np.histogram2d(x, y, bins=(20, 15))
+        assert H.shape == (15, 20)
+        assert np.array_equal(H, H_np.T)
+        assert np.allclose(xedges, xedges_np)
+        assert np.allclose(yedges, yedges_np)
+
+    def test_edges(self, action):
+        x, y, edges, res_uniform, (H, xedges, yedges), res_range = action
+        H_np = np.histogram2d(x, y, bins=edges)[0]
+        assert np.allclose(H, H_np.T/H_np.sum())
+        assert np.array_equal(xedges, edges[0])
+
+    def test_range(self, action):
+        x, y, edges, res_uniform, res_edges, (H, xedges, yedges) = action
+        H_np = np.histogram2d(x, y, bins=5, range=((-1, 1), (-1, 1)))[0]
+        assert np.allclose(H, H_np.T/H_np.max())
+
+class Test_hist2d_edges:
+
+    @pytest.fixture(params=["top", "ulp", "interior", "random"])
+    def action(self, request):
+        #arrange
+        rng = np.random.default_rng(1)
+        if request.param == "top":
+            x, bins = np.array([-4.500612641879238, 61.243031412665154, 61.243031412665154]), (6, 1)
+        elif request.param == "ulp":
+            x, bins = np.array([-4.500612641879238, 61.243031412665154, 61.24303141266515]), (6, 1)
+        elif request.param == "interior":
+            x, bins = np.concatenate([[0.0, 1.0], np.linspace(0, 1, 11), [0.3, 0.7]]), (10, 1)
+        else:
+            lohi = np.sort(rng.uniform(-100, 100, (200, 2)), axis=1)     #one histogram per range
+            x = np.concatenate([np.r_[lo, hi, np.nextafter(hi, -np.inf), np.linspace(lo, hi, 8)] for lo, hi in lohi])
+            bins = (7, 1)
+        xs = np.split(x, len(x)//11) if request.param == "random" else [x]
+
+        #act
+        res = [plConvenience.hist2d(pl.DataFrame(dict(x=xi, y=np.zeros_like(xi))), "x", "y", bins=bins)[0] for xi in xs]
+        res_np = [np.histogram2d(xi, np.zeros_like(xi), bins=bins)[0] for xi in xs]
+        return res, res_np
+
+    #assert
+    def test_same_as_numpy(self, action):
+        res, res_np = action
+        for H, H_np in zip(res, res_np):
+            assert np.array_equal(H, H_np.T)
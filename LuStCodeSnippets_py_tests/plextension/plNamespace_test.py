@@ -0,0 +1,40 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Astronomy import Absmag
+from LuStCodeSnippets_py.PlExtension import plNamespace
+
+from astropy.cosmology import FlatLambdaCDM
+import numpy as np
+import polars as pl
+
+#%%tests
+class Test_lust_absmag:
+
+    @pytest.fixture(params=["in-memory", "streaming"])
+    def action(self, request):
+        #arrange
+        cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
+        df = pl.DataFrame(dict(
+            m=[22.6803, 21.333, 24.031, 20.9328, 23.3801],
+            z=[0.36966, 0.29686, 0.89888, 0.26628, 0.65992],
+            band=["g", "Y", None, "r", "r"],
+        ))
+
+        #act
+        df_res = (df.lazy()
+            .with_columns(pl.col("m").lust.absmag(z="z", pb="band", cosmo=cosmo, lut="./data/lut_snana_snia.csv"))
+            .unnest("absmag")
+            .collect(engine=request.param)
+        )
+        res = Absmag.absmag(df["m"].to_numpy(), df["z"].to_numpy(), cosmo, df["band"].to_numpy(), "./data/lut_snana_snia.csv")
+        return df_res, res
+
+    #assert
+    def test_schema(self, action):
+        df_res, res = action
+        assert df_res.columns == ["m", "z", "band", "M", "std", "offset"]
+
+    def test_matches_absmag(self, action):
+        df_res, res = action
+        np.testing.assert_allclose(df_res.select("M", "std", "offset").to_numpy().T, np.array(res), equal_nan=True)
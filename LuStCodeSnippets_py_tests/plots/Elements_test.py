@@ -0,0 +1,117 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Plots import Elements
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import ResizeEvent
+import numpy as np
+
+#%%tests
+class Test_pcolormesh_text:
+
+    @pytest.fixture(params=[
+        None, dict(fontsize=6, rotation=30, ha="left", va="bottom"), dict(color="r", fontweight="bold"),
+        dict(bbox=dict(boxstyle="round", facecolor="w", alpha=0.5)),
+    ])
+    def action(self, request):
+        #arrange
+        X = np.random.default_rng(0).uniform(0, 10, (8, 6))
+        X[0,0] = np.nan
+
+        #act
+        imgs = []
+        for batched in [False, True]:
+            fig, ax = plt.subplots(figsize=(4, 4), dpi=80)
+            ax.pcolormesh(X)
+            res = Elements.pcolormesh_text(ax, X, text_kwargs=None if request.param is None else request.param.copy(), batched=batched)
+            fig.canvas.draw()
+            imgs.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+            n_texts = len(ax.texts)
+            plt.close(fig)
+        return res, n_texts, imgs
+
+    #assert
+    def test_single_artist(self, action):
+        res, n_texts, imgs = action
+        assert isinstance(res, Elements.TextCollection)
+        assert len(res.labels) == 48
+        assert n_texts == 0
+
+    def test_same_output(self, action):
+        res, n_texts, imgs = action
+        assert np.array_equal(imgs[0], imgs[1])
+
+class Test_TextCollection_fallback:
+
+    @pytest.fixture(params=[AttributeError, TypeError])
+    def action(self, request, monkeypatch):
+        #arrange
+        X = np.random.default_rng(0).uniform(0, 10, (8, 6))
+        X[0,0] = np.nan
+        def _get_layout(self, renderer, label):
+            raise request.param("private matplotlib internals changed")
+
+        #act
+        imgs = []
+        tcs = []
+        for batched in [False, True]:
+            if batched: monkeypatch.setattr(Elements.TextCollection, "_get_layout", _get_layout)
+            fig, ax = plt.subplots(figsize=(4, 4), dpi=80)
+            ax.pcolormesh(X)
+            tcs.append(Elements.pcolormesh_text(ax, X, batched=batched))
+            fig.canvas.draw()
+            fig.canvas.draw()
+            imgs.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+            plt.close(fig)
+        return tcs[1], imgs
+
+    #assert
+    def test_unbatched(self, action):
+        tc, imgs = action
+        assert tc._batched_draw is False
+
+    def test_same_output(self, action):
+        tc, imgs = action
+        assert np.array_equal(imgs[0], imgs[1])
+
+class Test_pcolormesh_text_lod:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        X = np.arange(200*300, dtype=np.float64).reshape(200, 300)
+        fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+        ax.pcolormesh(X)
+
+        #act
+        tc = Elements.pcolormesh_text(ax, X, lod=True, numformat="%.0f")
+        n_full = len(tc.labels)
+        ax.set_xlim(10, 20)
+        ax.set_ylim(50.2, 54.8)
+        yield fig, ax, X, tc, n_full
+        plt.close(fig)
+
+    #assert
+    def test_culled(self, action):
+        fig, ax, X, tc, n_full = action
+        assert n_full == 0
+        assert len(tc.labels) == 10*5
+        assert set(tc.labels) == {"%.0f"%X[i,j] for i in range(50, 55) for j in range(10, 20)}
+        assert np.all((tc.xy[:,0] > 10) & (tc.xy[:,0] < 20) & (tc.xy[:,1] > 50.2) & (tc.xy[:,1] < 54.8))
+
+    def test_resize(self, action):
+        fig, ax, X, tc, n_full = action
+        n_before = len(tc.labels)
+        fig.set_size_inches(0.5, 0.5)
+        fig.canvas.callbacks.process("resize_event", ResizeEvent("resize_event", fig.canvas))
+        assert n_before == 10*5
+        assert len(tc.labels) == 0
+
+    def test_disconnect(self, action):
+        fig, ax, X, tc, n_full = action
+        tc.lod_disconnect()
+        ax.set_xlim(0, 5)
+        assert len(tc.labels) == 10*5
@@ -0,0 +1,175 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Plots import GANTT, GANTTAnalytics
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+
+#%%fixtures
+@pytest.fixture
+def df_tasks():
+    rng = np.random.default_rng(0)
+    n = 400
+    start = rng.integers(0, 100, n).astype(np.float64)
+    return pl.DataFrame(dict(
+        task=rng.choice(["Task1", "Task2", "Task3", "Task4"], n),
+        start=start,
+        end=start + rng.integers(0, 10, n),     #includes zero-length tasks
+        category=rng.choice(["Category1", "Category2", "Category3"], n),
+    ))
+
+#%%tests
+class Test_prepare_gantt:
+
+    @pytest.fixture(params=["row", "task", "pack"])
+    def action(self, request, df_tasks):
+        #arrange
+        #act
+        df = GANTTAnalytics.prepare_gantt(df_tasks.drop("end").with_columns(duration=df_tasks["end"]-df_tasks["start"]), lanes=request.param)
+        return request.param, df_tasks, df
+
+    #assert
+    def test_columns(self, action):
+        lanes, df_tasks, df = action
+        assert df.columns == ["task", "start", "category", "duration", "end", "#"]
+        assert df["end"].equals(df_tasks["end"])
+
+    def test_lanes(self, action):
+        lanes, df_tasks, df = action
+        if lanes == "row":
+            assert df["#"].to_list() == list(range(df.height))
+        elif lanes == "task":
+            assert (df.group_by("task").agg(pl.col("#").n_unique())["#"] == 1).all()
+            assert df.group_by("#").agg(pl.col("start").min()).sort("#")["start"].is_sorted()
+        else:
+            s, e = df["start"].to_numpy(), df["end"].to_numpy()
+            assert (GANTTAnalytics.overlaps(df, by="#")[0] == 0).all()
+            max_conc = max(((s <= t) & (e > t)).sum() + ((s == t) & (e == t)).sum() for t in s)
+            assert df["#"].max() + 1 == max_conc
+
+    def test_invalid(self, action):
+        lanes, df_tasks, df = action
+        with pytest.raises(ValueError):
+            GANTTAnalytics.prepare_gantt(df_tasks, lanes="stack")
+        with pytest.raises(ValueError):
+            GANTTAnalytics.prepare_gantt(df_tasks.drop("end"))
+
+class Test_analytics:
+
+    @pytest.fixture
+    def action(self, df_tasks):
+        #arrange
+        s, e, c = df_tasks["start"].to_numpy(), df_tasks["end"].to_numpy(), df_tasks["category"].to_numpy()
+
+        #act
+        n_overlaps, df_overlaps = GANTTAnalytics.overlaps(df_tasks)
+        df_conc = GANTTAnalytics.concurrency(df_tasks)
+        U, edges, groups = GANTTAnalytics.utilization(df_tasks, bins=13, trange=(-5, 120))
+        return s, e, c, n_overlaps, df_overlaps, df_conc, U, edges, groups
+
+    #assert
+    def test_overlaps(self, action):
+        s, e, c, n_overlaps, df_overlaps, df_conc, U, edges, groups = action
+        expected = np.array([((s < e[i]) & (s[i] < e) & (c == c[i])).sum() - (s[i] < e[i]) for i in range(len(s))])
+        assert np.array_equal(n_overlaps.to_numpy(), expected)
+        assert df_overlaps["category"].to_list() == ["Category1", "Category2", "Category3"]
+        for cat, n_tasks, n_overlapping, n_pairs, busy, overlap in df_overlaps.iter_rows():
+            m = c == cat
+            assert n_tasks == m.sum()
+            assert n_overlapping == (expected[m] > 0).sum()
+            assert n_pairs == expected[m].sum()//2
+            grid = np.arange(0, 110, 0.5) + 0.25
+            conc = ((s[m][:,None] <= grid) & (e[m][:,None] > grid)).sum(axis=0)
+            assert np.isclose(busy, 0.5*(conc >= 1).sum())
+            assert np.isclose(overlap, 0.5*(conc >= 2).sum())
+
+    def test_concurrency(self, action):
+        s, e, c, n_overlaps, df_overlaps, df_conc, U, edges, groups = action
+        assert df_conc.columns == ["category", "time", "concurrency"]
+        for (cat, t, conc) in df_conc.sample(50, seed=0).iter_rows():
+            m = c == cat
+            assert conc == ((s[m] <= t) & (e[m] > t)).sum()
+        assert (df_conc.group_by("category").agg(pl.col("concurrency").last())["concurrency"] == 0).all()
+
+    def test_utilization(self, action):
+        s, e, c, n_overlaps, df_overlaps, df_conc, U, edges, groups = action
+        assert U.shape == (3, 13)
+        assert np.allclose(edges, np.linspace(-5, 120, 14))
+        grid = np.linspace(-5, 120, 13*1000 + 1)[:-1] + 125/13/2000
+        for i, cat in enumerate(groups):
+            m = c == cat
+            conc = ((s[m][:,None] <= grid) & (e[m][:,None] > grid)).sum(axis=0)
+            assert np.allclose(conc.reshape(13, -1).mean(axis=1), U[i], atol=5e-3)
+        assert np.isclose((U*np.diff(edges)).sum(), (e - s).sum())
+
+    def test_no_groups(self, action):
+        s, e, c, n_overlaps, df_overlaps, df_conc, U, edges, groups = action
+        df = pl.DataFrame(dict(start=s, end=e))
+        n_overlaps, df_overlaps = GANTTAnalytics.overlaps(df, by=None)
+        assert df_overlaps.columns == ["n_tasks", "n_overlapping", "n_pairs", "busy_time", "overlap_time"]
+        assert np.array_equal(n_overlaps.to_numpy(), [((s < e[i]) & (s[i] < e)).sum() - (s[i] < e[i]) for i in range(len(s))])
+        assert GANTTAnalytics.concurrency(df, by=None)["concurrency"].max() <= GANTTAnalytics.prepare_gantt(df, lanes="pack")["#"].max() + 1
+        assert np.allclose(GANTTAnalytics.utilization(df, bins=edges, by=None)[0], U.sum(axis=0))
+
+    def test_zero_length(self, action):
+        df = pl.DataFrame(dict(start=[3.0, 3.0], end=[3.0, 3.0], category=["Category1", "Category2"]))
+        with np.errstate(all="raise"):
+            U, edges, groups = GANTTAnalytics.utilization(df, bins=4)
+        assert np.allclose(edges, np.linspace(3, 4, 5))
+        assert np.array_equal(U, np.zeros((2, 4)))
+
+class Test_plots:
+
+    @pytest.fixture
+    def action(self, df_tasks):
+        #arrange
+        df_schedule = GANTTAnalytics.prepare_gantt(df_tasks.with_columns(
+            (pl.datetime(2025, 1, 1) + pl.duration(days=pl.col("start"))).alias("start"),
+            (pl.datetime(2025, 1, 1) + pl.duration(days=pl.col("end"))).alias("end"),
+        ))
+        fig, axs = plt.subplots(1, 3)
+
+        #act
+        GANTT.plot_gantt(df_schedule, ax=axs[0], vmin=0.2, fast=True)
+        GANTTAnalytics.plot_utilization(df_schedule, bins=20, ax=axs[1], vmin=0.2)
+        GANTTAnalytics.plot_concurrency(df_schedule, ax=axs[2], vmin=0.2)
+        fig.canvas.draw()
+        yield df_schedule, axs
+        plt.close(fig)
+
+    #assert
+    def test_colors(self, action):
+        df, axs = action
+        handles = [ax.get_legend_handles_labels() for ax in axs]
+        assert handles[0][1] == handles[1][1] == handles[2][1] == ["Category1", "Category2", "Category3"]
+        colors = [np.array([matplotlib.colors.to_rgba(h.get_facecolor() if i < 2 else h.get_color()) for h in hs]) for i, (hs, labels) in enumerate(handles)]
+        assert np.allclose(colors[0], colors[1])
+        assert np.allclose(colors[0], colors[2])
+
+    def test_dates(self, action):
+        df, axs = action
+        xlim = matplotlib.dates.date2num(np.array([df["start"].min(), df["end"].max()]))
+        assert np.allclose(axs[1].get_xlim(), xlim, atol=10)
+        assert np.allclose(axs[2].get_xlim(), xlim, atol=10)
+        assert np.isclose(axs[1].patches[0].get_data().edges[0], xlim[0])
+
+    def test_concurrency_trange(self, action, df_tasks):
+        df, axs = action
+        s, e, c = df_tasks["start"].to_numpy(), df_tasks["end"].to_numpy(), df_tasks["category"].to_numpy()
+        fig, ax = plt.subplots()
+        GANTTAnalytics.plot_concurrency(df_tasks, ax=ax, trange=(20.5, 60.5))
+        lines = ax.get_lines()
+        assert [l.get_label() for l in lines] == ["Category1", "Category2", "Category3"]
+        grid = np.linspace(20.5, 60.5, 200, endpoint=False)
+        for l in lines:
+            x, y = l.get_data()
+            m = c == l.get_label()
+            assert x[0] == 20.5 and x[-1] == 60.5
+            assert np.all((x >= 20.5) & (x <= 60.5))
+            expected = ((s[m][:,None] <= grid) & (e[m][:,None] > grid)).sum(axis=0)
+            assert np.array_equal(y[np.searchsorted(x, grid, side="right") - 1], expected)
+        plt.close(fig)
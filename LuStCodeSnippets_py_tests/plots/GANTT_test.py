@@ -0,0 +1,194 @@
+
+#%%imports
+import pytest
+from LuStCodeSnippets_py.Plots import GANTT
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+
+#%%fixtures
+@pytest.fixture
+def df_schedule():
+    df = pl.DataFrame(dict(
+        task=["Task1", "Task2", "Task1", "Task2", "Task3", "Task1"],
+        start=["2025-01-20", "2025-02-01", "2025-04-01", "2025-07-01", "2025-07-01", "2025-08-01"],
+        end=["2025-04-01", "2025-05-01", "2025-08-01", "2025-09-01", "2026-01-01", "2025-08-15"],
+        category=["Category1", "Category1", "Category2", "Category2", "Category2", "Category3"],
+    ))
+    return (df
+        .with_columns(
+            pl.lit(np.arange(df.height)).alias("#"),
+            pl.col("start").str.strptime(pl.Datetime),
+            pl.col("end").str.strptime(pl.Datetime),
+        )
+        .with_columns((pl.col("end")-pl.col("start")).alias("duration"))
+    )
+
+#%%tests
+class Test_plot_gantt_fast:
+
+    @pytest.fixture
+    def action(self, df_schedule):
+        #arrange
+        axs = []
+
+        #act
+        for fast in [False, True]:
+            fig, ax = plt.subplots()
+            GANTT.plot_gantt(df_schedule, ax=ax, vmin=0.2, fast=fast)
+            fig.canvas.draw()
+            axs.append(ax)
+        yield df_schedule, axs
+        plt.close("all")
+
+    #assert
+    def test_limits(self, action):
+        df, (ax_ref, ax_fast) = action
+        assert np.allclose(ax_ref.get_xlim(), ax_fast.get_xlim())
+        assert np.allclose(ax_ref.get_ylim(), ax_fast.get_ylim())
+
+    def test_single_collection(self, action):
+        df, (ax_ref, ax_fast) = action
+        assert len(ax_fast.collections) == 1
+        assert len(ax_fast.collections[0].get_paths()) == df.height
+
+    def test_colors(self, action):
+        df, (ax_ref, ax_fast) = action
+        colors_ref = np.array([p.get_facecolor() for p in ax_ref.patches])
+        colors_ref = colors_ref[np.argsort(df.with_row_index().sort("category", maintain_order=True)["index"].to_numpy())]
+        assert np.allclose(ax_fast.collections[0].get_facecolors(), colors_ref)
+
+    def test_legend(self, action):
+        df, (ax_ref, ax_fast) = action
+        assert [t.get_text() for t in ax_fast.get_legend().get_texts()] == ["Category1", "Category2", "Category3"]
+        assert ax_fast.get_legend_handles_labels()[1] == ["Category1", "Category2", "Category3"]
+
+    def test_ticklabels(self, action):
+        df, (ax_ref, ax_fast) = action
+        ticks = ax_fast.get_yticks()
+        labels = [t.get_text() for t in ax_fast.get_yticklabels()]
+        for t, l in zip(ticks, labels):
+            if 0 <= t < df.height: assert l == df["task"][int(t)]
+
+class Test_plot_gantt_lod:
+
+    @pytest.fixture
+    def action(self, df_schedule, tmp_path):
+        #arrange
+        fn = tmp_path/"schedule.parquet"
+        df_schedule.drop("task").write_parquet(fn)
+        fig, ax = plt.subplots(figsize=(4, 3), dpi=50)
+
+        #act
+        GANTT.plot_gantt(pl.scan_parquet(fn), ax=ax, vmin=0.2, lod=True)
+        fig.canvas.draw()
+        im = ax.images[0]
+        yield df_schedule, fig, ax, im
+        plt.close(fig)
+
+    #assert
+    def test_view(self, action):
+        df, fig, ax, im = action
+        assert im.get_array().shape[:2] == (int(np.ceil(ax.bbox.height)), int(np.ceil(ax.bbox.width)))
+        assert np.allclose(ax.get_ylim(), (-0.45, df.height - 1 + 0.45))
+        assert ax.get_legend_handles_labels()[1] == ["Category1", "Category2", "Category3"]
+
+    def test_aggregate(self, action):
+        df, fig, ax, im = action
+        rng = np.random.default_rng(0)
+        n = 200
+        s = rng.uniform(0, 10, n)
+        e = s + rng.uniform(0, 3, n)
+        y = rng.integers(0, 50, n).astype(np.float64)
+        c = rng.integers(0, 3, n)
+        im.lf = pl.LazyFrame(dict(__y=y, __s=s, __e=e, __c=c))
+        occupancy = im.aggregate((2.0, 9.0), (5.0, 35.0), (17, 23))
+
+        #brute force
+        expected = np.zeros_like(occupancy)
+        for yi, si, ei, ci in zip(y, s, e, c):
+            if ei < 2 or si > 9 or yi + 0.45 < 5 or yi - 0.45 > 35: continue
+            r0, r1 = np.clip([np.floor((yi-0.45-5)/30*17), np.floor((yi+0.45-5)/30*17)+1], 0, 17).astype(int)
+            b0, b1 = np.clip([np.floor((si-2)/7*23), np.floor((ei-2)/7*23)+1], 0, 23).astype(int)
+            expected[ci,r0:r1,b0:b1] += 1
+        assert np.array_equal(occupancy, expected)
+
+    def test_reaggregate(self, action):
+        df, fig, ax, im = action
+        full = im.occupancy.sum()
+        ax.set_ylim(-0.45, 0.45)
+        fig.canvas.draw()
+        assert im.get_extent()[2:] == [-0.45, 0.45]
+        assert set(np.unique(im.occupancy.sum(axis=0))) <= {0, 1}
+        assert im.occupancy.sum() < full
+
+    def test_no_side_effects(self, action):
+        df, fig, ax, im = action
+        datalim = ax.dataLim.frozen()
+        sticky = (list(im.sticky_edges.x), list(im.sticky_edges.y))
+        ax.set_xlim(ax.get_xlim()[0], np.mean(ax.get_xlim()))
+        ax.set_ylim(2.5, 7.5)
+        fig.canvas.draw()
+        assert np.allclose(ax.dataLim.get_points(), datalim.get_points())
+        assert (list(im.sticky_edges.x), list(im.sticky_edges.y)) == sticky
+        assert np.allclose(sticky[1], (-0.45, df.height - 1 + 0.45))
+        ax.set_autoscale_on(True)
+        ax.autoscale_view()
+        assert np.allclose(ax.get_ylim(), (-0.45, df.height - 1 + 0.45))
+
+class Test_GanttView:
+
+    @pytest.fixture
+    def action(self, df_schedule):
+        #arrange
+        fig, ax = plt.subplots()
+        gv = GANTT.GanttView(df_schedule.head(4), ax=ax, categories=["Category1", "Category2", "Category3"], chunksize=2)
+        fig.canvas.draw()
+        before = np.asarray(fig.canvas.buffer_rgba()).copy()
+        paths = gv._chunks[0].get_paths()
+
+        #act
+        changed = df_schedule.slice(1, 4).with_columns(pl.col("duration")/2, pl.lit("Category3").alias("category"))
+        gv.update(changed)
+        blitted = np.asarray(fig.canvas.buffer_rgba()).copy()
+        fig.canvas.draw()
+        redrawn = np.asarray(fig.canvas.buffer_rgba()).copy()
+        yield df_schedule, gv, paths, before, blitted, redrawn
+        plt.close(fig)
+
+    #assert
+    def test_blit_matches_redraw(self, action):
+        df, gv, paths, before, blitted, redrawn = action
+        assert not np.array_equal(before, blitted)
+        assert np.array_equal(blitted, redrawn)
+
+    def test_in_place(self, action):
+        df, gv, paths, before, blitted, redrawn = action
+        assert gv.n_tasks == 5
+        assert len(gv._chunks) == 3
+        assert gv._chunks[0].get_paths() is paths
+        assert np.allclose(paths[1].vertices[2,0] - paths[1].vertices[0,0], df["duration"][1].total_seconds()/86400/2)
+        assert np.allclose(gv._chunks[1].get_facecolor(), gv.colors[2])
+
+    def test_labels(self, action):
+        df, gv, paths, before, blitted, redrawn = action
+        assert gv.ax.get_legend_handles_labels()[1] == ["Category1", "Category2", "Category3"]
+        assert [t.get_text() for t in gv.ax.get_yticklabels() if t.get_text()] == df["task"].head(5).to_list()
+
+    def test_invalid_category(self, action):
+        df, gv, paths, before, blitted, redrawn = action
+        with pytest.raises(ValueError):
+            gv.update(df.with_columns(pl.lit("Category4").alias("category")))
+
+    def test_savefig(self, action, tmp_path):
+        df, gv, paths, before, blitted, redrawn = action
+        gv.savefig(tmp_path/"gantt.png")
+        saved = plt.imread(tmp_path/"gantt.png")
+        differs = np.abs(saved - redrawn/255).max(axis=-1) > 1/255
+        assert saved.shape[:2] == redrawn.shape[:2]
+        assert differs.mean() < 0.05       #only gridlines/legend drawn on top of the bars
+        assert (np.abs(saved - gv.colors[2]).max(axis=-1) < 1/255).sum() > 100
+        assert gv._chunks[0].get_animated()
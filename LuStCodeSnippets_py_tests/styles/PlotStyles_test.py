@@ -0,0 +1,91 @@
+
+#%%imports
+import pytest
+
+import json
+import os
+import subprocess
+import sys
+
+#%%helpers
+def _run(code:str):
+    """
+        - runs `code` in a fresh interpreter (styles modify global `rcParams`) and returns its last line of output as json
+    """
+    root = os.path.join(os.path.dirname(__file__), "../..")
+    res = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=root,
+        env={**os.environ, "PYTHONPATH": root, "MPLBACKEND": "Agg"},
+    )
+    return json.loads(res.stdout.splitlines()[-1])
+
+#%%tests
+class Test_register_cmaps:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        code = (
+            "import json, sys\n"
+            "import matplotlib as mpl\n"
+            "from LuStCodeSnippets_py.Styles import PlotStyles\n"
+            "before = 'fink' in mpl.colormaps\n"
+            "pyplot = 'matplotlib.pyplot' in sys.modules\n"
+            "PlotStyles.fink_dark()\n"
+            "print(json.dumps(dict(before=before, pyplot=pyplot, after=['fink' in mpl.colormaps, 'fink_r' in mpl.colormaps], cmap=mpl.rcParams['image.cmap'])))\n"
+        )
+
+        #act
+        res = _run(code)
+        return res
+
+    #assert
+    def test_deferred(self, action):
+        res = action
+        assert not res["before"]
+        assert not res["pyplot"]
+
+    def test_registered_on_use(self, action):
+        res = action
+        assert res["after"] == [True, True]
+        assert res["cmap"] == "fink_r"
+
+class Test_public_cmaps:
+
+    @pytest.fixture
+    def action(self):
+        #arrange
+        code = (
+            "import json\n"
+            "import matplotlib as mpl\n"
+            "from LuStCodeSnippets_py.Styles import PlotStyles\n"
+            "before = 'fink' in mpl.colormaps\n"
+            "fink_colors = PlotStyles.fink_colors\n"
+            "from LuStCodeSnippets_py.Styles.PlotStyles import cmap\n"
+            "print(json.dumps(dict(\n"
+            "    before=before, fink_colors=fink_colors,\n"
+            "    names=[cmap.name, PlotStyles.cmap_r.name], same=cmap is PlotStyles.cmap,\n"
+            "    registered=['fink' in mpl.colormaps, 'fink_r' in mpl.colormaps],\n"
+            "    colors=[cmap(0.0), mpl.colormaps['fink_r'](1.0)],\n"
+            "    missing=not hasattr(PlotStyles, 'cmap_rr'),\n"
+            ")))\n"
+        )
+
+        #act
+        res = _run(code)
+        return res
+
+    #assert
+    def test_fink_colors(self, action):
+        res = action
+        assert not res["before"]
+        assert [c for _, c in res["fink_colors"]] == ["#15284F", "#D5D5D3", "#F5622E"]
+
+    def test_cmaps(self, action):
+        res = action
+        assert res["names"] == ["fink", "fink_r"]
+        assert res["same"]
+        assert res["registered"] == [True, True]
+        assert res["colors"][0] == res["colors"][1]
+        assert res["missing"]